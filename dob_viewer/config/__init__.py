@@ -27,6 +27,7 @@ from nark.config import ConfigRoot
 
 __all__ = (
     'DobConfigurableDev',
+    'DobConfigurableEditor',
 )
 
 
@@ -49,3 +50,139 @@ class DobConfigurableDev(object):
     def allow_mash_quit(self):
         return False
 
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("If True, times each Carousel key action, split by store, Facts,"
+          " view and draw time."),
+        hidden=True,
+    )
+    def profile_actions(self):
+        return False
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("If set (and profile_actions), where to write key action timings"
+          " as JSON on exit."),
+        hidden=True,
+    )
+    def profile_actions_path(self):
+        return ''
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("If True, prints a summary of the Carousel's store calls on exit."),
+        hidden=True,
+    )
+    def report_store_calls(self):
+        return False
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("Logs a warning for Carousel store calls slower than this (msecs.)."
+          " Set 0 to disable."),
+        hidden=True,
+    )
+    def slow_store_call_msecs(self):
+        return 250
+
+
+# ***
+
+@ConfigRoot.section('editor')
+class DobConfigurableEditor(object):
+    """"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("Prefill interval gaps on load when importing at least this many Facts"
+          " (0 to disable)"),
+    )
+    def gap_prefill_threshold(self):
+        # (lb): Below a few thousand Facts, filling gaps lazily, as the user
+        # traverses the Carousel, is imperceptible. Above that, one sorted
+        # sweep on load beats allocating gaps (and undo entries) on each step.
+        return 1000
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("How many Facts to load around the target of a date jump"
+          " (0 to load just the nearest Fact)"),
+    )
+    def jump_window_size(self):
+        return 50
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("How many Facts to preload on either side of the current Fact"
+          " while idle (0 to disable)"),
+    )
+    def prefetch_neighbours(self):
+        return 5
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("How many recently viewed Facts' rendered views to cache"
+          " (0 to disable)"),
+    )
+    def view_cache_size(self):
+        return 64
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("Most times per second to redraw the Carousel; lower it for SSH"
+          " or slow terminals (0 to redraw on every change)"),
+    )
+    def max_fps(self):
+        return 30
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("Most Facts to keep loaded; clean Facts far from the current Fact"
+          " are dropped, and reloaded from the store as needed (0 for no limit)"),
+    )
+    def max_loaded_facts(self):
+        return 10000
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("If True, renders just the visible rows of the Fact description,"
+          " which keeps scrolling very long descriptions quick"),
+    )
+    def virtual_content(self):
+        return False
+
+    # ***
+
+    @property
+    @ConfigRoot.setting(
+        _("When Facts are streamed into the Carousel, e.g., from a large import,"
+          " how many to add at a time (jumping forward past those added so far,"
+          " e.g., to the final Fact, adds the rest all at once)"),
+    )
+    def stream_batch_size(self):
+        return 1000
@@ -190,6 +190,16 @@ class DobViewerConfigEditorKeys(object):
 
     # ***
 
+    @property
+    @ConfigRoot.setting(
+        _("Show key action timings (if dev.profile_actions)"),
+    )
+    def dev_profile_overlay(self):
+        # I.e., 'm-+', aka, <Alt++>.
+        return json.dumps([('escape', '+')])
+
+    # ***
+
     @property
     @ConfigRoot.setting(
         _("XXX"),
@@ -17,11 +17,6 @@
 
 """Facts Carousel"""
 
-from prompt_toolkit.formatted_text import merge_formatted_text
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.keys import Keys
-from prompt_toolkit.shortcuts import PromptSession
-
 __all__ = (
     'confirm',
     # Private:
@@ -35,6 +30,13 @@ def create_confirm_session(message, suffix=' (y/n) ', allow_mash_quit=False, **k
     """
     Create a `PromptSession` object for the 'confirm' function.
     """
+    # Lazy-load PTK, so that importing confirm() costs next to nothing
+    # (and so commands that never prompt never pay for PTK).
+    from prompt_toolkit.formatted_text import merge_formatted_text
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.keys import Keys
+    from prompt_toolkit.shortcuts import PromptSession
+
     assert isinstance(message, str)
     bindings = KeyBindings()
 
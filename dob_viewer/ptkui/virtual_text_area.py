@@ -0,0 +1,142 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""A read-only text area that renders just its visible rows."""
+
+from prompt_toolkit.data_structures import Point
+from prompt_toolkit.document import Document
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.controls import UIContent, UIControl
+
+__all__ = (
+    'VirtualTextArea',
+    # Private:
+    #  'VirtualContentControl',
+)
+
+
+class VirtualContentControl(UIControl):
+    """Renders rows fetched on demand from a line-indexed view.
+
+    The view is any object with a ``row_count``, and a ``row(row_num)``
+    method that returns that one row of text, e.g., a DescriptionView.
+
+    Unlike a BufferControl, there's no Document of the whole text, so
+    the cost of rendering (and of moving the cursor) does not grow with
+    the length of the text, just with the height of the window.
+    """
+
+    def __init__(self, lexer=None):
+        self.lexer = lexer
+        self.view = None
+        self.cursor_row = 0
+
+    def is_focusable(self):
+        return True
+
+    @property
+    def row_count(self):
+        if self.view is None:
+            return 0
+        return self.view.row_count
+
+    def clamp_cursor(self):
+        self.cursor_row = max(0, min(self.cursor_row, self.row_count - 1))
+
+    def create_content(self, width, height):
+        self.clamp_cursor()
+
+        def get_line(row_num):
+            return self.style_row(self.view.row(row_num))
+
+        return UIContent(
+            get_line=get_line,
+            line_count=self.row_count,
+            cursor_position=Point(x=0, y=self.cursor_row),
+            show_cursor=True,
+        )
+
+    def style_row(self, row):
+        if self.lexer is None:
+            return [('', row)]
+        # (lb): Lex each row on its own, which works for line-by-line lexers,
+        # like the ones in various_lexers, but maybe not for all of Pygments.
+        return self.lexer.lex_document(Document(row))(0)
+
+    # The Window calls these when scrolled, e.g., by mouse wheel, to keep
+    # the cursor within view.
+
+    def move_cursor_down(self):
+        self.cursor_row += 1
+        self.clamp_cursor()
+
+    def move_cursor_up(self):
+        self.cursor_row -= 1
+        self.clamp_cursor()
+
+
+class VirtualTextArea(object):
+    """A read-only stand-in for TextArea, for showing very long text.
+
+    Call ``set_view`` with a line-indexed view of the text, rather than
+    setting the text. The cursor only moves by rows, and always sits in
+    the first column.
+    """
+
+    def __init__(self, width=None, height=None, lexer=None, style=''):
+        self.control = VirtualContentControl(lexer=lexer)
+        self.window = Window(
+            content=self.control,
+            width=width,
+            height=height,
+            style=style,
+            # The view wraps the text (or not), so the Window does not.
+            wrap_lines=False,
+        )
+
+    def __pt_container__(self):
+        return self.window
+
+    # ***
+
+    @property
+    def view(self):
+        return self.control.view
+
+    def set_view(self, view):
+        # Like setting a Buffer's text, keep the cursor where it is, if it fits.
+        self.control.view = view
+        self.control.clamp_cursor()
+
+    @property
+    def cursor_row(self):
+        return self.control.cursor_row
+
+    def cursor_up(self, count=1):
+        self.control.cursor_row -= count
+        self.control.clamp_cursor()
+
+    def cursor_down(self, count=1):
+        self.control.cursor_row += count
+        self.control.clamp_cursor()
+
+    def cursor_top(self):
+        self.control.cursor_row = 0
+
+    def cursor_bottom(self):
+        self.control.cursor_row = self.control.row_count - 1
+        self.control.clamp_cursor()
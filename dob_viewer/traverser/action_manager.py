@@ -17,6 +17,9 @@
 
 """Key Binding Action Manager"""
 
+from gettext import gettext as _
+
+from nark.helpers.dev.profiling import profile_elapsed
 from prompt_toolkit.application.application import _CombinedRegistry
 from prompt_toolkit.key_binding.key_processor import KeyProcessor
 
@@ -49,6 +52,64 @@ class ActionManager(object):
 
     # ***
 
+    # Only the normal bindings are needed to show the first frame. The others
+    # are built the first time they're wired, or right after the first frame
+    # renders (whichever comes first), so they stay off the startup path.
+    DEFERRED_KEY_BINDINGS = (
+        'edit_time',
+        'modal',
+        'commando',
+        'delta_time',
+    )
+
+    def deferred_key_bindings(self, which):
+        try:
+            return self._deferred_key_bindings[which]
+        except KeyError:
+            setup_bindings = getattr(self, 'setup_key_bindings_{}'.format(which))
+            key_bindings = setup_bindings()
+            self._deferred_key_bindings[which] = key_bindings
+            self.report_deferred_warnings()
+            return key_bindings
+
+    @property
+    def key_bindings_edit_time(self):
+        return self.deferred_key_bindings('edit_time')
+
+    @property
+    def key_bindings_modal(self):
+        return self.deferred_key_bindings('modal')
+
+    @property
+    def key_bindings_commando(self):
+        return self.deferred_key_bindings('commando')
+
+    @property
+    def key_bindings_delta_time(self):
+        return self.deferred_key_bindings('delta_time')
+
+    def setup_deferred_key_bindings_after_render(self, application):
+        application.after_render -= self.setup_deferred_key_bindings_after_render
+        profile_elapsed('To dob first frame')
+        # Let the renderer finish flushing before we tie up the loop.
+        self.carousel.event_loop.call_soon(self.setup_deferred_key_bindings)
+
+    def setup_deferred_key_bindings(self):
+        for which in self.DEFERRED_KEY_BINDINGS:
+            self.deferred_key_bindings(which)
+
+    def report_deferred_warnings(self):
+        # finalize_standup already printed whatever warnings it had, and the
+        # Carousel owns the terminal now, so use the status line instead.
+        if not self.key_bonder.errors:
+            return
+        self.carousel.zone_manager.update_status(
+            _('Key binding error(s): {}').format(' / '.join(self.key_bonder.errors))
+        )
+        self.key_bonder.errors = []
+
+    # ***
+
     def _wire_keys(self, key_bindings):
         application = self.carousel.zone_manager.application
         previous_bindings = application.key_bindings
@@ -58,9 +119,17 @@ class ActionManager(object):
         # notice because I wasn't throwing key combos at the time widgets); or
         # it might be that PTK 3.0 changes now demand it. Rebuild the key_processor,
         # otherwise the key_bindings just wired have no effect.
-        application.key_processor = KeyProcessor(_CombinedRegistry(application))
+        self.renew_key_processor(application)
         return previous_bindings
 
+    def renew_key_processor(self, application):
+        application.key_processor = KeyProcessor(_CombinedRegistry(application))
+        # Any keypress preempts the idle prefetch. This is the only place the
+        # hook is attached, as each new key_processor replaces the last one.
+        application.key_processor.before_key_press += (
+            self.carousel.zone_manager.cancel_idle_prefetch
+        )
+
     def wire_keys_command_mode(self, key_bindings):
         # Set focus to something without an input control. Otherwise, if we leave
         # focus on time widget, the _CombinedRegistry will add keybindings for it!
@@ -116,10 +185,7 @@ class ActionManager(object):
     def setup_key_bindings(self):
         self.setup_key_bindings_shared()
         self.setup_key_bindings_normal()
-        self.setup_key_bindings_edit_time()
-        self.setup_key_bindings_modal()
-        self.setup_key_bindings_commando()
-        self.setup_key_bindings_delta_time()
+        self._deferred_key_bindings = {}
 
     def setup_key_bindings_shared(self):
         bindings = []
@@ -151,23 +217,23 @@ class ActionManager(object):
         bindings += self.key_bonder.undo_redo(self.key_action_map, 'edit_time')
         bindings += self.key_bindings_shared
 
-        self.key_bindings_edit_time = self.key_bonder.make_bindings(bindings)
+        return self.key_bonder.make_bindings(bindings)
 
     def setup_key_bindings_modal(self):
         bindings = []
         # None. Modal has its own for the basics.
         # SKIP: bindings += self.key_bindings_shared
-        self.key_bindings_modal = self.key_bonder.make_bindings(bindings)
+        return self.key_bonder.make_bindings(bindings)
 
     def setup_key_bindings_commando(self):
         bindings = []
         bindings += self.key_bonder.going_commando(self.key_action_map)
         # SKIP: bindings += self.key_bindings_shared
-        self.key_bindings_commando = self.key_bonder.make_bindings(bindings)
+        return self.key_bonder.make_bindings(bindings)
 
     def setup_key_bindings_delta_time(self):
         bindings = []
         bindings += self.key_bonder.going_delta_time(self.key_action_map)
         # SKIP: bindings += self.key_bindings_shared
-        self.key_bindings_delta_time = self.key_bonder.make_bindings(bindings)
+        return self.key_bonder.make_bindings(bindings)
 
@@ -0,0 +1,269 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Facts Carousel Key Action Profiler"""
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from gettext import gettext as _
+
+__all__ = (
+    'ActionProfiler',
+)
+
+
+class ActionProfiler(object):
+    """Times each key action, split by where the time went.
+
+    The time is charged to whichever phase is innermost when it's spent:
+    'store' is SQL execution, 'view' is the diff and zone rebuilding,
+    'draw' is PTK rendering the frame that follows, and 'facts' is the
+    rest of the action, i.e., EditsManager and FactsManager work.
+
+    Only enabled if ``dev.profile_actions`` is set, otherwise every hook
+    is a cheap no-op.
+    """
+
+    PHASES = ('facts', 'store', 'view', 'draw')
+
+    # How many of the most recent samples to keep for each action.
+    SAMPLE_LIMIT = 1000
+
+    # Histogram bucket upper bounds, in msecs.
+    HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self, carousel):
+        self.carousel = carousel
+        self.enabled = carousel.controller.config['dev.profile_actions']
+        # Rolling samples, by action name, each a dict of secs by phase.
+        self.samples = {}
+        # The sample for the action being timed, and its phase stack.
+        self.sample = None
+        self.phases = []
+        self.marked = None
+        # The most recent sample that has not been drawn yet.
+        self.undrawn = None
+        self.draw_began = None
+        self.listening = False
+
+    # ***
+
+    @contextmanager
+    def action(self, name):
+        """Times the key action, e.g., `with profiler.action('undo_command'):`."""
+        # Replayed actions (see StoreLoader) may run within another action.
+        if not self.enabled or self.sample is not None:
+            yield
+            return
+        self.listen_store()
+        self.sample = dict.fromkeys(ActionProfiler.PHASES, 0.0)
+        self.phases = ['facts']
+        self.marked = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.charge()
+            self.samples.setdefault(
+                name, deque(maxlen=ActionProfiler.SAMPLE_LIMIT),
+            ).append(self.sample)
+            self.undrawn = self.sample
+            self.sample = None
+            self.phases = []
+
+    def charge_action(self, work):
+        """Wraps work so its time counts against the current action.
+
+        E.g., StoreLoader runs store-bound work after the action returns.
+        """
+        sample = self.sample
+        if sample is None:
+            return work
+
+        def charged_work(*args, **kwargs):
+            if self.sample is not None:
+                return work(*args, **kwargs)
+            self.sample = sample
+            self.phases = ['facts']
+            self.marked = time.perf_counter()
+            try:
+                return work(*args, **kwargs)
+            finally:
+                self.charge()
+                # Let the frame drawn after the deferred work count, too.
+                self.undrawn = self.sample
+                self.sample = None
+                self.phases = []
+
+        return charged_work
+
+    @contextmanager
+    def phase(self, name):
+        """Charges the time spent within to the named phase."""
+        self.phase_enter(name)
+        try:
+            yield
+        finally:
+            self.phase_leave()
+
+    def phase_enter(self, name):
+        if self.sample is None:
+            return
+        self.charge()
+        self.phases.append(name)
+
+    def phase_leave(self):
+        if self.sample is None or len(self.phases) < 2:
+            return
+        self.charge()
+        self.phases.pop()
+
+    def charge(self):
+        now = time.perf_counter()
+        self.sample[self.phases[-1]] += now - self.marked
+        self.marked = now
+
+    # ***
+
+    def listen_store(self):
+        if self.listening:
+            return
+        # Lazy-load, as SQLAlchemy is only needed if profiling.
+        from sqlalchemy import event
+
+        engine = self.carousel.controller.store.session.get_bind()
+        event.listen(engine, 'before_cursor_execute', self.before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self.after_cursor_execute)
+        self.listening = True
+
+    def unlisten_store(self):
+        if not self.listening:
+            return
+        from sqlalchemy import event
+
+        engine = self.carousel.controller.store.session.get_bind()
+        event.remove(engine, 'before_cursor_execute', self.before_cursor_execute)
+        event.remove(engine, 'after_cursor_execute', self.after_cursor_execute)
+        self.listening = False
+
+    def before_cursor_execute(self, *args, **kwargs):
+        self.phase_enter('store')
+
+    def after_cursor_execute(self, *args, **kwargs):
+        self.phase_leave()
+
+    # ***
+
+    def watch_application(self, application):
+        """Charges each frame's draw time to the action drawn therein."""
+        if not self.enabled:
+            return
+        application.before_render += self.before_render
+        application.after_render += self.after_render
+
+    def before_render(self, application):
+        self.draw_began = time.perf_counter()
+
+    def after_render(self, application):
+        # If the user outpaced the renderer, the latest action gets the
+        # draw time, and the actions it was drawn with get none.
+        if self.undrawn is None or self.draw_began is None:
+            return
+        self.undrawn['draw'] += time.perf_counter() - self.draw_began
+        self.undrawn = None
+
+    # ***
+
+    def summarize(self):
+        """Returns per-action stats (in msecs.), slowest action first."""
+        def _summarize():
+            summary = [
+                summarize_action(name, samples)
+                for name, samples in self.samples.items()
+            ]
+            summary.sort(key=lambda stats: stats['total']['p90'], reverse=True)
+            return summary
+
+        def summarize_action(name, samples):
+            totals = sorted(sum(sample.values()) * 1000 for sample in samples)
+            stats = {
+                'action': name,
+                'count': len(totals),
+                'total': {
+                    'p50': percentile(totals, 50),
+                    'p90': percentile(totals, 90),
+                    'max': totals[-1],
+                },
+                'histogram': histogram(totals),
+            }
+            # The mean msecs. spent in each phase.
+            for phase in ActionProfiler.PHASES:
+                phase_secs = sum(sample[phase] for sample in samples)
+                stats[phase] = phase_secs * 1000 / len(totals)
+            return stats
+
+        def percentile(ordered, point):
+            return ordered[max(0, -(-point * len(ordered) // 100) - 1)]
+
+        def histogram(totals):
+            counts = [0] * (len(ActionProfiler.HISTOGRAM_BUCKETS) + 1)
+            for total in totals:
+                bucket = 0
+                while (
+                    bucket < len(ActionProfiler.HISTOGRAM_BUCKETS)
+                    and total > ActionProfiler.HISTOGRAM_BUCKETS[bucket]
+                ):
+                    bucket += 1
+                counts[bucket] += 1
+            labels = ['≤{}'.format(bound) for bound in ActionProfiler.HISTOGRAM_BUCKETS]
+            labels.append('>{}'.format(ActionProfiler.HISTOGRAM_BUCKETS[-1]))
+            return dict(zip(labels, counts))
+
+        return _summarize()
+
+    def format_summary(self):
+        """Returns the summary as a plain text table, e.g., for an overlay."""
+        summary = self.summarize()
+        if not summary:
+            return _('No key actions timed yet.')
+        columns = ('count', 'p50', 'p90', 'max') + ActionProfiler.PHASES
+        name_width = max(len(stats['action']) for stats in summary)
+        lines = ['{}  {}'.format(
+            _('action (msecs.)').ljust(name_width),
+            ' '.join(column.rjust(7) for column in columns),
+        )]
+        for stats in summary:
+            values = [stats['count']]
+            values += [stats['total'][point] for point in ('p50', 'p90', 'max')]
+            values += [stats[phase] for phase in ActionProfiler.PHASES]
+            lines.append('{}  {:>7} {}'.format(
+                stats['action'].ljust(name_width),
+                values[0],
+                ' '.join('{:>7.1f}'.format(value) for value in values[1:]),
+            ))
+        return '\n'.join(lines)
+
+    def dump(self):
+        """Writes the summary as JSON to ``dev.profile_actions_path``, if set."""
+        self.unlisten_store()
+        path = self.carousel.controller.config['dev.profile_actions_path']
+        if not self.enabled or not path or not self.samples:
+            return
+        with open(path, 'w') as json_file:
+            json.dump(self.summarize(), json_file, indent=2, ensure_ascii=False)
@@ -20,7 +20,6 @@
 from gettext import gettext as _
 
 import asyncio
-import time
 
 import click_hotoffthehamster as click
 
@@ -28,19 +27,21 @@ from inflector import English, Inflector
 
 from nark.helpers.dev.profiling import profile_elapsed
 
+from dob_bright.styling.load_ignore import load_no_completion
 from dob_bright.styling.style_conf import color as styling_color
 from dob_bright.styling.style_engine import StyleEngine
 from dob_bright.termio.errors import dob_been_warned_reset
 
-from dob_prompt.prompters.triple_prompter import ask_user_for_edits
-
 from dob_viewer.ptkui.re_confirm import confirm
 
 from ..ptkui.dialog_overlay import show_message
 
 from .action_manager import ActionManager
+from .action_profiler import ActionProfiler
 from .edits_manager import EditsManager
 from .exceptions import catch_action_exception
+from .store_counter import StoreCounter
+from .store_loader import StoreLoader
 from .update_handler import UpdateHandler
 from .zone_content import ZoneContent
 from .zone_manager import ZoneManager
@@ -75,9 +76,12 @@ class Carousel(object):
         self.dry = dry
         self.content_lexer = content_lexer
         self.setup_styling(style_classes, rules_confobj)
-        self.no_completion = no_completion
+        self._no_completion = no_completion
         self.action_manager = ActionManager(self)
+        self.action_profiler = ActionProfiler(self)
+        self.store_counter = StoreCounter(controller)
         self.update_handler = UpdateHandler(self)
+        self.store_loader = StoreLoader(self)
         # We'll set up the ZoneManager each time we use the event_loop.
         self.zone_manager = None
         self._avail_width = None
@@ -172,7 +176,14 @@ class Carousel(object):
         if self.async_enable:
             # Get the OS thread's event loop.
             self.event_loop = asyncio.get_event_loop()
-        confirmed_facts = self.run_edit_loop(**kwargs)
+        self.store_counter.install()
+        try:
+            confirmed_facts = self.run_edit_loop(**kwargs)
+        finally:
+            self.store_counter.uninstall()
+        self.action_profiler.dump()
+        if self.controller.config['dev.report_store_calls']:
+            click.echo(self.store_counter.format_summary())
 
         # (lb): We did not start the event loop, so we should not stop it, e.g.,:
         #     self.async_enable and self.event_loop and self.event_loop.stop()
@@ -269,15 +280,10 @@ class Carousel(object):
                     self.enduring_edit = True  # Keep looping.
             elif not self.enduring_edit:
                 confirmed_facts = True  # All done; user looked at all Facts.
-
-            # CPR_ISSUE: An ever-so-brief pause after editing, before returning
-            # to the Carousel, apparently precludes the Cursor Position Request
-            # problem (which is documented in a comment in runloop_async).
-            # 2019-01-27: (lb): I added this sleep before I added standup_always.
-            #   MAYBE/2019-01-27: (lb): TEST: Determine if this sleep still
-            #   necessary. Or just leave it, it's painless.
-            if self.enduring_edit:
-                time.sleep(0.01)
+            # CPR_ISSUE: (lb): There used to be a brief time.sleep() here, which
+            # I added before standup_always, to preclude the Cursor Position
+            # Request problem. But the rerun kludge covers that case (see
+            # check_enduring_edit_or_rerun), so transitions need not wait.
 
         return confirmed_facts
 
@@ -309,8 +315,8 @@ class Carousel(object):
             # Ye olde Ctrl-c, and not an Exception.
             self.enduring_edit = False
             self.confirm_exit = True
-        else:
-            self.zone_manager.rebuild_containers()
+        # The next runloop rebuilds the view (whether it reuses the
+        # Application or builds a new one), so no need to do so here.
         return used_prompt
 
     def user_prompt_edit_fact(self, used_prompt):
@@ -321,6 +327,10 @@ class Carousel(object):
         return used_prompt
 
     def prompt_user(self, edit_fact, used_prompt):
+        # Lazy-load the prompter, which is slow to import, and which the
+        # user might never open.
+        from dob_prompt.prompters.triple_prompter import ask_user_for_edits
+
         used_prompt = ask_user_for_edits(
             self.controller,
             edit_fact,
@@ -331,27 +341,51 @@ class Carousel(object):
         )
         return used_prompt
 
+    @property
+    def no_completion(self):
+        # Load lazily, as the prompter is not needed to show the first frame.
+        if self._no_completion is None:
+            self._no_completion = load_no_completion(self.controller)
+        return self._no_completion
+
     # ***
 
     def standup_once(self):
         self.edits_manager.stand_up()
 
     def standup_always(self, **kwargs):
-        self.managers_standup()
-        return self.check_nak_if_errors_or_build_and_show(**kwargs)
+        # Reuse the Application and its zones from the previous runloop, if
+        # possible, so that returning from the prompter is nearly instant.
+        reuse = self.zone_manager is not None and self.zone_manager.reusable
+        if reuse:
+            self.managers_rebind()
+        else:
+            self.managers_standup()
+        return self.check_nak_if_errors_or_build_and_show(reuse, **kwargs)
 
     def managers_standup(self):
+        # Any load queued against the previous Application will never render.
+        self.store_loader.reset()
         self.zone_manager = ZoneManager(self)
         self.zone_manager.standup()
         self.action_manager.standup()
         self.update_handler.standup()
         self.action_manager.finalize_standup()
+        profile_elapsed('To dob standup')
+
+    def managers_rebind(self):
+        # Any load queued during the previous run will never render.
+        self.store_loader.reset()
+        profile_elapsed('To dob rebind')
 
-    def check_nak_if_errors_or_build_and_show(self, **kwargs):
+    def check_nak_if_errors_or_build_and_show(self, reuse=False, **kwargs):
         # Linger for errors, with basic config, style config, key binding,
         # etc., otherwise Carousel overwrites screen and user won't see them.
         if self.pause_on_error_message_maybe():
-            self.zone_manager.build_and_show(**kwargs)
+            if reuse:
+                self.zone_manager.reshow()
+            else:
+                self.zone_manager.build_and_show(**kwargs)
             return True
         return False
 
@@ -388,14 +422,19 @@ class Carousel(object):
         # True or False).
         self.enduring_edit = None
         self.restrict_edit = ''
+        # Run the Carousel (and any CPR_ISSUE reruns) as one coroutine, so
+        # there's just the one trip into the event loop per Carousel visit.
+        self.event_loop.run_until_complete(self.runloop_async(**kwargs))
+
+    async def runloop_async(self, **kwargs):
         rerun_cnt = 0
         keep_running = True
         # MAGIC_NUMBER: CPR_ISSUE: Do not rerun > once, lest stuck in feedback loop.
         while keep_running and rerun_cnt < 2:
-            keep_running = self.runloop_run(**kwargs)
+            keep_running = await self.runloop_run(**kwargs)
             rerun_cnt += 1
 
-    def runloop_run(self, **kwargs):
+    async def runloop_run(self, **kwargs):
         profile_elapsed('To dob runloop')
 
         # CPR_ISSUE: (lb): 2019-01-27: This might be the Ultimate Fix, by which
@@ -405,15 +444,35 @@ class Carousel(object):
         if not self.standup_always(**kwargs):
             return False
 
-        if self.async_enable:
-            rerun = self.runloop_async()
-            return rerun
-        else:
-            assert False  # 2020-02-01: Dead path now because always async.
-            self.zone_manager.application.run()
-            return False
+        await self.run_application()
+
+        return self.check_enduring_edit_or_rerun()
+
+    async def run_application(self):
+        # 2020-03-31: (lb): In earlier PTK, calling run_async() would draw the
+        # app, but not run its event loop (so some Carousel code would run).
+        # But now, this is truly async and nothing is invoked, just a coroutine
+        # is returned.
+        app_task = self.event_loop.create_task(
+            self.zone_manager.application.run_async(),
+        )
+
+        # Create the tick-tock task.
+        # MAYBE/2020-01-30: See (new?) in PTK3: create_background_task.
+        # - Maybe have PTK3 manage tick-tock, not us. (This works fine, though).
+        tck_task = self.event_loop.create_task(self.tick_tock_now())
 
-    def runloop_async(self):
+        # Run the Carousel! (Use wait(), not await, so that an unexpected
+        # Application error ends the run, and check_enduring_edit_or_rerun
+        # decides what's next, rather than raising through the edit loop.)
+        await asyncio.wait([app_task, ])
+
+        tck_task.cancel()
+        # (lb): In past, we've seen a warning if this is skipped:
+        #   RuntimeWarning: coroutine 'wait' was never    awaited
+        await asyncio.wait([tck_task, ])
+
+    def check_enduring_edit_or_rerun(self):
         # CPR_ISSUE: (lb): A Funky Business upon Rerunning Carousel.
         #
         # After the user edits the description, or the act@gory, or tags, the
@@ -436,23 +495,6 @@ class Carousel(object):
         # like falling into an infinite feedback loop. Just be careful!)
         rerun = False
 
-        # 2020-03-31: (lb): In earlier PTK, calling run_async() would draw the
-        # app, but not run its event loop (so some Carousel code would run).
-        # But now, this is truly async and nothing is invoked, just a coroutine
-        # is returned.
-        run_async = self.zone_manager.application.run_async()
-
-        # Create the tick-tock task.
-        # MAYBE/2020-01-30: See (new?) in PTK3: create_background_task.
-        # - Maybe have PTK3 manage tick-tock, not us. (This works fine, though).
-        tck_task = self.event_loop.create_task(self.tick_tock_now())
-
-        # Leave tck_task out of tasks and manage separately.
-        tasks = [run_async, ]
-
-        # Run the Carousel!
-        self.event_loop.run_until_complete(asyncio.wait(tasks))
-
         # Check if the Carousel exited deliberately or not.
         if self.enduring_edit is None:
             # CPR_ISSUE: (lb): Look in PPT for ask_for_cpr: this sends the CPR:
@@ -470,12 +512,6 @@ class Carousel(object):
             self.controller.client_logger.warning('KLUDGE! Re-running Carousel.')
             rerun = True
 
-        tck_task.cancel()
-        # Similar to `await tck_task`, but this method not async function, so
-        # go through the event loop. -In past, (lb)'s seen warning if skipped:
-        #   RuntimeWarning: coroutine 'wait' was never    awaited
-        self.event_loop.run_until_complete(asyncio.wait([tck_task, ]))
-
         return rerun
 
     # ***
@@ -623,6 +659,18 @@ class Carousel(object):
             return
         self.pdb_set_trace(event)
 
+    def dev_profile_overlay(self, event):
+        if not self.action_profiler.enabled:
+            self.zone_manager.update_status(
+                _('Please enable ‘dev.profile_actions’ to time key actions.')
+            )
+            return
+        show_message(
+            self.zone_manager.root,
+            _('Key action timings'),
+            self.action_profiler.format_summary(),
+        )
+
     def pdb_set_trace(self, event):
         import pdb
         # Just some convenience variables for the developer.
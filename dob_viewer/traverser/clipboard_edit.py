@@ -19,6 +19,8 @@
 
 from gettext import gettext as _
 
+from .fact_version import bump_fact_version
+
 __all__ = (
     'ClipboardEdit',
 )
@@ -69,6 +71,7 @@ class ClipboardEdit(object):
             self.controller.affirm(len(self.clipboard) == 1)
             for paste_what, paste_val in self.clipboard.items():
                 pasted_what = paste_copied_what(edit_fact, paste_what, paste_val)
+            bump_fact_version(edit_fact)
             return pasted_what
 
         def paste_copied_what(edit_fact, paste_what, paste_val):
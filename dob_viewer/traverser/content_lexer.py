@@ -21,16 +21,15 @@ from gettext import gettext as _
 
 import inspect
 
-import pygments.lexers
-from prompt_toolkit.lexers import Lexer, PygmentsLexer
+from prompt_toolkit.lexers import Lexer, PygmentsLexer, SimpleLexer
 
 from dob_bright.styling import load_obj_from_internal
-from dob_bright.termio import dob_in_user_warning
 
 from ..ptkui import various_lexers
 
 __all__ = (
     'load_content_lexer',
+    'LazyPygmentsLexer',
 )
 
 
@@ -83,12 +82,46 @@ def load_content_lexer(controller):
         # (lb): I'm a reSTie, personally, so we default to that.
         # (Though really the default is set in config/__init__.py.)
         lexer_name = named_lexer or 'RstLexer'
+        return LazyPygmentsLexer(controller, lexer_name)
+
+    return _load_content_lexer()
+
+
+# ***
+
+class LazyPygmentsLexer(Lexer):
+    """Defers loading Pygments, which is slow to import, until first render.
+
+    The default lexer is a Pygments lexer, so building it when the
+    Carousel is set up would make every user pay for the import before
+    the first frame is drawn. Instead, the PygmentsLexer is built the
+    first time the content area asks for it.
+    """
+
+    def __init__(self, controller, lexer_name):
+        self.controller = controller
+        self.lexer_name = lexer_name
+        self._lexer = None
+
+    @property
+    def lexer(self):
+        if self._lexer is None:
+            self._lexer = self.load_pygments_lexer()
+        return self._lexer
+
+    def load_pygments_lexer(self):
+        import pygments.lexers
         try:
-            return PygmentsLexer(getattr(pygments.lexers, lexer_name))
+            return PygmentsLexer(getattr(pygments.lexers, self.lexer_name))
         except AttributeError:
-            msg = _('Not a recognized Pygments lexer: “{0}”').format(lexer_name)
-            dob_in_user_warning(msg)
-            return None
+            # The Carousel is already running, so log the warning, rather
+            # than echo it over the display, and show plain text instead.
+            msg = _('Not a recognized Pygments lexer: “{0}”').format(self.lexer_name)
+            self.controller.client_logger.warning(msg)
+            return SimpleLexer()
 
-    return _load_content_lexer()
+    def lex_document(self, document):
+        return self.lexer.lex_document(document)
 
+    def invalidation_hash(self):
+        return self.lexer.invalidation_hash()
@@ -0,0 +1,178 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Line-indexed, read-only view of a Fact description."""
+
+import re
+from array import array
+
+__all__ = (
+    'DescriptionView',
+)
+
+
+# (lb): The same line boundaries as str.splitlines(), which the content
+# area used to split descriptions, so that \r\n counts as one line break.
+LINE_BREAK_RE = re.compile('\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+# But most descriptions only use newlines, which are quicker to find alone.
+NEWLINE_RE = re.compile('\n')
+OTHER_BREAKS = '\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+class DescriptionView(object):
+    """A line-indexed view of one description, wrapped to one width.
+
+    The view holds on to the one description string it's given, and it
+    never splits it. Instead, it indexes the offsets at which each line,
+    or each wrapped row, starts and ends. Callers can fetch any one row,
+    or a window of rows, by slicing just those rows from the description.
+
+    Indices are computed on first use and cached, so keep the same view
+    around for as long as the description (and the width) is unchanged.
+    """
+
+    def __init__(self, text, width=None):
+        self.text = text or ''
+        # The wrap width, or None not to wrap.
+        self.width = width
+        self._line_starts = None
+        self._line_ends = None
+        self._row_starts = None
+        self._row_ends = None
+        self._wrapped_text = None
+
+    def matches(self, text, width=None):
+        """Returns True if the view is of this very description and width."""
+        # Compare identity, not value, which is O(1), and which is enough
+        # for staged copies of a Fact, which share the same description.
+        return self.text is (text or '') and self.width == width
+
+    # ***
+
+    @property
+    def line_count(self):
+        self.index_lines()
+        return len(self._line_starts)
+
+    def line(self, line_num):
+        """Returns the one (unwrapped) line, without its line break."""
+        self.index_lines()
+        return self.text[self._line_starts[line_num]:self._line_ends[line_num]]
+
+    def index_lines(self):
+        if self._line_starts is not None:
+            return
+        # (lb): Use unsigned long longs, which take 8 bytes per offset, rather
+        # than a list of ints, which take 8 bytes per pointer plus each int.
+        line_break_re = NEWLINE_RE
+        if any(other_break in self.text for other_break in OTHER_BREAKS):
+            line_break_re = LINE_BREAK_RE
+        breaks = [match.span() for match in line_break_re.finditer(self.text)]
+        starts = array('Q', [0])
+        starts.extend(break_end for _break_start, break_end in breaks)
+        ends = array('Q', (break_start for break_start, _break_end in breaks))
+        # Like splitlines(), a trailing line break does not make a new line.
+        if starts[-1] < len(self.text):
+            ends.append(len(self.text))
+        else:
+            starts.pop()
+        self._line_starts = starts
+        self._line_ends = ends
+
+    # ***
+
+    @property
+    def row_count(self):
+        self.index_rows()
+        return len(self._row_starts)
+
+    def row(self, row_num):
+        """Returns the one display row, i.e., a line, or a piece of a wrapped line."""
+        self.index_rows()
+        return self.text[self._row_starts[row_num]:self._row_ends[row_num]]
+
+    def rows(self, first_row, num_rows):
+        """Returns the display rows in the window starting at first_row."""
+        self.index_rows()
+        last_row = min(first_row + num_rows, len(self._row_starts))
+        return [self.row(row_num) for row_num in range(max(first_row, 0), last_row)]
+
+    def index_rows(self):
+        """"""
+        def _index_rows():
+            if self._row_starts is not None:
+                return
+            self.index_lines()
+            if not self.width:
+                self._row_starts = self._line_starts
+                self._row_ends = self._line_ends
+                return
+            self._row_starts = array('Q')
+            self._row_ends = array('Q')
+            width = self.width
+            for start, end in zip(self._line_starts, self._line_ends):
+                if (end - start) <= width:
+                    add_row(start, end)
+                else:
+                    wrap_line(start, end)
+
+        def wrap_line(start, end):
+            # Split on the last space before the width (but not a leading
+            # space), and drop that space; or, if there's no such space,
+            # split the word at the width. This is the same split rule as
+            # the wrapper this replaced, except that wrapper also dropped
+            # the character at a mid-word split, which this one keeps.
+            width = self.width
+            while True:
+                if (end - start) <= width:
+                    add_row(start, end)
+                    break
+                space_idx = self.text.rfind(' ', start + 1, start + width)
+                if space_idx < 0:
+                    add_row(start, start + width)
+                    start += width
+                else:
+                    add_row(start, space_idx)
+                    start = space_idx + 1
+
+        def add_row(start, end):
+            self._row_starts.append(start)
+            self._row_ends.append(end)
+
+        _index_rows()
+
+    # ***
+
+    @property
+    def wrapped_text(self):
+        """Returns the description, wrapped, as one string.
+
+        If not wrapping, this is the description itself, not a copy.
+        """
+        if not self.width:
+            return self.text
+        if self._wrapped_text is None:
+            self.index_rows()
+            text = self.text
+            rows = [
+                text[start:end] for start, end in zip(self._row_starts, self._row_ends)
+            ]
+            # Like the original wrapper, end every row with a newline.
+            rows.append('')
+            self._wrapped_text = '\n'.join(rows)
+        return self._wrapped_text
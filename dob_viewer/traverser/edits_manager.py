@@ -17,12 +17,17 @@
 
 """Fact Editing State Machine"""
 
+from itertools import islice
+
 from dob_bright.crud.fact_from_factoid import must_create_fact_from_factoid
 
 from .clipboard_edit import ClipboardEdit
+from .fact_interner import FactInterner
+from .fact_version import bump_fact_version, same_facts
 from .facts_manager import FactsManager
 from .group_chained import sorted_facts_list
 from .redo_undo_edit import RedoUndoEdit
+from .staged_fact import staged_copy
 from .start_end_edit import StartEndEdit
 
 __all__ = (
@@ -41,6 +46,8 @@ class EditsManager(object):
         error_callback=None,
     ):
         self.controller = controller
+        # Shared by each FactsManager, which is rebuilt on save.
+        self.interner = FactInterner()
         self.setup_editing(edit_facts, orig_facts)
         self._dirty_callback = dirty_callback
         self.error_callback = error_callback
@@ -49,21 +56,25 @@ class EditsManager(object):
 
     def setup_editing(self, edit_facts, orig_facts):
         """"""
+        edit_facts = self.setup_fact_stream(edit_facts)
         self.setup_container(edit_facts, orig_facts)
         self.setup_edit_facts(edit_facts)
         self.setup_review_confirmation()
         self.setup_edit_help()
+        if not self.streaming:
+            self.setup_gap_prefill(len(edit_facts))
 
     # ***
 
     def setup_container(self, edit_facts, orig_facts):
         def _setup_container():
-            orig_lkup = orig_facts_lookup(orig_facts)
-            apply_orig_facts(edit_facts, orig_lkup)
+            self.orig_lkup = orig_facts_lookup(orig_facts)
+            self.apply_orig_facts(edit_facts)
             self.conjoined = FactsManager(
                 self.controller,
                 on_jumped_fact=self.jumped_fact,
                 on_insert_fact=self.insert_fact,
+                interner=self.interner,
             )
             self.add_facts(edit_facts)
 
@@ -73,9 +84,13 @@ class EditsManager(object):
                 orig_lkup = {fact.pk: fact for fact in orig_lkup}
             return orig_lkup
 
-        def apply_orig_facts(edit_facts, orig_lkup):
+        _setup_container()
+
+    def apply_orig_facts(self, edit_facts):
+        """"""
+        def _apply_orig_facts():
             for edit_fact in edit_facts:
-                apply_orig_fact(edit_fact, orig_lkup)
+                apply_orig_fact(edit_fact, self.orig_lkup)
 
         def apply_orig_fact(edit_fact, orig_lkup):
             self.controller.affirm(edit_fact.orig_fact is None)
@@ -106,7 +121,7 @@ class EditsManager(object):
             self.controller.affirm(edit_fact.orig_fact.orig_fact is None)
             edit_fact.orig_fact.orig_fact = 0
 
-        _setup_container()
+        _apply_orig_facts()
 
     def add_facts(self, more_facts):
         for fact in more_facts:
@@ -148,6 +163,93 @@ class EditsManager(object):
 
     # ***
 
+    def setup_gap_prefill(self, fact_count):
+        # For large imports, wire the Facts and fill the interval gaps in one
+        # sweep now, rather than one Fact at a time as the user traverses.
+        # - Note this runs after setup_review_confirmation, so that gap facts
+        #   are not added to the set of Facts the user must review.
+        threshold = self.controller.config['editor.gap_prefill_threshold']
+        if not threshold or fact_count < threshold:
+            return
+        self.conjoined.fill_interior_gaps()
+
+    # ***
+
+    def setup_fact_stream(self, edit_facts):
+        """Reads just the first batch of Facts, if edit_facts is not a list.
+
+        Given an iterator (e.g., of Facts being parsed from a large import),
+        the Carousel shows the first batch straightaway, and the ZoneManager
+        adds the rest, a batch at a time, while the user is idle.
+        """
+        self.fact_stream = None
+        self.stream_tail = None
+        self.streamed_count = 0
+        if (edit_facts is None) or isinstance(edit_facts, (list, tuple)):
+            return edit_facts
+        self.fact_stream = iter(edit_facts)
+        first_facts = self.read_fact_stream()
+        self.stream_tail = first_facts[-1] if first_facts else None
+        return first_facts
+
+    def read_fact_stream(self):
+        batch_size = max(1, self.controller.config['editor.stream_batch_size'])
+        more_facts = list(islice(self.fact_stream, batch_size))
+        if len(more_facts) < batch_size:
+            self.fact_stream = None
+        self.streamed_count += len(more_facts)
+        return more_facts
+
+    @property
+    def streaming(self):
+        """True until the last Fact arrives from the stream."""
+        return self.fact_stream is not None
+
+    def stream_more_facts(self):
+        """Adds the next batch of Facts from the stream; returns True if more remain."""
+        if not self.streaming:
+            return False
+        more_facts = self.read_fact_stream()
+        if more_facts:
+            self.add_streamed_facts(more_facts)
+        if not self.streaming:
+            self.finish_fact_stream()
+        return self.streaming
+
+    def add_streamed_facts(self, more_facts):
+        # Same as setup_editing does for the first batch (apply_orig_facts
+        # sets each orig_fact), except extend the group of the first batch.
+        self.apply_orig_facts(more_facts)
+        self.conjoined.append_facts(more_facts, self.stream_tail)
+        self.stream_tail = more_facts[-1]
+        self.edit_facts.update({fact.pk: fact for fact in more_facts if fact.dirty})
+        self.verify_fact_pks.update(fact.pk for fact in more_facts)
+
+    def finish_fact_stream(self):
+        # Now that we know how many Facts there are.
+        self.setup_gap_prefill(self.streamed_count)
+        if self.conjoined.time_rifts:
+            # Move the final rift, which marks the final Fact, if stood up.
+            self.conjoined.place_time_rifts()
+
+    def drain_fact_stream(self, until_time=None):
+        """Adds the rest of the streamed Facts, e.g., before leaving those loaded.
+
+        If until_time is set, stops once a streamed Fact starts after it. The
+        stream is in time order, so the Facts yet to arrive all start later.
+        """
+        while self.streaming and not self.stream_reaches(until_time):
+            self.stream_more_facts()
+
+    def stream_reaches(self, until_time):
+        return (
+            (until_time is not None)
+            and (self.stream_tail is not None)
+            and (self.stream_tail.start > until_time)
+        )
+
+    # ***
+
     def dirty_callback(self):
         if self._dirty_callback is None:
             return
@@ -174,8 +276,8 @@ class EditsManager(object):
         self.conjoined.curr_fact = curr_fact
         self.viewed_fact_pks.add(curr_fact.pk)
 
-    def insert_fact(self, gap_fact):
-        self.redo_undo.update_undo_altered([gap_fact], append=True)
+    def insert_fact(self, *gap_facts):
+        self.redo_undo.update_undo_altered(list(gap_facts), append=True)
 
     def jumped_fact(self, jump_fact):
         # Jump to shim to the setter.
@@ -183,6 +285,9 @@ class EditsManager(object):
 
     @property
     def user_viewed_all_new_facts(self):
+        if self.streaming:
+            # The user has not seen the Facts that have not arrived.
+            return False
         return self.verify_fact_pks.issubset(self.viewed_fact_pks)
 
     @property
@@ -220,11 +325,14 @@ class EditsManager(object):
         """
         Returns list of edited and new facts to persist (to database, export file, etc.).
         """
+        self.drain_fact_stream()
         prepared_facts_from_edit = sorted_facts_list(self.edit_facts.values())
         prepared_facts_from_view = [
             fact for fact in self.conjoined.facts if fact.dirty
         ]
-        self.controller.affirm(prepared_facts_from_edit == prepared_facts_from_view)
+        self.controller.affirm(
+            same_facts(prepared_facts_from_edit, prepared_facts_from_view),
+        )
         return prepared_facts_from_edit
 
     # ***
@@ -240,7 +348,7 @@ class EditsManager(object):
             # object alive).)
             if not edit_fact.orig_fact:
                 self.controller.affirm(edit_fact.orig_fact == 0)
-                edit_fact = edit_fact.copy()
+                edit_fact = staged_copy(edit_fact)
             elif edit_fact is self.curr_fact:
                 # (lb): The FactsManager fact-groups are wired with the latest
                 # edit of the Fact, so if the user wants to edit a Fact again, be
@@ -254,10 +362,10 @@ class EditsManager(object):
                 # Fact, we need to be able to identify it. Hence, we cannot have
                 # other code inadvertently mucking with a Fact once it's been
                 # added to the group-fact container. So return a copy.)
-                edit_fact = edit_fact.copy()
+                edit_fact = staged_copy(edit_fact)
         except KeyError:
             # Use the latest version of the fact, not orig_fact.
-            edit_fact = self.curr_fact.copy()
+            edit_fact = staged_copy(self.curr_fact)
             self.controller.affirm(
                 (edit_fact.orig_fact is self.curr_fact)
                 or (edit_fact.orig_fact is self.curr_fact.orig_fact)
@@ -273,7 +381,7 @@ class EditsManager(object):
         # which might pop the Fact if the user did not edit anything.
         if edit_fact is None:
             edit_fact = self.editable_fact()
-        was_fact = edit_fact.copy()
+        was_fact = staged_copy(edit_fact)
         self.add_undoable([was_fact], what)
         # Caller is responsible for calling this class' apply_edits later.
         return edit_fact
@@ -320,6 +428,7 @@ class EditsManager(object):
             is_oldest_fact = idx == 0
             self.manage_edited_dirty_deleted(edit_fact, undelete=is_oldest_fact)
             self.manage_edited_edit_facts(edit_fact)
+            bump_fact_version(edit_fact)
 
     def manage_edited_dirty_deleted(self, edit_fact, undelete=False):
         edit_fact.dirty_reasons.add('unsaved-fact')
@@ -471,10 +580,11 @@ class EditsManager(object):
         edit_fact.activity = restore_fact.activity
         edit_fact.tags = restore_fact.tags
         edit_fact.description = restore_fact.description
+        bump_fact_version(edit_fact)
         self.controller.affirm(edit_fact.orig_fact)
 
         # Start a new undo (sets UndoRedoTuple.pristine with copy of edit_fact).
-        self.redo_undo.add_undoable([edit_fact.copy()], before_paste.what)
+        self.redo_undo.add_undoable([staged_copy(edit_fact)], before_paste.what)
         # EditManager.paste_copied_meta calls its apply_edits after
         # calling this method, which ensures UndoRedoTuple.altered is set.
 
@@ -534,6 +644,7 @@ class EditsManager(object):
             # logical to not add description if already there.
             if not edit_fact.description and user_fact.description:
                 edit_fact.description = user_fact.description
+            bump_fact_version(edit_fact)
             self.apply_edits(edit_fact)
 
         return _paste_factoid()
@@ -577,6 +688,11 @@ class EditsManager(object):
 
     def jump_fact_inc(self, count=1):
         """"""
+        # Read the rest of the stream before looking past the streamed Facts,
+        # lest we load store Facts from a time that a pending Fact will claim.
+        # (Facts stream in time order, so there's no need on jump_fact_dec.)
+        if self.streaming and self.conjoined.store_bound_inc(count):
+            self.drain_fact_stream()
         for idx in range(count):
             next_fact = self.conjoined.jump_fact_inc()
             if next_fact is None:
@@ -587,34 +703,84 @@ class EditsManager(object):
 
     # ***
 
+    # (lb): Jumping back only reads the stream as far as the jump might load
+    # from the store. Jumping forward past the streamed Facts (e.g., to the
+    # final Fact) still reads the rest of the stream first.
+
     def jump_day_dec(self, days=1):
         """"""
+        self.drain_fact_stream(until_time=self.conjoined.jump_day_dec_reach(days))
         return self.conjoined.jump_day_dec(days=days)
 
     def jump_day_inc(self, days=1):
         """"""
+        self.drain_fact_stream()
         return self.conjoined.jump_day_inc(days=days)
 
     # ***
 
     def jump_rift_dec(self):
         """"""
+        self.drain_fact_stream(until_time=self.curr_fact.start)
         self.conjoined.jump_rift_dec()
 
     def jump_rift_inc(self):
         """"""
+        self.drain_fact_stream()
         self.conjoined.jump_rift_inc()
 
     # ***
 
     def jump_fact_first(self):
         """"""
+        self.drain_fact_stream(until_time=self.curr_fact.start)
         self.conjoined.jump_fact_first()
 
     def jump_fact_final(self):
         """"""
+        self.drain_fact_stream()
         self.conjoined.jump_fact_final()
 
+    def jump_to_fact_nearest(self, **kwargs):
+        """"""
+        # A jump forward loads a window of store Facts after its time (see
+        # editor.jump_window_size), so only a jump back stops the stream short.
+        if kwargs.get('since_time') is None:
+            self.drain_fact_stream(until_time=kwargs.get('until_time'))
+        else:
+            self.drain_fact_stream()
+        self.conjoined.jump_to_fact_nearest(**kwargs)
+
+    # ***
+
+    def prefetch_day_index(self, days=1):
+        """Indexes the months around the jump reference, unless still streaming."""
+        # Not until the stream is done, lest we load store Facts from times
+        # that the Facts yet to arrive will claim (see also jump_day_dec).
+        if self.streaming:
+            return
+        self.conjoined.prefetch_day_index(days=days)
+
+    # ***
+
+    def evict_far_facts(self):
+        """Drops clean Facts far from the current Fact, if too many are loaded."""
+        def _evict_far_facts():
+            max_facts = self.controller.config['editor.max_loaded_facts']
+            if (not max_facts) or (len(self.conjoined.by_pk) <= max_facts):
+                return 0
+            return self.conjoined.evict_far_facts(max_facts, keep_pks=pinned_pks())
+
+        def pinned_pks():
+            # Keep the Facts that undo or redo might restore (or look for).
+            pinned = set(self.edit_facts.keys())
+            for urt_changes in self.redo_undo.undo + self.redo_undo.redo:
+                for fact in (urt_changes.pristine or []) + (urt_changes.altered or []):
+                    pinned.add(fact.pk)
+            return pinned
+
+        return _evict_far_facts()
+
     # ***
 
     def save_edited_facts(self):
@@ -0,0 +1,58 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Facts Carousel Activity, Category and Tag Interner"""
+
+__all__ = (
+    'FactInterner',
+)
+
+
+class FactInterner(object):
+    """Shares one Activity, Category and Tag object between all Facts that use it.
+
+    Each Fact read from the store comes with its own copies of these, and
+    a session that visits lots of Facts ends up holding lots of duplicates.
+    Items are matched on all of their fields (see as_tuple), and items not
+    yet saved (with no PK) are left alone, as a save may assign their PK.
+
+    The viewer never edits these items in place (it assigns new ones, e.g.,
+    on paste, or after the act@gory prompt), so sharing them is safe.
+    """
+    def __init__(self):
+        self.items = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def intern_fact(self, some_fact):
+        if some_fact.activity is not None:
+            some_fact.activity = self.intern_activity(some_fact.activity)
+        if some_fact.tags:
+            some_fact.tags = [self.intern_item(tag) for tag in some_fact.tags]
+        return some_fact
+
+    def intern_activity(self, activity):
+        interned = self.intern_item(activity)
+        if (interned is activity) and (activity.category is not None):
+            activity.category = self.intern_item(activity.category)
+        return interned
+
+    def intern_item(self, item):
+        if item.pk is None:
+            return item
+        return self.items.setdefault((type(item), item.as_tuple()), item)
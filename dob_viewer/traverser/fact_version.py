@@ -0,0 +1,69 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Staged Fact version stamps, for cheap change detection."""
+
+from itertools import count
+
+__all__ = (
+    'bump_fact_version',
+    'fact_version',
+    'same_facts',
+)
+
+
+# (lb): Versions come from one counter, rather than counting per Fact, so
+# that no two Fact objects ever share a version, not even a Fact and its
+# copy (FactDressed.copy() knows nothing about our stamp). As such, equal
+# versions means same object, unchanged since the stamp was last bumped.
+_version_counter = count(1)
+
+
+def fact_version(fact):
+    """Returns the Fact's version stamp, stamping the Fact if it's never been."""
+    try:
+        return fact.viewer_version
+    except AttributeError:
+        return bump_fact_version(fact)
+
+
+def bump_fact_version(*facts):
+    """Stamps each Fact with a new version. Call after mutating a staged Fact."""
+    version = None
+    for fact in facts:
+        if fact is None:
+            continue
+        version = next(_version_counter)
+        fact.viewer_version = version
+    return version
+
+
+def same_facts(facts, other_facts):
+    """Compares two lists of Facts, by version first, and then by value.
+
+    The version check is O(1) per Fact, and it's all we need when comparing
+    Facts with themselves. Otherwise, fall back on comparing field values,
+    e.g., to tell if a user's edit put a Fact back the way it was.
+    """
+    if len(facts) != len(other_facts):
+        return False
+    if all(
+        fact_version(fact) == fact_version(other)
+        for fact, other in zip(facts, other_facts)
+    ):
+        return True
+    return facts == other_facts
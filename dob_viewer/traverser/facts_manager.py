@@ -17,15 +17,21 @@
 
 """Facts Carousel"""
 
+import logging
 from contextlib import contextmanager
 
 from sortedcontainers import SortedKeyList
 
+from .fact_interner import FactInterner
+from .facts_mgr_day_index import FactsManager_DayIndex
+from .facts_mgr_evict import FactsManager_Evict
+from .facts_mgr_extent import FactsManager_Extent
 from .facts_mgr_fact_dec import FactsManager_FactDec
 from .facts_mgr_fact_inc import FactsManager_FactInc
 from .facts_mgr_gap import FactsManager_Gap
 from .facts_mgr_jump import FactsManager_Jump
 from .facts_mgr_jump_time import FactsManager_JumpTime
+from .facts_mgr_prefetch import FactsManager_Prefetch
 from .facts_mgr_rift import FactsManager_Rift
 from .facts_mgr_rift_dec import FactsManager_RiftDec
 from .facts_mgr_rift_inc import FactsManager_RiftInc
@@ -37,11 +43,15 @@ __all__ = (
 
 
 class FactsManager(
+    FactsManager_DayIndex,
+    FactsManager_Evict,
+    FactsManager_Extent,
     FactsManager_FactDec,
     FactsManager_FactInc,
     FactsManager_Gap,
     FactsManager_Jump,
     FactsManager_JumpTime,
+    FactsManager_Prefetch,
     FactsManager_Rift,
     FactsManager_RiftDec,
     FactsManager_RiftInc,
@@ -50,12 +60,22 @@ class FactsManager(
 
     # ***
 
-    def __init__(self, controller, on_insert_fact, on_jumped_fact, *args, **kwargs):
+    def __init__(
+        self,
+        controller,
+        on_insert_fact,
+        on_jumped_fact,
+        *args,
+        interner=None,
+        **kwargs
+    ):
         super(FactsManager, self).__init__(controller, *args, **kwargs)
 
         self.controller = controller
         self.on_insert_fact = on_insert_fact
         self.on_jumped_fact = on_jumped_fact
+        # Pass the EditsManager's interner, so it outlives each FactsManager.
+        self.interner = interner if interner is not None else FactInterner()
         self.debug = controller.client_logger.debug
         self.groups = self.sorted_contiguous_facts_list()
         self.by_pk = {}
@@ -144,20 +164,67 @@ class FactsManager(
 
         grouped_facts = []
         for fact in facts:
-            self.controller.affirm(fact.pk not in self.by_pk.keys())
-            self.by_pk[fact.pk] = fact
+            self.index_added_fact(fact)
             grouped_facts.append(fact)
-            # For creating new Facts.
-            if fact.unstored:
-                self.last_fact_pk = min(self.last_fact_pk, fact.pk)
 
         # FIXME/2019-12-06: (lb): Just testing. Remove affirm arg. later.
         # group = GroupChained(grouped_facts)
         group = GroupChained(grouped_facts, affirm=self.controller.affirm)
         self.groups.add(group)
 
+        # Once the rifts are placed (on stand_up), mark new groups with
+        # new or edited Facts, e.g., from a paste, so the user can find them.
+        if self.time_rifts and (self.find_first_dirty_from_group(group) is not None):
+            self.place_time_rift_for_group(group)
+
         self.logger_debug_groups('add_facts', group=group)
 
+    def append_facts(self, facts, after_fact):
+        """Adds Facts to the group that ends with after_fact, e.g., from a stream.
+
+        The Facts are expected to follow after_fact, so that each batch of a
+        streamed import extends the same group, and the import ends up as one
+        group, the same as if it had been passed to add_facts all at once.
+        """
+        if not facts:
+            return
+
+        group = self.group_ending_with(after_fact)
+        if group is None:
+            # Not expected, but not fatal: The Facts just get their own group.
+            self.controller.affirm(False)
+            self.add_facts(facts)
+            return
+
+        self.controller.affirm(after_fact.sorty_times <= facts[0].sorty_times)
+        with self.fact_group_rekeyed(group):
+            for fact in facts:
+                self.index_added_fact(fact)
+                group.add(fact)
+
+        self.logger_debug_groups('append_facts', group=group)
+
+    def group_ending_with(self, some_fact):
+        # Like locate_fact, but check just the final Fact of each candidate
+        # group, rather than scanning a (long) group for the Fact's index.
+        inserts_at = self.groups.bisect_key_left(some_fact.sorty_times)
+        for group_index in (inserts_at, inserts_at - 1):
+            if (
+                (0 <= group_index < len(self.groups))
+                and (self.groups[group_index][-1].pk == some_fact.pk)
+            ):
+                return self.groups[group_index]
+        return None
+
+    def index_added_fact(self, fact):
+        self.controller.affirm(fact.pk not in self.by_pk.keys())
+        self.interner.intern_fact(fact)
+        self.by_pk[fact.pk] = fact
+        self.index_dirty_fact(fact)
+        # For creating new Facts.
+        if fact.unstored:
+            self.last_fact_pk = min(self.last_fact_pk, fact.pk)
+
     def claim_time_span(self, since, until):
         owning_group = None
 
@@ -200,6 +267,8 @@ class FactsManager(
     def apply_edits(self, edit_facts, last_edits):
         group, _index = self.locate_fact(last_edits[0])
 
+        was_starts = {last_edit.pk: last_edit.start for last_edit in last_edits}
+
         with self.fact_group_rekeyed(group):
 
             # Clear time windows of edited facts, as times may have changed.
@@ -229,6 +298,7 @@ class FactsManager(
                 group_fact.next_fact = None
 
                 del self.by_pk[group_fact.pk]
+                self.unindex_dirty_fact(group_fact)
 
             for edit_fact in edit_facts:
                 # Rather than try to rewire the Facts, e.g., by calling
@@ -239,6 +309,9 @@ class FactsManager(
                 edit_fact.prev_fact = None
                 group.add(edit_fact)
                 self.by_pk[edit_fact.pk] = edit_fact
+                self.index_dirty_fact(edit_fact)
+                if edit_fact.pk in was_starts:
+                    self.move_time_rift(was_starts[edit_fact.pk], edit_fact)
 
     # ***
 
@@ -298,6 +371,10 @@ class FactsManager(
         # Caller is responsible for wiring prev/next references.
 
     def logger_debug_groups(self, whence='', group=None):
+        # (lb): Formatting every group on every call adds up, e.g., when
+        # loading lots of groups, so skip the work unless it'd be logged.
+        if not self.controller.client_logger.isEnabledFor(logging.DEBUG):
+            return
         group = group or self.curr_group
         self.debug(
             '{}\n- group.sorty_times: {}\n-    groups._maxes: {}'.format(
@@ -320,7 +397,9 @@ class FactsManager(
 
         with self.fact_group_rekeyed():
             self.curr_group.add(some_fact)
+            self.interner.intern_fact(some_fact)
             self.by_pk[some_fact.pk] = some_fact
+            self.index_dirty_fact(some_fact)
 
     def new_fact_wire_links(self, some_fact):
         # 2019-02-13: (lb): Just a *momentaneous* FYI. (Feature should be all wired now.)
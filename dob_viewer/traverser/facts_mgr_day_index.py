@@ -0,0 +1,136 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+"""FactsManager_DayIndex"""
+
+from datetime import datetime, timedelta
+
+from nark.items.fact import UntilTimeStops
+
+__all__ = (
+    'FactsManager_DayIndex',
+)
+
+
+class FactsManager_DayIndex(object):
+    """Indexes the store's Facts for day jumps, a month at a time.
+
+    Each month is read from the store with a single query, and its Facts are
+    loaded into the groups, which then serve as the index: jumping to a day
+    in an indexed month resolves from the groups alone. We also remember
+    which months were read, so that a jump into a gap between groups in an
+    indexed month knows the store has nothing else to offer, and need not ask.
+    """
+    def __init__(self, *args, **kwargs):
+        super(FactsManager_DayIndex, self).__init__(*args, **kwargs)
+
+        # The (year, month) of each month read from the store. (A month with
+        # no Facts starting or ending in it might still be spanned by one long
+        # Fact, so we track those separately, and do not vouch for them.)
+        self.day_index_months = set()
+        self.day_index_vacant = set()
+
+    # ***
+
+    def index_days_around(self, *ref_times):
+        """Ensures the months of the given times are indexed (and loaded)."""
+        for ref_time in ref_times:
+            month_key = (ref_time.year, ref_time.month)
+            if (
+                (month_key in self.day_index_months)
+                or (month_key in self.day_index_vacant)
+            ):
+                continue
+            self.index_store_month(*month_key)
+
+    def index_store_month(self, year, month):
+        def _index_store_month():
+            month_since, month_until = month_bounds()
+            month_facts = self.controller.facts.get_all(
+                since=month_since,
+                until=month_until,
+                partial=True,
+                sort_cols=('start',),
+                sort_orders=('asc',),
+            )
+            if not month_facts:
+                self.day_index_vacant.add((year, month))
+                return
+            # The month query returns every Fact that starts or ends in the
+            # month, which is everything the store has between the first of
+            # those Facts and the last, so it's safe to group them.
+            self.load_store_facts(month_facts)
+            self.day_index_months.add((year, month))
+
+        def month_bounds():
+            month_since = datetime(year, month, 1)
+            if month == 12:
+                month_until = datetime(year + 1, 1, 1)
+            else:
+                month_until = datetime(year, month + 1, 1)
+            return month_since, month_until
+
+        _index_store_month()
+
+    # ***
+
+    def store_time_indexed(self, ref_time, is_next):
+        """Returns True if the store has no unloaded Facts near ref_time.
+
+        Specifically, if every month between ref_time and the neighboring
+        group (in the direction of travel) has been indexed, then every
+        store Fact in between has been loaded, so the groups have the answer.
+        """
+        if not self.day_index_months:
+            return False
+        sorty_times = (ref_time, UntilTimeStops)
+        inserts_at = self.groups.bisect_key_left(sorty_times)
+        if is_next:
+            if inserts_at >= len(self.groups):
+                return False
+            since, until = ref_time, self.groups[inserts_at].time_since
+        else:
+            if inserts_at == 0:
+                return False
+            since, until = self.groups[inserts_at - 1].time_until, ref_time
+        return self.months_indexed(since, until)
+
+    def store_bound_days(self, days):
+        """Whether jumping days (negative for backward) might query the store."""
+        try:
+            ref_time = self.jump_time_reference + timedelta(days=days)
+        except OverflowError:
+            return False
+        return not self.store_time_indexed(ref_time, is_next=(days > 0))
+
+    def months_indexed(self, since, until):
+        year, month = since.year, since.month
+        while (year, month) <= (until.year, until.month):
+            if (year, month) not in self.day_index_months:
+                return False
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return True
+
+    def prefetch_day_index(self, days=1):
+        """Indexes the months of the days before and after the jump reference."""
+        try:
+            days_delta = timedelta(days=days)
+            self.index_days_around(
+                self.jump_time_reference - days_delta,
+                self.jump_time_reference + days_delta,
+            )
+        except OverflowError:
+            pass
@@ -0,0 +1,171 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""FactsManager_Evict"""
+
+from nark.items.fact import UntilTimeStops
+
+__all__ = (
+    'FactsManager_Evict',
+)
+
+
+class FactsManager_Evict(object):
+    """Bounds the working set by dropping clean Facts far from the current Fact.
+
+    Only clean Facts (those that match the store, so not new, edited, or
+    deleted) that are not otherwise pinned (e.g., by the undo history) are
+    evicted, and only from the far end of each group. The group gives up
+    the time the evicted Facts claimed, so that navigating back there
+    consults the store again, and loads them anew.
+    """
+    # Evict down to this fraction of the limit, so we do not evict on every step.
+    EVICT_DOWN_TO = 0.75
+
+    # How many Facts to keep on either side of the current Fact, at least.
+    EVICT_KEEP_NEAR = 100
+
+    def evict_far_facts(self, max_facts, keep_pks=()):
+        """Evicts Facts until no more than max_facts are loaded. Returns count evicted.
+
+        keep_pks are the PKs of Facts to keep regardless, e.g., those on the
+        undo or redo stacks.
+        """
+        def _evict_far_facts():
+            if (not max_facts) or (len(self.by_pk) <= max_facts):
+                return 0
+            loaded_count = len(self.by_pk)
+            target_count = int(max_facts * FactsManager_Evict.EVICT_DOWN_TO)
+            keep_near = min(FactsManager_Evict.EVICT_KEEP_NEAR, target_count // 2)
+            earlier, later = far_groups_by_side()
+            while (len(self.by_pk) > target_count) and (earlier or later):
+                side, from_front = pick_farther_side(earlier, later)
+                group = side[0]
+                if not group:
+                    # Claims time, but holds no Facts; nothing to evict.
+                    side.pop(0)
+                    continue
+                evict_count = len(self.by_pk) - target_count
+                if not evict_from_group(group, from_front, evict_count, keep_near):
+                    # Blocked by a Fact we must keep, so try the next group.
+                    side.pop(0)
+                elif not group:
+                    side.pop(0)
+            evicted_count = loaded_count - len(self.by_pk)
+            self.controller.client_logger.debug(
+                'evicted: {} / loaded: {}'.format(evicted_count, len(self.by_pk)),
+            )
+            return evicted_count
+
+        def far_groups_by_side():
+            # Each side lists its groups farthest first, ending with the
+            # current group, whose far ends are the last to go.
+            curr_group_index = self.groups.index(self.curr_group)
+            earlier = list(self.groups[:curr_group_index])
+            later = list(reversed(self.groups[curr_group_index + 1:]))
+            earlier.append(self.curr_group)
+            later.append(self.curr_group)
+            return earlier, later
+
+        def pick_farther_side(earlier, later):
+            if not later:
+                return earlier, True
+            if not earlier:
+                return later, False
+            if not (earlier[0] and later[0]):
+                return (earlier, True) if not earlier[0] else (later, False)
+            curr_start = self.curr_fact.start
+            earlier_dist = curr_start - earlier[0][0].start
+            later_dist = later[0][-1].start - curr_start
+            if earlier_dist >= later_dist:
+                return earlier, True
+            return later, False
+
+        def evict_from_group(group, from_front, evict_count, keep_near):
+            evict_count = min(evict_count, evictable_count(group, from_front, keep_near))
+            if not evict_count:
+                return 0
+            if evict_count == len(group):
+                evict_group(group)
+            else:
+                trim_group(group, from_front, evict_count)
+            return evict_count
+
+        def evictable_count(group, from_front, keep_near):
+            limit = len(group)
+            if group is self.curr_group:
+                if from_front:
+                    limit = max(0, self.curr_index - keep_near)
+                else:
+                    limit = max(0, len(group) - 1 - self.curr_index - keep_near)
+            indices = range(limit) if from_front else range(-1, -limit - 1, -1)
+            count = 0
+            for index in indices:
+                if not evictable(group[index]):
+                    break
+                count += 1
+            return count
+
+        def evictable(some_fact):
+            return (
+                (some_fact is not self.curr_fact)
+                and (not some_fact.dirty)
+                and (some_fact.pk not in keep_pks)
+            )
+
+        def evict_group(group):
+            self.groups.pop(self.groups.index(group))
+            for group_fact in list(group.facts):
+                forget_fact(group_fact)
+            del group[:]
+
+        def trim_group(group, from_front, evict_count):
+            with self.fact_group_rekeyed(group):
+                for _count in range(evict_count):
+                    forget_fact(group.pop(0 if from_front else -1))
+                # Un-claim the evicted time, so the store is consulted again.
+                if from_front:
+                    group.time_since = group[0].start
+                else:
+                    group.time_until = group[-1].end or UntilTimeStops
+            if (group is self.curr_group) and from_front:
+                self.curr_index -= evict_count
+
+        def forget_fact(some_fact):
+            # Unwire the Fact, so its neighbour knows to look again.
+            if some_fact.has_prev_fact and (some_fact.prev_fact.next_fact is some_fact):
+                some_fact.prev_fact.next_fact = None
+            if some_fact.has_next_fact and (some_fact.next_fact.prev_fact is some_fact):
+                some_fact.next_fact.prev_fact = None
+            some_fact.prev_fact = None
+            some_fact.next_fact = None
+            del self.by_pk[some_fact.pk]
+            self.unindex_dirty_fact(some_fact)
+            self.forget_day_index_months(some_fact)
+
+        return _evict_far_facts()
+
+    def forget_day_index_months(self, some_fact):
+        # The day index vouches that the groups hold all of an indexed month's
+        # store Facts, which is no longer so once we evict one of them.
+        if not self.day_index_months:
+            return
+        until = some_fact.end or some_fact.start
+        year, month = some_fact.start.year, some_fact.start.month
+        while (year, month) <= (until.year, until.month):
+            self.day_index_months.discard((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
@@ -0,0 +1,62 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+"""FactsManager_Extent"""
+
+__all__ = (
+    'FactsManager_Extent',
+)
+
+
+class FactsManager_Extent(object):
+    """Caches the store's extent: its oldest and latest Facts.
+
+    The store does not change underneath the Carousel except on save, and on
+    save, the EditsManager builds a new FactsManager (see save_edited_facts),
+    which invalidates this cache. Callers that write to the store otherwise
+    should call reset_store_extent.
+    """
+    # Distinguishes "not looked up yet" from "looked up, and store empty".
+    UNKNOWN = object()
+
+    def __init__(self, *args, **kwargs):
+        super(FactsManager_Extent, self).__init__(*args, **kwargs)
+
+        self.reset_store_extent()
+
+    def reset_store_extent(self):
+        self._store_oldest_fact = FactsManager_Extent.UNKNOWN
+        self._store_latest_fact = FactsManager_Extent.UNKNOWN
+
+    # ***
+
+    def store_oldest_fact(self):
+        if self._store_oldest_fact is FactsManager_Extent.UNKNOWN:
+            self._store_oldest_fact = self.controller.find_oldest_fact()
+        return self.store_extent_fact(self._store_oldest_fact)
+
+    def store_latest_fact(self):
+        if self._store_latest_fact is FactsManager_Extent.UNKNOWN:
+            self._store_latest_fact = self.controller.find_latest_fact()
+        return self.store_extent_fact(self._store_latest_fact)
+
+    def store_extent_fact(self, extent_fact):
+        if extent_fact is None:
+            return None
+        # Callers wire the Fact into the groups, so keep our copy pristine.
+        store_fact = extent_fact.copy()
+        store_fact.orig_fact = None
+        return store_fact
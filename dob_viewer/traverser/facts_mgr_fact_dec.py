@@ -21,6 +21,8 @@ import datetime
 
 from nark.items.fact import SinceTimeBegan
 
+from .fact_version import bump_fact_version
+
 __all__ = (
     'FactsManager_FactDec',
 )
@@ -44,6 +46,12 @@ class FactsManager_FactDec(object):
         #     but for now, using 100 yrs. ago.
         self.beginning_of_time = controller.now - (100 * JULIAN_YEAR)
 
+    def store_bound_dec(self, count=1):
+        """Whether jumping backward count Facts might query the store."""
+        if (self.curr_index - count) >= 0:
+            return False
+        return not (self.curr_index == 0 and self.curr_group.since_time_began)
+
     def jump_fact_dec(self):
         """"""
         def _jump_fact_dec():
@@ -221,6 +229,7 @@ class FactsManager_FactDec(object):
             elif prev_fact.is_gap:
                 # Prior fact is already unedited interval gap, so just edit its time.
                 prev_fact.end = self.curr_fact.start
+                bump_fact_version(prev_fact)
                 gap_fact = prev_fact
             else:
                 gap_fact = self.fact_from_interval_gap(
@@ -19,6 +19,8 @@
 
 from nark.items.fact import UntilTimeStops
 
+from .fact_version import bump_fact_version
+
 __all__ = (
     'FactsManager_FactInc',
 )
@@ -31,6 +33,12 @@ __all__ = (
 #       meld facts_mgr_fact_dec.py facts_mgr_fact_inc.py &
 class FactsManager_FactInc(object):
     """"""
+    def store_bound_inc(self, count=1):
+        """Whether jumping forward count Facts might query the store."""
+        if (self.curr_index + count) < len(self.curr_group):
+            return False
+        return not (not self.curr_fact.end and self.curr_group.until_time_stops)
+
     def jump_fact_inc(self):
         """"""
         def _jump_fact_inc():
@@ -210,6 +218,7 @@ class FactsManager_FactInc(object):
             elif next_fact.is_gap:
                 # Next fact is already unedited interval gap, so just edit its time.
                 next_fact.start = self.curr_fact.end
+                bump_fact_version(next_fact)
                 gap_fact = next_fact
             else:
                 gap_fact = self.fact_from_interval_gap(
@@ -28,6 +28,12 @@ class FactsManager_Gap(object):
     """"""
 
     def fact_from_interval_gap(self, since_time, until_time):
+        gap_fact = self.new_interval_gap_fact(since_time, until_time)
+        # Add to undo stack. Sorta tricky. Sorta a hack.
+        self.on_insert_fact(gap_fact)
+        return gap_fact
+
+    def new_interval_gap_fact(self, since_time, until_time):
         self.controller.affirm((not until_time) or (since_time < until_time))
         self.last_fact_pk -= 1
         gap_fact = FactDressed.new_gap_fact(
@@ -35,10 +41,77 @@ class FactsManager_Gap(object):
             start=since_time,
             end=until_time,
         )
-        # Add to undo stack. Sorta tricky. Sorta a hack.
-        self.on_insert_fact(gap_fact)
         return gap_fact
 
+    # ***
+
+    def fill_interior_gaps(self):
+        """Wires every group's Facts, filling interval gaps in one sorted sweep.
+
+        The jump_fact_inc/_dec methods otherwise wire Facts and fill gaps
+        lazily, one at a time, as the user traverses the Carousel. Here we
+        do the same work up front, e.g., after loading a large import.
+        The jump methods skip Facts that are already wired, so the two
+        approaches can be mixed freely.
+
+        Returns the list of new gap Facts (which are also passed all at
+        once to on_insert_fact, so they land on a single undo record).
+        """
+        def _fill_interior_gaps():
+            gap_facts = []
+            # Copy the groups list, as fact_group_rekeyed pops and re-adds.
+            for group in list(self.groups):
+                group_gaps = sweep_group(group)
+                if not group_gaps:
+                    continue
+                with self.fact_group_rekeyed(group):
+                    for gap_fact in group_gaps:
+                        group.add(gap_fact)
+                        self.by_pk[gap_fact.pk] = gap_fact
+                gap_facts.extend(group_gaps)
+            if gap_facts:
+                relocate_curr_fact()
+                self.on_insert_fact(*gap_facts)
+            return gap_facts
+
+        def relocate_curr_fact():
+            # Gaps shift group indices, so refresh the cursor, if set.
+            if self.curr_fact is None:
+                return
+            self.curr_group, self.curr_index = self.locate_fact(self.curr_fact)
+
+        def sweep_group(group):
+            group_gaps = []
+            prev_fact = None
+            # The group is sorted by sorty_times, so one pass suffices.
+            for fact in group.facts:
+                if prev_fact is not None:
+                    gap_fact = wire_neighbors_maybe(prev_fact, fact)
+                    if gap_fact is not None:
+                        group_gaps.append(gap_fact)
+                prev_fact = fact
+            return group_gaps
+
+        def wire_neighbors_maybe(prev_fact, next_fact):
+            if prev_fact.has_next_fact or next_fact.has_prev_fact:
+                # Already wired, e.g., by the user traversing the Carousel.
+                return None
+            if not prev_fact.end or not next_fact.start:
+                # An active Fact in the middle of things? Let the jump code sort it.
+                return None
+            if prev_fact.end == next_fact.start:
+                self.wire_two_facts_neighborly(prev_fact, next_fact)
+                return None
+            if prev_fact.end > next_fact.start:
+                # Overlapping Facts (conflicts) are not ours to resolve here.
+                return None
+            gap_fact = self.new_interval_gap_fact(prev_fact.end, next_fact.start)
+            self.wire_two_facts_neighborly(prev_fact, gap_fact)
+            self.wire_two_facts_neighborly(gap_fact, next_fact)
+            return gap_fact
+
+        return _fill_interior_gaps()
+
     def wire_two_facts_neighborly(self, fact_1, fact_2):
         self.controller.affirm(fact_1 < fact_2)
         self.controller.affirm(fact_2.prev_fact is None)
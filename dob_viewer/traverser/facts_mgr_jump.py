@@ -17,6 +17,8 @@
 
 """"""
 
+import logging
+
 from nark.items.fact import UntilTimeStops
 
 __all__ = (
@@ -41,6 +43,10 @@ class FactsManager_Jump(object):
     # ***
 
     def debug_log_facts_mgr_state(self, caller_name):
+        # (lb): Formatting every group is not cheap (see GroupChained.__str__),
+        # and this runs on every jump, so skip the work unless it'd be logged.
+        if not self.controller.client_logger.isEnabledFor(logging.DEBUG):
+            return
         self.debug(
             '{}: len(groups): {} / curr_index: {}\n'
             '- grps:\n{}\n- cgrp: {}\n- curr: {}'
@@ -57,18 +63,29 @@ class FactsManager_Jump(object):
     # ***
 
     def jump_to_fact_nearest(self, since_time=None, until_time=None):
-        """"""
+        """Jumps to the Fact at since_time (or until_time), if there is one.
+
+        Otherwise, jumps to the nearest Fact after since_time (or before
+        until_time). The result is the same whether or not the time was
+        already loaded from the store.
+        """
         def _jump_to_fact_nearest():
             assert (since_time is not None) ^ (until_time is not None)
             ref_time = since_time or until_time
+            # The groups double as the map of time already loaded from the
+            # store: if ref_time falls within a group, skip the store entirely.
             fact_group, group_fact, is_perfect = find_nearest_group_fact(ref_time)
-            store_fact = is_perfect and None or find_nearest_store_fact(ref_time)
+            store_fact, window_facts = None, []
+            if not is_perfect:
+                store_fact, window_facts = find_nearest_store_fact(ref_time)
             nearest_fact = choose_nearest(fact_group, group_fact, store_fact)
             debug_log_chosen_fact(
                 ref_time, nearest_fact, fact_group, group_fact, store_fact,
             )
 
             if nearest_fact is not None:
+                if nearest_fact is store_fact:
+                    load_store_window(nearest_fact, window_facts)
                 if nearest_fact.pk not in self.by_pk.keys():
                     self.add_facts([nearest_fact])
                 reason = 'jump-{}'.format('next' if since_time else 'prev')
@@ -142,15 +159,96 @@ class FactsManager_Jump(object):
             # Falls before indicated fact.
             nearest_fact = fact_group[fact_index - 1]
             self.controller.affirm(nearest_fact.start <= ref_time)
+            if (
+                (since_time is not None)
+                and (nearest_fact.end is not None)
+                and (nearest_fact.end <= ref_time)
+            ):
+                # Falls in a gap not yet filled (e.g., between Facts loaded
+                # from the store), and momentum is forward, so use the Fact
+                # after the gap, the same as the store would (see
+                # pick_window_fact).
+                return fact_group[fact_index]
             return nearest_fact
 
         # ***
 
         def find_nearest_store_fact(ref_time):
+            if self.store_time_indexed(ref_time, is_next=(since_time is not None)):
+                # The day index says the store has nothing we have not loaded
+                # between ref_time and the neighboring group, so skip the store.
+                return None, []
+            # Rather than ask the store for just the nearest Fact, fetch it
+            # and the Facts around it all at once. Then the next jump nearby
+            # (and traversing the neighbors) will not need the store again.
+            # - Fetch a couple of Facts even if not loading a window, so that
+            #   we can pick past a Fact that ends at ref_time, if need be.
+            window_size = self.controller.config['editor.jump_window_size']
+            window_limit = max(window_size, 2)
+            window_facts = self.fetch_window_from_store(
+                ref_time, is_next=(since_time is not None), limit=window_limit,
+            )
+            store_fact = pick_window_fact(ref_time, window_facts)
+            if (store_fact is not None) or (len(window_facts) < window_limit):
+                return store_fact, (window_facts if window_size else [])
+            # else, the window was full, but it was all neighbors at
+            # ref_time, so ask the store for the nearest Fact directly.
             if since_time is not None:
-                return self.fetch_next_from_store(ref_time)
+                return self.fetch_next_from_store(ref_time), []
             else:
-                return self.fetch_prev_from_store(ref_time)
+                return self.fetch_prev_from_store(ref_time), []
+
+        def pick_window_fact(ref_time, window_facts):
+            # Pick the Fact at ref_time, if any, which is the Fact the groups
+            # pick when ref_time is already loaded (see match_group_later_index),
+            # so that a jump lands on the same Fact whether or not its time was
+            # loaded. (This also keeps jumps reversible, e.g., 5J then 5K.)
+            # (The window is ordered by start, ascending if since_time, else not.)
+            for window_fact in window_facts:
+                if (
+                    (window_fact.start <= ref_time)
+                    and ((window_fact.end is None) or (window_fact.end > ref_time))
+                ):
+                    return window_fact
+            # Otherwise, ref_time falls between Facts, so pick the nearest one
+            # in the direction of travel, the same as subsequent or antecedent.
+            for window_fact in window_facts:
+                if since_time is not None:
+                    if (
+                        (window_fact.start > ref_time)
+                        or (
+                            (window_fact.start == ref_time)
+                            and (window_fact.end is not None)
+                            and (window_fact.end > ref_time)
+                        )
+                    ):
+                        return window_fact
+                elif (
+                    ((window_fact.end is None) and (window_fact.start < ref_time))
+                    or (
+                        (window_fact.end is not None)
+                        and (
+                            (window_fact.end < ref_time)
+                            or (
+                                (window_fact.end == ref_time)
+                                and (window_fact.start < ref_time)
+                            )
+                        )
+                    )
+                ):
+                    return window_fact
+            return None
+
+        # ***
+
+        def load_store_window(store_fact, window_facts):
+            # Load the window Facts, so the time they span counts as loaded.
+            # The window is all the store has between its first and last Facts
+            # (because it's sorted and limited by start time, and Facts in the
+            # store do not overlap), so it's safe to group them.
+            if not any(store_fact is window_fact for window_fact in window_facts):
+                return
+            self.load_store_facts(window_facts)
 
         # ***
 
@@ -257,3 +355,75 @@ class FactsManager_Jump(object):
 
         return _jump_to_fact_nearest()
 
+    # ***
+
+    def fetch_window_from_store(self, ref_time, is_next, limit):
+        # Fetch the Facts at or after ref_time (or at or before, if not is_next),
+        # including the Fact that spans ref_time, if any, nearest Fact first.
+        if is_next:
+            time_kwargs = {'since': ref_time}
+            sort_order = 'asc'
+        else:
+            time_kwargs = {'until': ref_time}
+            sort_order = 'desc'
+        window_facts = self.controller.facts.get_all(
+            partial=True,
+            sort_cols=('start',),
+            sort_orders=(sort_order,),
+            limit=limit,
+            **time_kwargs
+        )
+        for window_fact in window_facts:
+            # In case we decide to keep this fact, make it safe.
+            window_fact.orig_fact = 0  # The orig_fact is... itself!
+        return window_facts
+
+    # ***
+
+    def load_store_facts(self, store_facts):
+        """Adds Facts from the store as new groups, around existing groups.
+
+        The caller must ensure that store_facts is every Fact the store has
+        between the earliest and latest of them (e.g., as returned by a query
+        ordered and limited by start time), because each group claims all
+        the time between its first and last Facts.
+        """
+        def _load_store_facts():
+            run_facts = []
+            run_window = None
+            for store_fact in sorted(store_facts, key=lambda fact: fact.sorty_tuple):
+                free_window = self.free_time_window(store_fact)
+                if (free_window is None) or (store_fact.pk in self.by_pk.keys()):
+                    # Shadowed by a group, or a Fact we know about (and that's
+                    # maybe been edited), either of which breaks the run.
+                    add_run_facts(run_facts)
+                    run_facts, run_window = [], None
+                    continue
+                if free_window != run_window:
+                    add_run_facts(run_facts)
+                    run_facts, run_window = [], free_window
+                store_fact.orig_fact = 0
+                run_facts.append(store_fact)
+            add_run_facts(run_facts)
+
+        def add_run_facts(run_facts):
+            if run_facts:
+                self.add_facts(run_facts)
+
+        _load_store_facts()
+
+    def free_time_window(self, some_fact):
+        """Returns the unclaimed time around some_fact, or None if it's shadowed."""
+        sorty_times = (some_fact.start, UntilTimeStops)
+        inserts_at = self.groups.bisect_key_left(sorty_times)
+        since_limit = None
+        if inserts_at > 0:
+            since_limit = self.groups[inserts_at - 1].time_until
+            if some_fact.start < since_limit:
+                return None
+        until_limit = None
+        if inserts_at < len(self.groups):
+            until_limit = self.groups[inserts_at].time_since
+            if (some_fact.end or UntilTimeStops) > until_limit:
+                return None
+        return since_limit, until_limit
@@ -17,7 +17,7 @@
 
 """Facts Carousel"""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 __all__ = (
     'FactsManager_JumpTime',
@@ -65,11 +65,28 @@ class FactsManager_JumpTime(object):
             prev_fact = None
         else:
             prev_day = self.jump_time_reference - days_delta
+            # Index (and load) the month first, so the jump resolves from the
+            # groups. Either way, the jump lands on the Fact at prev_day, if
+            # any, else the nearest one before it (see jump_to_fact_nearest).
+            self.index_days_around(prev_day)
             prev_fact = self.jump_to_fact_nearest(until_time=prev_day)
         if prev_fact is None:
             prev_fact = self.jump_to_oldest_fact(reason='day-dec')
         return prev_fact
 
+    def jump_day_dec_reach(self, days=1):
+        """Returns the latest time that jump_day_dec might load from the store.
+
+        That's the end of the month it indexes, or None if it jumps too far.
+        """
+        try:
+            prev_day = self.jump_time_reference - timedelta(days=days)
+            if prev_day.month == 12:
+                return datetime(prev_day.year + 1, 1, 1)
+            return datetime(prev_day.year, prev_day.month + 1, 1)
+        except (OverflowError, ValueError):
+            return None
+
     def jump_day_inc(self, days=1):
         try:
             days_delta = timedelta(days=days)
@@ -77,6 +94,8 @@ class FactsManager_JumpTime(object):
             next_fact = None
         else:
             next_day = self.jump_time_reference + days_delta
+            # Same as jump_day_dec, but the nearest Fact after next_day, if none at it.
+            self.index_days_around(next_day)
             next_fact = self.jump_to_fact_nearest(since_time=next_day)
         if next_fact is None:
             next_fact = self.jump_to_latest_fact(reason='day-inc')
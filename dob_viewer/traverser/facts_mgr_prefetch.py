@@ -0,0 +1,140 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""FactsManager_Prefetch"""
+
+from nark.items.fact import UntilTimeStops
+
+__all__ = (
+    'FactsManager_Prefetch',
+)
+
+
+class FactsManager_Prefetch(object):
+    """Preloads the store Facts around the current Fact into its group.
+
+    Once the neighbouring Facts are in the current group, jump_fact_dec and
+    jump_fact_inc find them by index, and do not query the store.
+
+    The Facts are deliberately loaded unwired. Wiring a Fact means filling
+    the gap before it, and a new gap Fact is an edit that lands on the undo
+    stack (and clears the redo stack), which an idle callback must not do.
+    So the jump functions fill gaps and wire links when the user arrives.
+    Nor are the Facts pre-rendered: the views are rendered into the live
+    widgets of the current Fact, so a Fact's view is cached when first shown.
+    """
+    def prefetch_neighbours(self, count):
+        """Ensures up to count Facts are loaded on either side of the current Fact."""
+        # When topping up, load a full count, so that the user can take
+        # a few steps before the next prefetch needs to query the store.
+        following = len(self.curr_group) - 1 - self.curr_index
+        if following < count and not self.curr_group.until_time_stops:
+            self.prefetch_following(count)
+        if self.curr_index < count and not self.curr_group.since_time_began:
+            self.prefetch_preceding(count)
+
+    # ***
+
+    def prefetch_following(self, count):
+        def _prefetch_following():
+            ref_time = self.curr_group.time_until
+            window_facts = self.fetch_window_from_store(
+                ref_time, is_next=True, limit=count,
+            )
+            run_facts = []
+            for store_fact in window_facts:
+                if (
+                    store_fact.start < ref_time
+                    and (store_fact.end or UntilTimeStops) <= ref_time
+                ):
+                    # Ends inside the current group, so it's already loaded.
+                    continue
+                if not extends_group(store_fact, ref_time):
+                    break
+                run_facts.append(store_fact)
+            self.prefetch_group_add(run_facts)
+
+        def extends_group(store_fact, ref_time):
+            if store_fact.start < ref_time:
+                # Overlaps the group; jump_fact_inc knows how to fix it up.
+                return False
+            if not self.prefetchable(store_fact):
+                return False
+            next_group = self.prefetch_adjacent_group(1)
+            return (next_group is None) or (store_fact.end <= next_group.time_since)
+
+        _prefetch_following()
+
+    def prefetch_preceding(self, count):
+        def _prefetch_preceding():
+            ref_time = self.curr_group.time_since
+            window_facts = self.fetch_window_from_store(
+                ref_time, is_next=False, limit=count,
+            )
+            run_facts = []
+            for store_fact in window_facts:
+                if (
+                    store_fact.start >= ref_time
+                    and (store_fact.end or UntilTimeStops) > ref_time
+                ):
+                    # Starts inside the current group, so it's already loaded.
+                    continue
+                if not extends_group(store_fact, ref_time):
+                    break
+                run_facts.append(store_fact)
+            self.prefetch_group_add(run_facts)
+            # The new Facts sort before the current one.
+            self.curr_index += len(run_facts)
+
+        def extends_group(store_fact, ref_time):
+            if (store_fact.end or UntilTimeStops) > ref_time:
+                # Overlaps the group; jump_fact_dec knows how to fix it up.
+                return False
+            if not self.prefetchable(store_fact):
+                return False
+            prev_group = self.prefetch_adjacent_group(-1)
+            return (prev_group is None) or (store_fact.start >= prev_group.time_until)
+
+        _prefetch_preceding()
+
+    # ***
+
+    def prefetchable(self, store_fact):
+        # Leave the Active Fact, momentaneous Facts, and Facts we already know
+        # about (that are maybe being edited) to the jump functions, which use
+        # the store's PK-aware lookups.
+        return (
+            store_fact.end is not None
+            and store_fact.start != store_fact.end
+            and store_fact.pk not in self.by_pk.keys()
+        )
+
+    def prefetch_adjacent_group(self, offset):
+        group_index = self.groups.index(self.curr_group) + offset
+        if (group_index < 0) or (group_index >= len(self.groups)):
+            return None
+        return self.groups[group_index]
+
+    def prefetch_group_add(self, run_facts):
+        if not run_facts:
+            return
+        with self.fact_group_rekeyed():
+            for store_fact in run_facts:
+                self.curr_group.add(store_fact)
+                self.interner.intern_fact(store_fact)
+                self.by_pk[store_fact.pk] = store_fact
+                self.index_dirty_fact(store_fact)
@@ -17,6 +17,8 @@
 
 """"""
 
+from sortedcontainers import SortedDict, SortedList
+
 __all__ = (
     'FactsManager_Rift',
 )
@@ -27,30 +29,68 @@ class FactsManager_Rift(object):
     def __init__(self, *args, **kwargs):
         super(FactsManager_Rift, self).__init__()
 
-        self.time_rifts = []
+        # The rift times, kept sorted, so next/prev rift is a bisect away.
+        self.time_rifts = SortedList()
+        # An index of dirty Facts, keyed by sorty_tuple, so the first dirty
+        # Fact is always the first item. Because Facts in the groups are
+        # sometimes edited in place, remember each Fact's key when indexed,
+        # so that we can find it again on removal (see unindex_dirty_fact).
+        self.dirty_index = SortedDict()
+        self.dirty_keys = {}
+
+    # ***
+
+    def index_dirty_fact(self, some_fact):
+        if not some_fact.dirty:
+            return
+        self.unindex_dirty_fact(some_fact)
+        dirty_key = some_fact.sorty_tuple
+        self.dirty_index[dirty_key] = some_fact
+        self.dirty_keys[some_fact.pk] = dirty_key
+
+    def unindex_dirty_fact(self, some_fact):
+        try:
+            dirty_key = self.dirty_keys.pop(some_fact.pk)
+        except KeyError:
+            return
+        del self.dirty_index[dirty_key]
 
     # ***
 
     def place_time_rifts(self):
         def _place_time_rifts():
-            self.time_rifts = []
+            self.time_rifts.clear()
             for group in self.groups:
-                first_fact = self.find_first_dirty_from_group(group)
-                if first_fact is None:
-                    first_fact = group[0]
-                add_time_rift(first_fact)
+                self.place_time_rift_for_group(group)
             last_group_last_fact = self.groups[-1][-1]
-            if self.time_rifts[-1] != last_group_last_fact.start:
-                add_time_rift(last_group_last_fact)
-
-        def add_time_rift(some_fact):
-            self.controller.client_logger.debug(
-                'time_rifts: {}'.format(some_fact.start),
-            )
-            self.time_rifts.append(some_fact.start)
+            self.add_time_rift(last_group_last_fact)
 
         _place_time_rifts()
 
+    def place_time_rift_for_group(self, group):
+        first_fact = self.find_first_dirty_from_group(group)
+        if first_fact is None:
+            first_fact = group[0]
+        self.add_time_rift(first_fact)
+
+    def add_time_rift(self, some_fact):
+        if some_fact.start in self.time_rifts:
+            return
+        self.controller.client_logger.debug(
+            'time_rifts: {}'.format(some_fact.start),
+        )
+        self.time_rifts.add(some_fact.start)
+
+    def move_time_rift(self, was_start, some_fact):
+        # Called when an edit moves a Fact's start. If that Fact held
+        # a rift, let the rift follow the Fact to its new start time.
+        # (Note that rifts are simply times, so they survive groups
+        # merging (collapse_group) without further bookkeeping.)
+        if (was_start == some_fact.start) or (was_start not in self.time_rifts):
+            return
+        self.time_rifts.remove(was_start)
+        self.add_time_rift(some_fact)
+
     def find_rift_fact(self, is_next=False, is_prev=False):
         def _find_rift_fact():
             assert is_next ^ is_prev
@@ -66,27 +106,38 @@ class FactsManager_Rift(object):
             return rift_fact
 
         def drop_time_bounds():
+            curr_start = self.curr_fact.start
+            # The next rift is the first one after the current Fact's start,
+            # and the previous rift is the last one before it (a rift at
+            # exactly curr_start is the one we're on, so it's neither).
+            next_index = self.time_rifts.bisect_right(curr_start)
+            prev_index = self.time_rifts.bisect_left(curr_start) - 1
+            next_start = None
+            if next_index < len(self.time_rifts):
+                next_start = self.time_rifts[next_index]
             prev_start = None
-            for start_time in self.time_rifts:
-                if self.curr_fact.start < start_time:
-                    return (prev_start, start_time)
-                if start_time != self.curr_fact.start:
-                    prev_start = start_time
-            return (prev_start, None)
+            if prev_index >= 0:
+                prev_start = self.time_rifts[prev_index]
+            return (prev_start, next_start)
 
         return _find_rift_fact()
 
     def find_first_dirty(self):
-        for group in self.groups:
-            first_dirty_fact = self.find_first_dirty_from_group(group)
-            if first_dirty_fact is not None:
-                return first_dirty_fact
+        if self.dirty_index:
+            _dirty_key, first_dirty_fact = self.dirty_index.peekitem(0)
+            return first_dirty_fact
         # None edited/dirty. Fall back on last fact (most recent).
         return self.groups[-1][-1]
 
     def find_first_dirty_from_group(self, group):
-        for fact in group:
-            if fact.dirty:
-                return fact
+        if group.time_since is None:
+            return None
+        for dirty_key in self.dirty_index.irange(minimum=(group.time_since,)):
+            if dirty_key[0] > group.time_until:
+                break
+            dirty_fact = self.dirty_index[dirty_key]
+            if (dirty_key[0] == group.time_until) and (group[-1] is not dirty_fact):
+                # Fact starts where this group ends, so it's the next group's.
+                break
+            return dirty_fact
         return None
-
@@ -91,7 +91,7 @@ class FactsManager_RiftDec(object):
                         pass
                 return first_group, first_fact
             self.controller.affirm(first_fact.prev_fact is None)
-            oldest_fact = self.controller.find_oldest_fact()
+            oldest_fact = self.store_oldest_fact()
             if not oldest_fact:
                 self.controller.affirm(first_fact.unstored)
             else:
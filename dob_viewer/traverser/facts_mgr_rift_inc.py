@@ -101,7 +101,7 @@ class FactsManager_RiftInc(object):
                         pass
                 return final_group, final_fact
             self.controller.affirm(final_fact.next_fact is None)
-            latest_fact = self.controller.find_latest_fact()
+            latest_fact = self.store_latest_fact()
             if not latest_fact:
                 # Empty database, meaning local Facts unsaved.
                 self.controller.affirm(final_fact.unstored)
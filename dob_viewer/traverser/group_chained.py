@@ -38,27 +38,14 @@ def integer_range_groupify(integers):
         srtd = sorted(map(int, integers))
         return assemble_groups(srtd)
 
-    def range_key_recursive(srtd, ix):
-        if ix[0] == 0:
-            # Very first item, so always start of group.
-            return ix[1]
-        prev_idx = ix[0] - 1
-        prev_val = int(srtd[prev_idx])
-        if ix[1] == prev_val + 1:
-            # Previous item value is 1 before this one, so walk backwards.
-            return range_key_recursive(srtd, (prev_idx, prev_val,))
-        return ix[1]
-
-    def range_key(srtd, ix):
-        key = range_key_recursive(srtd, ix)
-        # print('ix:', ix, 'key:', key)
-        return key
+    def range_key(ix):
+        # Each run of consecutive integers shares the same value less index,
+        # so one pass groups them (rather than walking back from each item).
+        return ix[1] - ix[0]
 
     def assemble_groups(srtd):
         grouped = []
-        for key, grp in groupby(enumerate(srtd), lambda ix: range_key(srtd, ix)):
-            # print('key: {} / grp: {} {}'.format(key, grp, list(grp)))
-            # print(list(map(itemgetter(1), grp)))
+        for key, grp in groupby(enumerate(srtd), range_key):
             grouped.append(list(map(itemgetter(1), grp)))
         return grouped
 
@@ -88,6 +75,15 @@ class GroupChained(object):
     a mix of stored Facts, new Facts, and gap Facts.
     Or even no Facts, if group is simply claiming time.
     """
+    # (lb): A session can collect tens of thousands of groups, so skip the
+    # per-instance __dict__ (and check your attribute names against this).
+    __slots__ = (
+        'facts',
+        'time_since',
+        'time_until',
+        'affirm',
+    )
+
     # FIXME/2019-12-06: (lb): Just testing. Remove affirm arg. later.
     # def __init__(self, facts=None):
     def __init__(self, facts=None, affirm=None):
@@ -189,6 +189,7 @@ class KeyBonder(object):
 
         key_bonds += self._key_bonds(action_map, 'rotate_help')
         key_bonds += self._key_bonds(action_map, 'dev_breakpoint')
+        key_bonds += self._key_bonds(action_map, 'dev_profile_overlay')
 
         key_bonds += self._key_bonds(action_map, 'jump_fact_dec')
         key_bonds += self._key_bonds(action_map, 'jump_fact_inc')
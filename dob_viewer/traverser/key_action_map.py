@@ -60,6 +60,67 @@ class KeyActionMap(object):
 
         # ***
 
+        @classmethod
+        def profile_action(cls, func):
+            def wrapper(obj, event, *args, **kwargs):
+                name = func.__name__
+                carousel = obj.carousel
+                with carousel.action_profiler.action(name):
+                    with carousel.store_counter.action(name):
+                        func(obj, event, *args, **kwargs)
+
+            return update_wrapper(wrapper, func)
+
+        # ***
+
+        @classmethod
+        def queue_while_loading(cls, func):
+            def wrapper(obj, event, *args, **kwargs):
+                # If the Carousel is waiting on the store, hold this keystroke
+                # until the load finishes, so that commands run in key order.
+                store_loader = obj.carousel.store_loader
+                if store_loader.busy:
+                    store_loader.defer(lambda: func(obj, event, *args, **kwargs))
+                    return
+                func(obj, event, *args, **kwargs)
+
+            return update_wrapper(wrapper, func)
+
+        # ***
+
+        @classmethod
+        def coalesce_repeats(cls, func):
+            def wrapper(obj, event, *args, **kwargs):
+                update_handler = obj.update_handler
+                update_handler.repeat_count = 1 + pop_queued_repeats(obj, event)
+                try:
+                    func(obj, event, *args, **kwargs)
+                finally:
+                    # Lest a stale count leak into the next action, e.g., if
+                    # the handler bailed out before it popped the count.
+                    update_handler.repeat_count = 1
+
+            def pop_queued_repeats(obj, event):
+                # If the user holds a key down, and the repeats arrive faster
+                # than we can handle them, they pile up in PTK's input queue.
+                # Swallow those already waiting, and run the action once, with
+                # a count, so that only the final state gets built (and drawn).
+                # - Skip if replaying keys deferred while loading, lest we run
+                #   queued keys ahead of those deferred before them.
+                if len(event.key_sequence) != 1 or obj.carousel.store_loader.busy:
+                    return 0
+                input_queue = event.key_processor.input_queue
+                pressed_key = event.key_sequence[0].key
+                repeats = 0
+                while input_queue and input_queue[0].key == pressed_key:
+                    input_queue.popleft()
+                    repeats += 1
+                return repeats
+
+            return update_wrapper(wrapper, func)
+
+        # ***
+
         @classmethod
         def refresh_now(cls, func):
             def wrapper(obj, event, *args, **kwargs):
@@ -124,25 +185,33 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.widget_focus().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def focus_next(self, event):
         self.zone_manager.focus_next(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def focus_previous(self, event):
         self.zone_manager.focus_previous(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_time_start(self, event):
         self.zone_manager.toggle_focus_time_start(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_time_end(self, event):
@@ -150,25 +219,33 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.save_and_quit().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def save_edited_and_live(self, event):
         self.carousel.save_edited_and_live(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def save_edited_and_exit(self, event):
         self.carousel.save_edited_and_exit(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def exit_command(self, event):
         self.carousel.exit_command(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def exit_quietly(self, event):
@@ -179,19 +256,25 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.edit_time().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_time_enter(self, event):
         self.zone_details.edit_time_enter(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def toggle_focus_description(self, event):
         self.zone_details.toggle_focus_description(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_time_any_key(self, event):
@@ -199,25 +282,33 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.undo_redo().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def undo_command_content(self, event):
         self.update_handler.undo_command(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def redo_command_content(self, event):
         self.update_handler.redo_command(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def undo_command_edit_time(self, event):
         self.zone_details.undo_command(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def redo_command_edit_time(self, event):
@@ -225,19 +316,25 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.shortcuts().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def copy_complete_and_paste_active(self, event):
         self.update_handler.copy_complete_and_paste_active(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def copy_complete_and_paste_new(self, event):
         self.update_handler.copy_complete_and_paste_new(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def complete_and_prompt_new(self, event):
@@ -245,7 +342,9 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.custom_factoids().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def custom_factoid_paste(self, event):
@@ -253,29 +352,46 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.normal().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def rotate_help(self, event):
         self.zone_content.rotate_help(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def dev_breakpoint(self, event):
         self.carousel.dev_breakpoint(event)
 
+    @Decorators.queue_while_loading
+    @Decorators.debug_log_trace_enter_leave
+    @Decorators.refresh_now
+    @Decorators.intercept_modifier(reset=True)
+    def dev_profile_overlay(self, event):
+        self.carousel.dev_profile_overlay(event)
+
     # *** Next/Prev: Fact
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def jump_fact_dec(self, event):
         self.zone_manager.jump_fact_dec(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def jump_fact_inc(self, event):
         try:
             self.zone_manager.jump_fact_inc(event)
@@ -286,13 +402,17 @@ class KeyActionMap(object):
 
     # *** Next/Prev: Day
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
     def jump_day_dec(self, event):
         self.zone_manager.jump_day_dec(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
     def jump_day_inc(self, event):
@@ -300,13 +420,17 @@ class KeyActionMap(object):
 
     # *** Next/Prev: Rift
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
     def jump_rift_dec(self, event):
         self.zone_manager.jump_rift_dec(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
     def jump_rift_inc(self, event):
@@ -314,13 +438,17 @@ class KeyActionMap(object):
 
     # *** First/Final: Fact
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def jump_fact_first(self, event):
         self.zone_manager.jump_fact_first(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def jump_fact_final(self, event):
@@ -328,13 +456,17 @@ class KeyActionMap(object):
 
     # *** Up/Down: Content Cursor Motion
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
     def cursor_up_one(self, event):
         self.zone_content.cursor_up_one(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
     def cursor_down_one(self, event):
@@ -342,25 +474,33 @@ class KeyActionMap(object):
 
     # *** Up/Down/Top/Bottom: Content Scrolling
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def scroll_up(self, event):
         self.zone_content.scroll_up(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def scroll_down(self, event):
         self.zone_content.scroll_down(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def scroll_top(self, event):
         self.zone_content.scroll_top(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def scroll_bottom(self, event):
@@ -368,25 +508,33 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.edit_fact().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_fact(self, event):
         self.update_handler.edit_fact(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_actegory(self, event):
         self.update_handler.edit_actegory(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_description(self, event):
         self.update_handler.edit_description(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def edit_tags(self, event):
@@ -394,81 +542,117 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.nudge_time().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_decrement_start(self, event):
         self.update_handler.edit_time_decrement_start(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_increment_start(self, event):
         self.update_handler.edit_time_increment_start(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_decrement_end(self, event):
         self.update_handler.edit_time_decrement_end(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_increment_end(self, event):
         self.update_handler.edit_time_increment_end(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_decrement_both(self, event):
         self.update_handler.edit_time_decrement_both(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_increment_both(self, event):
         self.update_handler.edit_time_increment_both(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_decrement_start_5min(self, event):
         self.update_handler.edit_time_decrement_start_5min(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_increment_start_5min(self, event):
         self.update_handler.edit_time_increment_start_5min(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_decrement_end_5min(self, event):
         self.update_handler.edit_time_decrement_end_5min(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier()
+    @Decorators.coalesce_repeats
     def edit_time_increment_end_5min(self, event):
         self.update_handler.edit_time_increment_end_5min(event)
 
     # #### Key bindings wired by KeyBonder.command_modifier().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def allow_time_gap(self, event):
         self.update_handler.allow_time_gap(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     # Not necessary: @Decorators.intercept_modifier()
     # (because gaits to the same handler anyway).
     def command_modifier_any_key(self, event):
         self.update_handler.command_modifier_any_key(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     # NOPE: @Decorators.intercept_modifier()
     def backspace_command_modifier(self, event):
@@ -478,25 +662,33 @@ class KeyActionMap(object):
 
     # FIXME/2020-04-11: Remove these, or implement!
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_split(self, event):
         self.update_handler.fact_split(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_erase(self, event):
         self.update_handler.fact_erase(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_merge_prev(self, event):
         self.update_handler.fact_merge_prev(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_merge_next(self, event):
@@ -504,37 +696,49 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.clipboard().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_copy_fact(self, event):
         self.update_handler.fact_copy_fact(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_cut(self, event):
         self.update_handler.fact_cut(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_paste(self, event):
         self.update_handler.fact_paste(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_copy_activity(self, event):
         self.update_handler.fact_copy_activity(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_copy_tags(self, event):
         self.update_handler.fact_copy_tags(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def fact_copy_description(self, event):
@@ -542,7 +746,9 @@ class KeyActionMap(object):
 
     # #### Key bindings wired by KeyBonder.begin_commando().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def begin_commando(self, event):
@@ -555,35 +761,47 @@ class KeyActionMap(object):
     #
     #   NOPE: @Decorators.intercept_modifier
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def cancel_commando(self, event):
         self.update_handler.cancel_commando(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def parts_commando(self, event):
         self.update_handler.parts_commando(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def backspace_commando(self, event):
         self.update_handler.backspace_commando(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def final_commando(self, event):
         self.update_handler.final_commando(event)
 
     # #### Key bindings wired by KeyBonder.begin_delta_time().
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def begin_delta_time_start(self, event):
         self.update_handler.begin_delta_time_start(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     @Decorators.intercept_modifier(reset=True)
     def begin_delta_time_end(self, event):
@@ -596,34 +814,46 @@ class KeyActionMap(object):
     #
     #   NOPE: @Decorators.intercept_modifier
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def cancel_delta_time(self, event):
         self.update_handler.cancel_delta_time(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def parts_delta_time(self, event):
         self.update_handler.parts_delta_time(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def backspace_delta_time(self, event):
         self.update_handler.backspace_delta_time(event)
 
     # Elsewhere: allow_time_gap (Wired by KeyBonder.command_modifier, too).
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def final_delta_time_apply(self, event):
         self.update_handler.final_delta_time_apply(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def final_delta_time_minutes(self, event):
         self.update_handler.final_delta_time_minutes(event)
 
+    @Decorators.queue_while_loading
     @Decorators.debug_log_trace_enter_leave
+    @Decorators.profile_action
     @Decorators.refresh_now
     def final_delta_time_hours(self, event):
         self.update_handler.final_delta_time_hours(event)
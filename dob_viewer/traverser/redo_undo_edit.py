@@ -20,6 +20,9 @@
 import time
 from collections import namedtuple
 
+from .fact_version import same_facts
+from .staged_fact import staged_copy
+
 __all__ = (
     'RedoUndoEdit',
     'UndoRedoTuple',
@@ -90,7 +93,7 @@ class RedoUndoEdit(object):
     def undoable_changes(self, what, *edit_facts):
         edit_facts = list(filter(None, edit_facts))
         edit_fact_copies = [
-            edit_fact.copy() for edit_fact in edit_facts if edit_fact is not None
+            staged_copy(edit_fact) for edit_fact in edit_facts if edit_fact is not None
         ]
         self.controller.affirm(len(edit_fact_copies) > 0)
         undoable_changes = UndoRedoTuple(
@@ -102,7 +105,7 @@ class RedoUndoEdit(object):
 
     def remove_undo_if_nothing_changed(self, edit_facts):
         last_edits = self.undo_peek()
-        if last_edits.pristine == edit_facts:
+        if same_facts(last_edits.pristine, edit_facts):
             # Nothing changed.
             toss_changes = self.undo.pop()
             self.debug('pop!: no.: {}'.format(len(toss_changes)))
@@ -126,7 +129,7 @@ class RedoUndoEdit(object):
                 (not append)
                 and (
                     (undo_changes.altered is None)
-                    or (undo_changes.altered == edit_facts)
+                    or same_facts(undo_changes.altered, edit_facts)
                 )
             )
             or (
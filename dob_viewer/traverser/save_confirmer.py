@@ -15,10 +15,7 @@
 # If you lost the GNU General Public License that ships with this software
 # repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
 
-from dob_bright.styling.load_styling import load_style_classes, load_style_rules
-from dob_bright.styling.load_ignore import load_no_completion
-
-from .content_lexer import load_content_lexer
+from nark.helpers.dev.profiling import profile_elapsed
 
 
 __all__ = (
@@ -37,6 +34,11 @@ def prompt_and_save_confirmer(
     **kwargs,
 ):
     """"""
+    # Lazy-load the styling and lexer loaders, which pull in PTK, so that
+    # importing this module stays cheap for commands that never open the editor.
+    from dob_bright.styling.load_styling import load_style_classes, load_style_rules
+
+    from .content_lexer import load_content_lexer
 
     try:
         style_classes = controller.style_conf
@@ -46,7 +48,9 @@ def prompt_and_save_confirmer(
         style_classes = load_style_classes(controller)
     rules_confobj = load_style_rules(controller)
     content_lexer = load_content_lexer(controller)
-    no_completion = load_no_completion(controller)
+    # The no-completion lists are only needed by the act@gory and tags
+    # prompter, so the Carousel loads them the first time it's shown.
+    profile_elapsed('To dob styling')
 
     # Lazy-load the carousel and save ~0.065s.
     from dob_viewer.traverser.carousel import Carousel
@@ -60,7 +64,6 @@ def prompt_and_save_confirmer(
         style_classes=style_classes,
         rules_confobj=rules_confobj,
         content_lexer=content_lexer,
-        no_completion=no_completion,
     )
 
     ready_facts = carousel.gallop(**kwargs)
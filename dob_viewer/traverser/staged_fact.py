@@ -0,0 +1,85 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Cheap Fact copies, for staging edits and for the undo stack."""
+
+from dob_bright.crud.fact_dressed import FactDressed
+from nark.items.tag import Tag
+
+__all__ = (
+    'staged_copy',
+)
+
+
+# (lb): The fields that FactDressed.copy() carries over from its source.
+# - Not copied: 'viewer_version', so that the copy reads as a new version
+#   (see fact_version); and 'next_fact' and 'prev_fact', which are wired
+#   separately, if the copy ever joins a fact-group.
+_SHARED_FIELDS = (
+    '_description',
+    '_end',
+    '_start',
+    'activity',
+    'parsed_source',
+    'pk',
+    'split_from',
+)
+
+
+def staged_copy(fact):
+    """Returns a copy of the Fact, same as FactDressed.copy(), but cheaper.
+
+    FactDressed.copy() runs the Fact constructor, which re-validates the
+    start and end times and rebuilds the tags from a set, which costs a
+    dozen or so microseconds per copy. Copying the (already valid) fields
+    directly is some five times faster, and the Carousel copies at
+    least one Fact, and often three, for every edit the user makes.
+
+    Each copy gets its own tags list and dirty_reasons set, which are the
+    only mutable fields the editor changes in place, so that changing the
+    copy never changes the original (nor vice versa). The activity, tags,
+    and other values are shared, as FactDressed.copy() shares them, too.
+    """
+    def _staged_copy():
+        if not can_stage(fact):
+            # Something other than what we load from the store, so play it safe.
+            return fact.copy()
+        return copy_fields()
+
+    def can_stage(fact):
+        if type(fact) is not FactDressed:
+            return False
+        return all(isinstance(tag, Tag) for tag in fact.tags)
+
+    def copy_fields():
+        new_fact = FactDressed.__new__(FactDressed)
+        fields = fact.__dict__
+        new_fields = new_fact.__dict__
+        for field in _SHARED_FIELDS:
+            new_fields[field] = fields[field]
+        new_fact.name = None
+        new_fact.deleted = bool(fact.deleted)
+        # (lb): Unlike copy(), skip deduping the tags through a set(): Tag
+        # hashing is slow, and tags are already unique, per tags_replace().
+        new_fact.tags = list(fact.tags)
+        new_fact.dirty_reasons = set(fact.dirty_reasons)
+        new_fact.orig_fact = fact.orig_fact or fact
+        new_fact.next_fact = None
+        new_fact.prev_fact = None
+        return new_fact
+
+    return _staged_copy()
@@ -19,6 +19,7 @@
 
 from datetime import timedelta
 
+from .fact_version import bump_fact_version, same_facts
 from .redo_undo_edit import UndoRedoTuple
 
 __all__ = (
@@ -57,6 +58,7 @@ class StartEndEdit(object):
             newest_changes = _undoable_changes(edit_fact, edit_prev, edit_next)
             adjust_time(edit_fact, edit_prev, edit_next)
             adjust_time_fix_overlaps(edit_fact, edit_prev, edit_next)
+            bump_fact_version(edit_fact, edit_prev, edit_next)
             debug_log_facts('edit-time-final', edit_fact, edit_prev, edit_next)
             post_process_edited(newest_changes)
 
@@ -152,10 +154,12 @@ class StartEndEdit(object):
             )
             self.controller.affirm(
                 (newest_changes is last_undo_or_newest_changes)
-                or (newest_changes.pristine == last_undo_or_newest_changes.altered)
+                or same_facts(
+                    newest_changes.pristine, last_undo_or_newest_changes.altered,
+                )
             )
 
-            if newest_changes.pristine == last_undo_or_newest_changes.altered:
+            if same_facts(newest_changes.pristine, last_undo_or_newest_changes.altered):
                 # Nothing changed! We're done here. E.g., given a completed Fact
                 # that is exactly 30 minutes long, if you typed '+30<TAB>' to set
                 # end to 30 minutes after start, if we kept going, the fact would
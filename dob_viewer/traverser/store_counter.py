@@ -0,0 +1,203 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Facts Carousel Store Call Counter"""
+
+import time
+from contextlib import contextmanager
+
+from gettext import gettext as _
+
+__all__ = (
+    'StoreCounter',
+)
+
+
+class StoreCounter(object):
+    """Counts and times the Carousel's store calls, per key action.
+
+    Wraps the controller methods the Carousel uses to reach the store
+    (while the Carousel runs), so we can see how many calls each action
+    makes; logs calls slower than ``dev.slow_store_call_msecs``; and, if
+    ``dev.report_store_calls``, prints a summary on exit.
+    """
+
+    # The (controller attribute, method name) of each store call we count.
+    STORE_CALLS = (
+        (None, 'find_latest_fact'),
+        (None, 'find_oldest_fact'),
+        ('facts', 'antecedent'),
+        ('facts', 'get_all'),
+        ('facts', 'save'),
+        ('facts', 'subsequent'),
+    )
+
+    def __init__(self, controller):
+        self.controller = controller
+        # Call counts and total secs, by method name.
+        self.calls = {}
+        self.secs = {}
+        # Call counts for each run of each action, by action name.
+        self.action_calls = {}
+        # The action being tallied, and its store calls so far.
+        self.action_name = None
+        self.action_count = None
+        # How deep we are in wrapped store calls, e.g., find_latest_fact
+        # calls facts.get_all, but that's only one trip to the store.
+        self.call_depth = 0
+        self.installed = []
+
+    # ***
+
+    def install(self):
+        """Wraps each store call on the controller (or its facts manager)."""
+        if self.installed:
+            return
+        for attr, method_name in StoreCounter.STORE_CALLS:
+            manager = getattr(self.controller, attr) if attr else self.controller
+            setattr(manager, method_name, self.wrap(method_name, manager))
+            self.installed.append((manager, method_name))
+
+    def uninstall(self):
+        for manager, method_name in self.installed:
+            # Remove the instance attribute, which reveals the class method.
+            delattr(manager, method_name)
+        self.installed = []
+
+    def wrap(self, method_name, manager):
+        store_call = getattr(manager, method_name)
+
+        def counted_store_call(*args, **kwargs):
+            # Only count (and time) the outermost store call.
+            if self.call_depth:
+                return store_call(*args, **kwargs)
+            self.call_depth += 1
+            began = time.perf_counter()
+            try:
+                return store_call(*args, **kwargs)
+            finally:
+                self.call_depth -= 1
+                self.count(method_name, time.perf_counter() - began)
+
+        return counted_store_call
+
+    def count(self, method_name, elapsed):
+        self.calls.setdefault(method_name, 0)
+        self.calls[method_name] += 1
+        self.secs.setdefault(method_name, 0.0)
+        self.secs[method_name] += elapsed
+        if self.action_count is not None:
+            self.action_count += 1
+        slow_msecs = self.controller.config['dev.slow_store_call_msecs']
+        if slow_msecs and (elapsed * 1000) >= slow_msecs:
+            self.controller.client_logger.warning(
+                _('Slow store call: {} took {:.1f} msecs.').format(
+                    method_name, elapsed * 1000,
+                )
+            )
+
+    # ***
+
+    @contextmanager
+    def action(self, name):
+        """Tallies the store calls made by the key action."""
+        # Replayed actions (see StoreLoader) may run within another action.
+        if self.action_count is not None:
+            yield
+            return
+        self.action_name = name
+        self.action_count = 0
+        try:
+            yield
+        finally:
+            self.action_calls.setdefault(name, []).append(self.action_count)
+            self.action_name = None
+            self.action_count = None
+
+    def charge_action(self, fetch):
+        """Wraps fetch so its store calls count against the current action.
+
+        E.g., StoreLoader runs store-bound work after the action returns.
+        """
+        name = self.action_name
+        if name is None:
+            return fetch
+
+        def charged_fetch():
+            if self.action_count is not None:
+                return fetch()
+            self.action_count = 0
+            try:
+                return fetch()
+            finally:
+                self.action_calls[name][-1] += self.action_count
+                self.action_count = None
+
+        return charged_fetch
+
+    # ***
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    @contextmanager
+    def assert_calls(self, expected):
+        """Asserts the block makes the expected number of store calls.
+
+        E.g., ``with store_counter.assert_calls(0): ...``.
+        """
+        began_calls = self.total_calls
+        yield
+        made_calls = self.total_calls - began_calls
+        assert made_calls == expected, _(
+            'Expected {} store call(s), but counted {}.'
+        ).format(expected, made_calls)
+
+    def assert_action_calls(self, name, expected):
+        """Asserts each run of the named key action made the expected store calls.
+
+        E.g., ``store_counter.assert_action_calls('jump_fact_inc', 0)``.
+        """
+        runs = self.action_calls.get(name)
+        assert runs, _('The action “{}” never ran.').format(name)
+        assert all(calls == expected for calls in runs), _(
+            'Expected {} store call(s) per “{}”, but counted: {}.'
+        ).format(expected, name, runs)
+
+    # ***
+
+    def format_summary(self):
+        """Returns the session's store calls as a plain text table."""
+        if not self.calls:
+            return _('No store calls made.')
+        name_width = max(len(name) for name in self.calls)
+        lines = ['{}  {:>7} {:>9}'.format(
+            _('store call').ljust(name_width), _('count'), _('msecs.'),
+        )]
+        for name in sorted(self.calls, key=self.secs.get, reverse=True):
+            lines.append('{}  {:>7} {:>9.1f}'.format(
+                name.ljust(name_width), self.calls[name], self.secs[name] * 1000,
+            ))
+        for name in sorted(self.action_calls):
+            runs = self.action_calls[name]
+            if not any(runs):
+                continue
+            lines.append(_('{}: {} store call(s) over {} run(s)').format(
+                name, sum(runs), len(runs),
+            ))
+        return '\n'.join(lines)
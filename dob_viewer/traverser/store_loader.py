@@ -0,0 +1,137 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Facts Carousel Store Loader"""
+
+from collections import deque
+
+from gettext import gettext as _
+
+from .exceptions import catch_action_exception
+
+__all__ = (
+    'StoreLoader',
+)
+
+
+class StoreLoader(object):
+    """"""
+    def __init__(self, carousel):
+        self.carousel = carousel
+        # Each queued entry is a (fetch, finish, store_bound) tuple.
+        self.queued = deque()
+        self.loading = False
+
+    # ***
+
+    # (lb): The store is SQLAlchemy-backed, and nark hands us one Session
+    # that's bound to whatever thread opened it (and SQLite refuses to share
+    # its connection across threads, besides). So rather than push queries
+    # to a worker thread, we get them out from under the key handler: the
+    # handler returns straightaway, we paint a 'Loading…' status, and only
+    # after that frame renders do we run the query. Keystrokes that arrive
+    # in the meantime are queued and replayed in order once it finishes.
+
+    def load(self, fetch, finish, store_bound=True):
+        """Runs fetch (which may query the store) and passes its result to finish.
+
+        If store_bound is False, and nothing is already loading, both run
+        at once, as before. Otherwise, the work is queued behind any pending
+        load, and store-bound work is not run until the UI shows it's loading.
+        """
+        if not store_bound and not self.busy:
+            finish(fetch())
+            return
+        fetch = self.carousel.store_counter.charge_action(fetch)
+        fetch = self.carousel.action_profiler.charge_action(fetch)
+        finish = self.carousel.action_profiler.charge_action(finish)
+        self.queued.append((fetch, finish, store_bound))
+        if not self.loading:
+            self.schedule_next()
+
+    def defer(self, action):
+        """Queues an action that does not need the store behind pending loads."""
+        self.queued.append((action, None, False))
+
+    @property
+    def busy(self):
+        return self.loading or bool(self.queued)
+
+    def reset(self):
+        """Forgets pending work, e.g., when the Application is rebuilt."""
+        self.queued.clear()
+        self.loading = False
+
+    # ***
+
+    def schedule_next(self):
+        def _schedule_next():
+            # Mark busy first, so replayed actions queue rather than recurse.
+            self.loading = True
+            run_until_store_bound()
+            if not self.queued:
+                self.loading = False
+                return
+            self.carousel.zone_manager.update_status(_('Loading…'))
+            application = self.carousel.zone_manager.application
+            if not application.is_running:
+                self.load_queued()
+                return
+            application.after_render += after_render
+            application.invalidate()
+
+        def run_until_store_bound():
+            while self.queued and not self.queued[0][2]:
+                self.run_queued(self.queued.popleft())
+
+        def after_render(application):
+            application.after_render -= after_render
+            # Let the renderer finish flushing before we tie up the loop.
+            self.carousel.event_loop.call_soon(self.load_queued)
+
+        _schedule_next()
+
+    @catch_action_exception
+    def load_queued(self, event=None):
+        """"""
+        if not self.queued:
+            # The queue was reset since this was scheduled, e.g., the Carousel
+            # exited and re-entered its runloop, reusing the same Application.
+            return
+        self.carousel.zone_manager.zone_lowdown.reset_status()
+        try:
+            self.run_queued(self.queued.popleft())
+        except Exception:
+            # Drop whatever the user queued behind the failed load, otherwise
+            # the Carousel would stay stuck 'loading'.
+            self.queued.clear()
+            self.loading = False
+            raise
+        self.schedule_next()
+        self.carousel.zone_manager.application.invalidate()
+
+    def run_queued(self, queued):
+        # Anything this entry queues goes ahead of what was already waiting.
+        waiting, self.queued = self.queued, deque()
+        try:
+            fetch, finish, _store_bound = queued
+            result = fetch()
+            if finish is not None:
+                finish(result)
+        finally:
+            self.queued.extend(waiting)
+
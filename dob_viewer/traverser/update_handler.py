@@ -37,6 +37,8 @@ class UpdateHandler(object):
         self.carousel = carousel
         self.long_press_multiplier_init()
         self.command_modifier_init()
+        # The number of like key presses coalesced into the current action.
+        self.repeat_count = 1
 
     def long_press_multiplier_init(self):
         self.last_time_time_adjust = None
@@ -309,10 +311,17 @@ class UpdateHandler(object):
         self.edit_time_adjust(5, 'end')
 
     def edit_time_adjust(self, delta_mins, start_or_end, end_maybe=None):
+        # Sum coalesced key repeats into one delta, and adjust the model once.
+        # The command modifier scales only the first press, and the long-press
+        # multiplier is tallied for each press, as though handled separately.
+        repeat_count = self.pop_repeat_count()
         modifier = self.command_modifier_parse()
+        press_mins = delta_mins
         if modifier is not None:
-            delta_mins *= modifier
-        delta_time = self.edit_time_multiplier(delta_mins)
+            press_mins *= modifier
+        delta_time = self.edit_time_multiplier(press_mins)
+        for _press in range(repeat_count - 1):
+            delta_time += self.edit_time_multiplier(delta_mins)
         self.edits_manager.edit_time_adjust(
             delta_time,
             start_or_end,
@@ -707,13 +716,20 @@ class UpdateHandler(object):
         return delta_time
 
     def apply_count_multiplier(self, count=1, floats=False):
+        # Coalesced key repeats count once each, as though the command
+        # modifier had been used up by the first press.
+        count_repeats = count * (self.pop_repeat_count() - 1)
         modifier = self.command_modifier_parse()
         if modifier is not None:
             count = count * modifier
             if not floats:
                 count = int(count)
         self.reset_time_multipliers()
-        return count
+        return count + count_repeats
+
+    def pop_repeat_count(self):
+        repeat_count, self.repeat_count = self.repeat_count, 1
+        return repeat_count
 
     def reset_time_multipliers(self):
         self.command_modifier_reset()
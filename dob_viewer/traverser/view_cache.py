@@ -0,0 +1,58 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Facts Carousel Rendered View Cache"""
+
+from collections import OrderedDict
+
+__all__ = (
+    'ViewCache',
+)
+
+
+class ViewCache(object):
+    """A bounded LRU of rendered zone outputs, keyed by Fact and view settings.
+
+    Because the version stamp of each Fact (see fact_version) is part of
+    its key, an edited Fact misses the cache, and its stale views age out.
+    Call clear to forget everything, e.g., if the style rules change.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.views = OrderedDict()
+
+    def __len__(self):
+        return len(self.views)
+
+    def get(self, key):
+        try:
+            view = self.views[key]
+        except KeyError:
+            return None
+        self.views.move_to_end(key)
+        return view
+
+    def put(self, key, view):
+        if not self.maxsize:
+            return
+        self.views[key] = view
+        self.views.move_to_end(key)
+        while len(self.views) > self.maxsize:
+            self.views.popitem(last=False)
+
+    def clear(self):
+        self.views.clear()
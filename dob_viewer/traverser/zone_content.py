@@ -22,6 +22,9 @@ from functools import update_wrapper
 from prompt_toolkit.filters import Always, Never
 from prompt_toolkit.widgets import Frame, TextArea
 
+from ..ptkui.virtual_text_area import VirtualTextArea
+
+from .description_view import DescriptionView
 from .exceptions import catch_action_exception
 from .zone_helpful import NUM_HELP_PAGES, render_carousel_help
 
@@ -35,6 +38,9 @@ class ZoneContent(object):
     def __init__(self, carousel):
         self.carousel = carousel
         self.showing_help = 0
+        self.description_view = DescriptionView('')
+        # The view being shown, either of the description, or of the help.
+        self.content_view = self.description_view
         # For your convenience, attributes to eliminate one object hop.
         self.content_lexer = self.carousel.content_lexer
         self.style_classes = self.carousel.style_classes
@@ -65,6 +71,7 @@ class ZoneContent(object):
         self.scrollable_height = self.style_classes['content-height']
         self.scrollable_width = self.style_classes['content-width']
         self.enable_wrapping = self.style_classes['content-wrap']
+        self.virtual_content = self.carousel.controller.config['editor.virtual_content']
         self.setup_scrollable()
 
     # ***
@@ -106,6 +113,12 @@ class ZoneContent(object):
         #   Make `lexer` style option... or config option.
 
         def content_text_area(content_width):
+            if self.virtual_content:
+                return VirtualTextArea(
+                    width=content_width,
+                    height=self.scrollable_height,
+                    lexer=self.content_lexer,
+                )
             # Layout for displaying Fact description.
             # The Frame creates the border.
             text_area = TextArea(
@@ -155,24 +168,33 @@ class ZoneContent(object):
     def cursor_up_one(self, event):
         """"""
         count = self.carousel.update_handler.apply_count_multiplier()
+        if self.virtual_content:
+            self.content.cursor_up(count=count)
+            return
         self.content.buffer.cursor_up(count=count)
 
     @catch_action_exception
     def cursor_down_one(self, event):
         """"""
         count = self.carousel.update_handler.apply_count_multiplier()
+        if self.virtual_content:
+            self.content.cursor_down(count=count)
+            return
         self.content.buffer.cursor_down(count=count)
 
     @catch_action_exception
     def scroll_down(self, event):
         """"""
         view_height = self.view_height()
+        if self.virtual_content:
+            self.content.cursor_down(view_height)
+            return
         self.content.buffer.cursor_down(view_height)
         self.reset_cursor_left_column()
 
     def view_height(self):
         view_height = self.scrollable_height - 1
-        if self.content.buffer.document.cursor_position_row == 0:
+        if self.cursor_row() == 0:
             # If cursor is at home posit, first page down moves cursor
             # to bottom of view. So scroll additional page, otherwise
             # user would have to press PageDown twice to see more text.
@@ -182,26 +204,44 @@ class ZoneContent(object):
         )
         return view_height
 
+    def cursor_row(self):
+        if self.virtual_content:
+            return self.content.cursor_row
+        return self.content.buffer.document.cursor_position_row
+
     @catch_action_exception
     def scroll_up(self, event):
         """"""
+        if self.virtual_content:
+            self.content.cursor_up(self.scrollable_height - 1)
+            return
         self.content.buffer.cursor_up(self.scrollable_height - 1)
         self.reset_cursor_left_column()
 
     @catch_action_exception
     def scroll_top(self, event):
         """"""
+        if self.virtual_content:
+            self.content.cursor_top()
+            return
         self.content.buffer.cursor_position = 0
 
     @catch_action_exception
     def scroll_bottom(self, event):
         """"""
+        if self.virtual_content:
+            # Jumps straight to the last row, without scanning the text.
+            self.content.cursor_bottom()
+            return
         self.content.buffer.cursor_position = len(self.content.buffer.text)
         self.reset_cursor_left_column()
 
     # ***
 
     def reset_cursor_left_column(self):
+        if self.virtual_content:
+            # The virtual content cursor is always in the first column.
+            return
         self.content.buffer.cursor_left(
             # PPT returns a relative distance, e.g., -7, or 0 if already there.
             # A similar command, get_cursor_left_position(), return -1 or 0.
@@ -211,11 +251,33 @@ class ZoneContent(object):
     # ***
 
     def rebuild_viewable(self):
-        content_text = self.apply_scrollable_style()
+        content_view = self.apply_scrollable_style()
+        self.replace_content_view(content_view)
+        return self.scrollable_frame.container
+
+    def replace_content_view(self, content_view):
+        self.content_view = content_view
+        if self.virtual_content:
+            self.content.set_view(content_view)
+        else:
+            self.replace_content_text(content_view.wrapped_text)
+
+    def replace_content_text(self, content_text):
+        if self.content.buffer.text is content_text:
+            # Same description as already shown, so skip rebuilding the Document.
+            return
         self.content.buffer.read_only = Never()
         self.content.buffer.text = content_text
         self.content.buffer.read_only = Always()
-        return self.scrollable_frame.container
+
+    def snapshot_viewable(self):
+        """"""
+        return (self.scrollable_frame.container.style, self.content_view)
+
+    def restore_viewable(self, snapshot):
+        """"""
+        self.scrollable_frame.container.style, content_view = snapshot
+        self.replace_content_view(content_view)
 
     def apply_scrollable_style(self):
         if self.showing_help:
@@ -229,7 +291,7 @@ class ZoneContent(object):
         #   (I tried passing HTML(CAROUSEL_HELP) but, uh, nope.)
         #   (This is not too important; I thought it might be nice
         #   (polishing feature) to beautify the help (even more).)
-        return render_carousel_help()
+        return DescriptionView(render_carousel_help())
 
     def apply_scrollable_style_fact(self):
         self.scrollable_frame.container.style = 'class:content-fact'
@@ -261,37 +323,19 @@ class ZoneContent(object):
             fact=curr_edit,
         )
 
-        content_text = curr_edit.description or ''
-
-        content_text = self.wrap_on_whitespace_maybe(content_text)
-
-        return content_text
+        return self.view_description(curr_edit.description)
 
-    def wrap_on_whitespace_maybe(self, content_text):
+    def view_description(self, description):
         # FIXME/BACKLOG/2019-01-21: Old comment:
         #   Make KeyBinding for toggling wrapping.
         #        Ideally, 3 options: wrap, no wrap, scrollbar.
         #          For now, wrap and no-wrap,
         #            (lb): b/c I do not know if horizontal scrollbar is easily doable.
-        if not self.enable_wrapping:
-            return content_text
-        lines_wrapped = ''
-        for line in content_text.splitlines():
-            line_wrapped = ''
-            while len(line) > 0:
-                if len(line) > self.content_width:
-                    space_idx = line.rfind(' ', 0, self.content_width)
-                    space_idx = self.content_width if space_idx < 1 else space_idx
-                    line_piece = line[:space_idx]
-                    space_idx += 1  # Do not write space at beginning of next line,
-                    line = line[space_idx:]
-                else:
-                    line_piece = line
-                    line = ''
-                line_wrapped += "\n" if line_wrapped else ''
-                line_wrapped += line_piece
-            lines_wrapped += line_wrapped + "\n"
-        return lines_wrapped
+        wrap_width = self.content_width if self.enable_wrapping else None
+        # Reuse the line index and wrapped text while the description is unchanged.
+        if not self.description_view.matches(description, wrap_width):
+            self.description_view = DescriptionView(description, wrap_width)
+        return self.description_view
 
     # ***
 
@@ -35,6 +35,7 @@ from dob_bright.crud.fix_times import must_complete_times
 from ..ptkui.dialog_overlay import show_message
 
 from .exceptions import catch_action_exception
+from .staged_fact import staged_copy
 from .zone_details_time_end import ZoneDetails_TimeEnd
 from .zone_details_time_start import ZoneDetails_TimeStart
 
@@ -58,6 +59,18 @@ class ZoneDetails(
 
     class HeaderKeyVal(object):
         """"""
+        __slots__ = (
+            'index',
+            'what_part',
+            'fact_attr',
+            'diff_kwargs',
+            'key_parts',
+            'val_label',
+            'text_area',
+            'orig_val',
+            'mouse_handler',
+        )
+
         def __init__(
             self,
             index,
@@ -304,6 +317,34 @@ class ZoneDetails(
 
     # ***
 
+    def snapshot_viewable(self):
+        """Returns the state of the widgets that only change with the Fact.
+
+        The duration and time widgets are excluded, because selectively_refresh
+        recomputes them, anyway.
+        """
+        labels = [self.blank_line]
+        for keyval_widgets in (
+            self.widgets_activity,
+            self.widgets_category,
+            self.widgets_tags,
+        ):
+            labels.append(keyval_widgets.val_label)
+            labels.extend(keyval_widgets.key_parts)
+        return [
+            (label, label.text, label.window.style, label.formatted_text_control.style)
+            for label in labels
+        ]
+
+    def restore_viewable(self, snapshot):
+        """"""
+        for label, text, window_style, control_style in snapshot:
+            label.text = text
+            label.window.style = window_style
+            label.formatted_text_control.style = control_style
+
+    # ***
+
     def selectively_refresh(self):
         # Update times and spans based off <now>.
         self.refresh_duration()
@@ -663,7 +704,7 @@ class ZoneDetails(
                 apply_edit_time_valid(edit_fact, edit_time)
 
         def apply_edit_time_valid(edit_fact, edit_time):
-            was_fact = edit_fact.copy()
+            was_fact = staged_copy(edit_fact)
             if self.active_widgets is self.widgets_start:
                 was_time = edit_fact.start_fmt_local
                 applied = self.apply_edit_time_start(
@@ -20,6 +20,7 @@
 from datetime import timedelta
 
 from .exceptions import catch_action_exception
+from .staged_fact import staged_copy
 
 __all__ = (
     'ZoneDetails_TimeEnd',
@@ -101,7 +102,7 @@ class ZoneDetails_TimeEnd(object):
         edited_facts = [edit_fact]
         edits_manager = self.carousel.edits_manager
         # Make undoable.
-        was_fact = edit_fact.copy()
+        was_fact = staged_copy(edit_fact)
         undoable_facts = [was_fact]
         # After apply_edit_time_removed_end, for editable_fact_next to not die.
         was_time = edit_fact.end
@@ -133,7 +134,7 @@ class ZoneDetails_TimeEnd(object):
                 and (edit_fact.end > edit_next.start)
             ) or edit_next.is_gap
             ):
-                undoable_facts.append(edit_next.copy())
+                undoable_facts.append(staged_copy(edit_next))
                 edit_next.start = was_time
                 edited_facts.append(edit_next)
             if edit_fact.end == edit_next.start:
@@ -20,6 +20,7 @@
 from datetime import timedelta
 
 from .exceptions import catch_action_exception
+from .staged_fact import staged_copy
 
 __all__ = (
     'ZoneDetails_TimeStart',
@@ -93,7 +94,7 @@ class ZoneDetails_TimeStart(object):
         edited_facts = [edit_fact]
         edits_manager = self.carousel.edits_manager
         # Make undoable.
-        was_fact = edit_fact.copy()
+        was_fact = staged_copy(edit_fact)
         undoable_facts = [was_fact]
         # Prohibit completely shadowing other facts' time windows, but allow
         # changing one fact's times to shorten the times of prev or next fact.
@@ -120,7 +121,7 @@ class ZoneDetails_TimeStart(object):
                 (edit_fact.start < edit_prev.end)
                 or edit_prev.is_gap
             ):
-                undoable_facts.append(edit_prev.copy())
+                undoable_facts.append(staged_copy(edit_prev))
                 edit_prev.end = edit_fact.start
                 edited_facts.append(edit_prev)
             if edit_fact.start == edit_prev.end:
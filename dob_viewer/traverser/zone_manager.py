@@ -42,6 +42,8 @@ from dob_bright.crud.facts_diff import FactsDiff
 from ..ptkui.dialog_overlay import alert_and_question
 
 from .exceptions import catch_action_exception
+from .fact_version import bump_fact_version, fact_version
+from .view_cache import ViewCache
 from .zone_content import ZoneContent
 from .zone_details import ZoneDetails
 from .zone_lowdown import ZoneLowdown
@@ -57,6 +59,7 @@ class ZoneManager(object):
     def __init__(self, carousel):
         self.carousel = carousel
         self.facts_diff = None
+        self.application = None
 
         self.zone_streamer = ZoneStreamer(self.carousel)
         self.zone_details = ZoneDetails(self.carousel)
@@ -66,6 +69,13 @@ class ZoneManager(object):
         self.alert_showing = False
         self.silence_alert_overlapped = False
 
+        self.prefetch_handle = None
+        self.idle_handle = None
+        self.stream_handle = None
+        self.view_cache = ViewCache(
+            self.carousel.controller.config['editor.view_cache_size'],
+        )
+
     # ***
 
     def standup(self):
@@ -85,6 +95,27 @@ class ZoneManager(object):
         self.application = self.build_application_object(**kwargs)
         self.rebuild_viewable()
 
+    def reshow(self):
+        """Readies the Application to run again, e.g., after the user was prompted."""
+        self.center_thyself()
+        self.rebuild_viewable()
+
+    @property
+    def reusable(self):
+        # The Application can be run again as-is if it exited in its resting
+        # state: normal bindings wired, content focused, and no overlays.
+        # Otherwise, e.g., if the user quit from an edit-time widget, build
+        # anew, which is the simplest way to reset all that state.
+        if self.application is None or self.application.is_running:
+            return False
+        key_bindings_normal = self.carousel.action_manager.key_bindings_normal
+        return (
+            self.application.key_bindings is key_bindings_normal
+            and self.layout.current_control is self.content_control
+            and not self.alert_showing
+            and not self.zone_details.active_widgets
+        )
+
     # ***
 
     def build_root_container(self):
@@ -142,6 +173,8 @@ class ZoneManager(object):
         return layout
 
     def setup_styling(self):
+        # Views rendered under the previous styles are no longer valid.
+        self.view_cache.clear()
         class_styles = self.carousel.style_classes['collect_tups']
         try:
             self.style = Style(class_styles)
@@ -196,6 +229,16 @@ class ZoneManager(object):
             return None
         return ColorDepth.DEPTH_24_BIT
 
+    def _min_redraw_interval(self):
+        # Cap the frame rate. Handlers and tick-tock change widgets and call
+        # invalidate() as they please, but PTK draws at most once per interval,
+        # so a storm of key presses (or a slow terminal) gets one frame for
+        # all the changes made in that window, rather than one per change.
+        max_fps = self.carousel.controller.config['editor.max_fps']
+        if not max_fps:
+            return None
+        return 1 / max_fps
+
     def build_application_object(self, **kwargs):
         # (lb): By default, the app uses editing_mode=EditingMode.EMACS,
         # which adds a few key bindings. One binding in particular is a
@@ -218,6 +261,7 @@ class ZoneManager(object):
             key_bindings=self.carousel.action_manager.key_bindings_normal,
             full_screen=False,
             color_depth=self._detect_color_depth(),
+            min_redraw_interval=self._min_redraw_interval(),
             erase_when_done=True,
             # Enables mouse wheel scrolling.
             # CAVEAT: Steals from terminal app!
@@ -239,6 +283,11 @@ class ZoneManager(object):
             # but we want those bindings for the command inputizer.
             **kwargs,
         )
+        self.carousel.action_manager.renew_key_processor(application)
+        application.after_render += (
+            self.carousel.action_manager.setup_deferred_key_bindings_after_render
+        )
+        self.carousel.action_profiler.watch_application(application)
         return application
 
     # ***
@@ -253,21 +302,68 @@ class ZoneManager(object):
 
             self.application.renderer.clear()
         """
-        self.reset_diff_fact()
-        self.rebuild_containers()
-        self.selectively_refresh()
+        with self.carousel.action_profiler.phase('view'):
+            self.reset_diff_fact()
+            self.rebuild_or_restore_containers()
+            self.selectively_refresh()
+            self.prefetch_neighbours()
+            self.stream_facts_while_idle()
         self.carousel.controller.client_logger.debug(_('rebuilt and refreshed'))
 
     def reset_diff_fact(self):
-        orig_fact = self.carousel.edits_manager.curr_orig
-        # Call editable_fact, which either gets the edit_fact, or gets
-        # a copy of the orig_fact; but it does not make an undo.
-        edit_fact = self.carousel.edits_manager.editable_fact()
-        self.facts_diff = FactsDiff(orig_fact, edit_fact, formatted=True)
+        with self.carousel.action_profiler.phase('view'):
+            orig_fact = self.carousel.edits_manager.curr_orig
+            # Call editable_fact, which either gets the edit_fact, or gets
+            # a copy of the orig_fact; but it does not make an undo.
+            edit_fact = self.carousel.edits_manager.editable_fact()
+            self.facts_diff = FactsDiff(orig_fact, edit_fact, formatted=True)
         self.carousel.controller.client_logger.debug(
             'facts_diff: {}'.format(self.facts_diff),
         )
 
+    def rebuild_or_restore_containers(self):
+        # Flipping back and forth between Facts re-renders the same views,
+        # so remember the rendered output of recently viewed Facts.
+        view_key = self.view_cache_key()
+        if view_key is None:
+            self.rebuild_containers()
+            return
+        cached_view = self.view_cache.get(view_key)
+        if cached_view is not None:
+            self.restore_containers(cached_view)
+            return
+        self.rebuild_containers()
+        self.view_cache.put(view_key, self.snapshot_containers())
+
+    def view_cache_key(self):
+        # Skip the cache while the user is looking at help, or editing a time.
+        if self.zone_content.showing_help or self.zone_details.active_widgets:
+            return None
+        edits_manager = self.carousel.edits_manager
+        curr_edit = edits_manager.curr_edit
+        return (
+            curr_edit.pk,
+            fact_version(curr_edit),
+            fact_version(edits_manager.curr_orig),
+            self.carousel.avail_width,
+            self.zone_content.content_width,
+            self.zone_content.enable_wrapping,
+        )
+
+    def snapshot_containers(self):
+        return (
+            self.zone_details.snapshot_viewable(),
+            self.zone_content.snapshot_viewable(),
+        )
+
+    def restore_containers(self, cached_view):
+        # The streamer is entirely time-based, so selectively_refresh will
+        # update it; and the lowdown is cheap, and depends on the notif.
+        details_snapshot, content_snapshot = cached_view
+        self.zone_details.restore_viewable(details_snapshot)
+        self.zone_content.restore_viewable(content_snapshot)
+        self.zone_lowdown.rebuild_viewable()
+
     def rebuild_containers(self):
         streamer_container = self.zone_streamer.rebuild_viewable()
         self.hsplit.get_children()[self.streamer_posit] = streamer_container
@@ -284,10 +380,11 @@ class ZoneManager(object):
     # ***
 
     def selectively_refresh(self):
-        self.zone_streamer.selectively_refresh()
-        self.zone_details.selectively_refresh()
-        self.zone_content.selectively_refresh()
-        self.zone_lowdown.selectively_refresh()
+        with self.carousel.action_profiler.phase('view'):
+            self.zone_streamer.selectively_refresh()
+            self.zone_details.selectively_refresh()
+            self.zone_content.selectively_refresh()
+            self.zone_lowdown.selectively_refresh()
 
     # ***
 
@@ -414,8 +511,11 @@ class ZoneManager(object):
         """"""
         count = self.carousel.update_handler.apply_count_multiplier()
         jump_msg = self.jump_msg_with_count(count, _('Backward'), _('Fact'))
-        prev_fact = self.carousel.edits_manager.jump_fact_dec(count=count)
-        self.finalize_jump_dec(prev_fact, jump_msg)
+        self.carousel.store_loader.load(
+            lambda: self.carousel.edits_manager.jump_fact_dec(count=count),
+            lambda prev_fact: self.finalize_jump_dec(prev_fact, jump_msg),
+            store_bound=self.carousel.edits_manager.conjoined.store_bound_dec(count),
+        )
 
     @catch_action_exception
     @ZoneContent.Decorators.reset_showing_help
@@ -423,8 +523,11 @@ class ZoneManager(object):
         """"""
         count = self.carousel.update_handler.apply_count_multiplier()
         jump_msg = self.jump_msg_with_count(count, _('Forward'), _('Fact'))
-        next_fact = self.carousel.edits_manager.jump_fact_inc(count=count)
-        self.finalize_jump_inc(next_fact, jump_msg)
+        self.carousel.store_loader.load(
+            lambda: self.carousel.edits_manager.jump_fact_inc(count=count),
+            lambda next_fact: self.finalize_jump_inc(next_fact, jump_msg),
+            store_bound=self.carousel.edits_manager.conjoined.store_bound_inc(count),
+        )
 
     # ***
 
@@ -445,18 +548,138 @@ class ZoneManager(object):
     def jump_day_dec(self, event):
         """"""
         count = self.carousel.update_handler.apply_count_multiplier(floats=True)
-        jump_msg = self.jump_msg_count_and_time(count, _('Backward'), _('Day'))
-        prev_fact = self.carousel.edits_manager.jump_day_dec(days=count)
-        self.finalize_jump_dec(prev_fact, jump_msg)
+
+        def fetch():
+            jump_msg = self.jump_msg_count_and_time(count, _('Backward'), _('Day'))
+            prev_fact = self.carousel.edits_manager.jump_day_dec(days=count)
+            return prev_fact, jump_msg
+
+        def finish(jumped):
+            self.finalize_jump_dec(*jumped)
+            self.prefetch_day_index(days=count)
+
+        facts_mgr = self.carousel.edits_manager.conjoined
+        self.carousel.store_loader.load(
+            fetch, finish, store_bound=facts_mgr.store_bound_days(-count),
+        )
 
     @catch_action_exception
     @ZoneContent.Decorators.reset_showing_help
     def jump_day_inc(self, event):
         """"""
         count = self.carousel.update_handler.apply_count_multiplier(floats=True)
-        jump_msg = self.jump_msg_count_and_time(count, _('Forward'), _('Day'))
-        next_fact = self.carousel.edits_manager.jump_day_inc(days=count)
-        self.finalize_jump_inc(next_fact, jump_msg)
+
+        def fetch():
+            jump_msg = self.jump_msg_count_and_time(count, _('Forward'), _('Day'))
+            next_fact = self.carousel.edits_manager.jump_day_inc(days=count)
+            return next_fact, jump_msg
+
+        def finish(jumped):
+            self.finalize_jump_inc(*jumped)
+            self.prefetch_day_index(days=count)
+
+        facts_mgr = self.carousel.edits_manager.conjoined
+        self.carousel.store_loader.load(
+            fetch, finish, store_bound=facts_mgr.store_bound_days(count),
+        )
+
+    # Wait a beat before prefetching, so the jump is drawn first.
+    PREFETCH_DAY_INDEX_DELAY = 0.1
+
+    def prefetch_day_index(self, days):
+        """"""
+        def _prefetch_day_index():
+            # If the user jumps again before we got to it, start over. (And
+            # like the idle prefetch, a keypress cancels it, too.)
+            if self.prefetch_handle is not None:
+                self.prefetch_handle.cancel()
+            self.prefetch_handle = self.carousel.event_loop.call_later(
+                ZoneManager.PREFETCH_DAY_INDEX_DELAY, prefetch_days,
+            )
+
+        def prefetch_days():
+            self.prefetch_handle = None
+            # Same as prefetch_facts: the month query runs on the UI loop, so
+            # skip it if the user is waiting on a load, or if we've exited.
+            if self.carousel.store_loader.busy or not self.application.is_running:
+                return
+            self.carousel.edits_manager.prefetch_day_index(days=days)
+
+        _prefetch_day_index()
+
+    # Wait until the user pauses before loading the neighbouring Facts.
+    IDLE_PREFETCH_DELAY = 0.25
+
+    def prefetch_neighbours(self):
+        """"""
+        def _prefetch_neighbours():
+            self.cancel_idle_prefetch()
+            config = self.carousel.controller.config
+            count = config['editor.prefetch_neighbours']
+            if not count and not config['editor.max_loaded_facts']:
+                return
+            self.idle_handle = self.carousel.event_loop.call_later(
+                ZoneManager.IDLE_PREFETCH_DELAY, prefetch_facts, count,
+            )
+
+        def prefetch_facts(count):
+            self.idle_handle = None
+            # Skip if the user is waiting on a load, or if the Application
+            # exited (e.g., to prompt for act@gory), in which case the next
+            # ZoneManager will reschedule.
+            if self.carousel.store_loader.busy or not self.application.is_running:
+                return
+            # Wait until the stream is done, lest we load store Facts from
+            # times that the Facts yet to arrive will claim.
+            if self.carousel.edits_manager.streaming:
+                return
+            if count:
+                self.carousel.edits_manager.conjoined.prefetch_neighbours(count)
+            # While we're idle, also make room for what the user loads next.
+            self.carousel.edits_manager.evict_far_facts()
+
+        _prefetch_neighbours()
+
+    # Let the first screen draw before adding more streamed Facts.
+    STREAM_FACTS_DELAY = 0.05
+
+    def stream_facts_while_idle(self):
+        """"""
+        def _stream_facts_while_idle():
+            if self.stream_handle is not None:
+                return
+            if not self.carousel.edits_manager.streaming:
+                return
+            self.stream_handle = self.carousel.event_loop.call_later(
+                ZoneManager.STREAM_FACTS_DELAY, stream_facts,
+            )
+
+        def stream_facts():
+            self.stream_handle = None
+            # If the Application exited (e.g., to prompt for act@gory),
+            # the next ZoneManager will pick up where we left off.
+            if not self.application.is_running:
+                return
+            # Give way to the user's jumps, which may drain the stream anyway.
+            if not self.carousel.store_loader.busy:
+                if not self.carousel.edits_manager.stream_more_facts():
+                    # Update the count of new Facts.
+                    self.zone_lowdown.rebuild_viewable()
+                    self.application.invalidate()
+                    return
+            # Each batch is one callback, so keypresses are handled in between.
+            _stream_facts_while_idle()
+
+        _stream_facts_while_idle()
+
+    def cancel_idle_prefetch(self, key_processor=None):
+        """Cancels pending idle work as soon as the user presses a key."""
+        if self.idle_handle is not None:
+            self.idle_handle.cancel()
+            self.idle_handle = None
+        if self.prefetch_handle is not None:
+            self.prefetch_handle.cancel()
+            self.prefetch_handle = None
 
     # ***
 
@@ -477,21 +700,31 @@ class ZoneManager(object):
         self.jump_rift_or_time(rift_jumper, 'since_time', noop_msg)
 
     def jump_rift_or_time(self, rift_jumper, which_time, noop_msg):
-        was_curr = self.carousel.edits_manager.curr_fact
         modifier = self.carousel.update_handler.command_modifier
         self.carousel.update_handler.command_modifier_reset()
         if not modifier:
-            rift_jumper()
-        else:
-            jump_time, parse_err = self.zone_details.parse_dated(modifier)
-            if parse_err is not None:
-                noop_msg = _("Not a time or date")
-            else:
-                facts_mgr = self.carousel.edits_manager.conjoined
-                kwargs = {which_time: jump_time}
-                facts_mgr.jump_to_fact_nearest(**kwargs)
-                noop_msg = _("Nothing on that date")
-        self.refresh_fact_or_notify_noop(was_curr, noop_msg)
+            self.load_jump_or_notify_noop(rift_jumper, noop_msg)
+            return
+        jump_time, parse_err = self.zone_details.parse_dated(modifier)
+        if parse_err is not None:
+            self.update_status(_("Not a time or date"))
+            return
+        edits_manager = self.carousel.edits_manager
+        kwargs = {which_time: jump_time}
+        self.load_jump_or_notify_noop(
+            lambda: edits_manager.jump_to_fact_nearest(**kwargs),
+            _("Nothing on that date"),
+        )
+
+    def load_jump_or_notify_noop(self, jumper, noop_msg):
+        def fetch():
+            was_curr = self.carousel.edits_manager.curr_fact
+            jumper()
+            return was_curr
+
+        self.carousel.store_loader.load(
+            fetch, lambda was_curr: self.refresh_fact_or_notify_noop(was_curr, noop_msg),
+        )
 
     def refresh_fact_or_notify_noop(self, was_curr, noop_msg):
         if was_curr is not self.carousel.edits_manager.curr_fact:
@@ -505,17 +738,17 @@ class ZoneManager(object):
     @ZoneContent.Decorators.reset_showing_help
     def jump_fact_first(self, event):
         """"""
-        was_curr = self.carousel.edits_manager.curr_fact
-        self.carousel.edits_manager.jump_fact_first()
-        self.refresh_fact_or_notify_noop(was_curr, _("Already on first Fact"))
+        self.load_jump_or_notify_noop(
+            self.carousel.edits_manager.jump_fact_first, _("Already on first Fact"),
+        )
 
     @catch_action_exception
     @ZoneContent.Decorators.reset_showing_help
     def jump_fact_final(self, event):
         """"""
-        was_curr = self.carousel.edits_manager.curr_fact
-        self.carousel.edits_manager.jump_fact_final()
-        self.refresh_fact_or_notify_noop(was_curr, _("Already on final Fact"))
+        self.load_jump_or_notify_noop(
+            self.carousel.edits_manager.jump_fact_final, _("Already on final Fact"),
+        )
 
     # ***
 
@@ -536,6 +769,8 @@ class ZoneManager(object):
             _jump_msg = jump_msg
             if curr_fact and 'alert-user' in curr_fact.dirty_reasons:
                 curr_fact.dirty_reasons.discard('alert-user')
+                # The view cache is keyed on the Fact version, so mark the change.
+                bump_fact_version(curr_fact)
                 # 2019-02-13: (lb): Currently, only 'overlapped' causes this.
                 self.carousel.controller.affirm(
                     curr_fact.dirty_reasons == set(['overlapped']),
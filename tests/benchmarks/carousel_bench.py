@@ -0,0 +1,212 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Replays scripted keystrokes through a headless Carousel, and times them."""
+
+import json
+import logging
+import os
+import platform
+import resource
+import time
+from datetime import datetime
+
+from prompt_toolkit.input.defaults import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from sqlalchemy import event
+
+from dob_viewer import get_version
+from dob_viewer.ptkui import re_confirm
+from dob_viewer.traverser.save_confirmer import prompt_and_save_confirmer
+from dob_viewer.traverser.zone_manager import ZoneManager
+
+__all__ = (
+    'KeyScriptRunner',
+    'percentiles',
+    'write_results',
+)
+
+
+STEP_TIMEOUT_SECS = 60
+"""Give up on a script if any one keystroke takes longer than this."""
+
+
+class KeyScriptRunner(object):
+    """Runs the Carousel, feeding it one keystroke per rendered frame.
+
+    Each keystroke is sent once the previous one was handled and drawn
+    (and any store load it started has finished and been drawn, too),
+    so its latency is the time from the key press to the final frame,
+    as the user would perceive it.
+    """
+
+    def __init__(self, controller, mocker):
+        self.controller = controller
+        self.query_count = 0
+        self.count_store_queries()
+        # Measure the work, not the frame rate cap, nor the debug log
+        # (which formats the groups on every jump, when enabled).
+        controller.config['editor.max_fps'] = 0
+        controller.client_logger.setLevel(logging.WARNING)
+        # The Carousel asks before quitting with unsaved edits.
+        mocker.patch.object(re_confirm, 'confirm', return_value=True)
+        self.hook_application(mocker)
+
+    def count_store_queries(self):
+        def before_cursor_execute(*args, **kwargs):
+            self.query_count += 1
+
+        engine = self.controller.store.session.get_bind()
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+
+    def hook_application(self, mocker):
+        build_application_object = ZoneManager.build_application_object
+
+        def wrapper(zone_manager, **kwargs):
+            application = build_application_object(zone_manager, **kwargs)
+            application.after_render += lambda app: self.after_render(zone_manager)
+            return application
+
+        mocker.patch.object(ZoneManager, 'build_application_object', wrapper)
+
+    # ***
+
+    def run(self, keystrokes):
+        """Returns a list of (keystroke, latency_secs, query_count) tuples."""
+        self.pending = list(keystrokes)
+        self.exiting = False
+        self.sent = {}
+        self.steps = []
+        self.inp = create_pipe_input()
+        try:
+            prompt_and_save_confirmer(
+                self.controller,
+                edit_facts=[self.controller.find_latest_fact()],
+                input=self.inp,
+                output=DummyOutput(),
+            )
+        finally:
+            self.inp.close()
+        if self.pending:
+            raise RuntimeError('Carousel exited early, with {} keystrokes left'.format(
+                len(self.pending),
+            ))
+        return self.steps
+
+    def after_render(self, zone_manager):
+        carousel = zone_manager.carousel
+        if self.exiting:
+            return
+        if carousel.store_loader.busy:
+            # Still loading; wait for the frame that shows the result.
+            return
+        if self.sent and not self.sent['handled']:
+            # E.g., tick-tock drew a frame before the key was read.
+            return
+        if self.sent:
+            self.record_step()
+        if not self.pending:
+            self.exit_carousel(carousel)
+            return
+        self.send_next(zone_manager)
+
+    def record_step(self):
+        self.steps.append((
+            self.sent['keystroke'],
+            time.perf_counter() - self.sent['time'],
+            self.query_count - self.sent['query_count'],
+        ))
+        self.sent['watchdog'].cancel()
+        self.sent = {}
+
+    def send_next(self, zone_manager):
+        sent = self.sent
+
+        def after_key_press(key_processor):
+            # Multi-key bindings (e.g., 'gg') are handled on their last key.
+            if not key_processor.key_buffer and not key_processor.input_queue:
+                key_processor.after_key_press -= after_key_press
+                sent['handled'] = True
+
+        zone_manager.application.key_processor.after_key_press += after_key_press
+        sent['keystroke'] = self.pending.pop(0)
+        sent['handled'] = False
+        sent['query_count'] = self.query_count
+        sent['watchdog'] = zone_manager.carousel.event_loop.call_later(
+            STEP_TIMEOUT_SECS, self.give_up, zone_manager.carousel,
+        )
+        sent['time'] = time.perf_counter()
+        self.inp.send_text(sent['keystroke'])
+
+    def give_up(self, carousel):
+        # Put the keystroke back, so that run() raises.
+        self.pending.insert(0, self.sent['keystroke'])
+        self.exit_carousel(carousel)
+
+    def exit_carousel(self, carousel):
+        self.exiting = True
+        # Same as exit_command, less the key press.
+        carousel.confirm_exit = True
+        carousel.enduring_edit = False
+        carousel.zone_manager.application.exit()
+
+
+# ***
+
+def percentiles(values, points=(50, 90, 99)):
+    """Returns {'p50': ..., 'max': ...} using the nearest-rank method."""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    ranked = {
+        'p{}'.format(point): ordered[max(0, -(-point * len(ordered) // 100) - 1)]
+        for point in points
+    }
+    ranked['max'] = ordered[-1]
+    return ranked
+
+
+def peak_rss_bytes():
+    """Returns the process's peak RSS, which only ever grows.
+
+    So that this says something about each store size, run each size
+    in its own process.
+    """
+    # Note that ru_maxrss is KiB on Linux, but bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if platform.system() == 'Darwin':
+        return peak_rss
+    return peak_rss * 1024
+
+
+def write_results(results, path=None):
+    """Writes the benchmark results, and the run's particulars, as JSON."""
+    path = path or os.path.join(
+        '.benchmarks',
+        'carousel-{}.json'.format(datetime.now().strftime('%Y%m%d-%H%M%S')),
+    )
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    report = {
+        'version': get_version(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': datetime.now().isoformat(),
+        'results': results,
+    }
+    with open(path, 'w') as json_file:
+        json.dump(report, json_file, indent=2, sort_keys=True)
+    return path
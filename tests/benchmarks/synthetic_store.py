@@ -0,0 +1,139 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Bulk-loads a store with lots of realistic-looking Facts, quickly."""
+
+import random
+from datetime import datetime, timedelta
+
+from nark.backends.sqlalchemy.objects import (
+    activities,
+    categories,
+    fact_tags,
+    facts,
+    tags,
+)
+
+__all__ = (
+    'populate_store',
+)
+
+
+CATEGORY_COUNT = 20
+ACTIVITY_COUNT = 200
+TAG_COUNT = 50
+
+INSERT_CHUNK_SIZE = 20000
+"""How many rows to send to the database per executemany."""
+
+
+def populate_store(controller, fact_count, seed=1):
+    """Inserts fact_count back-to-back Facts, with occasional gaps, ending now.
+
+    The Facts are inserted with SQLAlchemy core, and not through
+    controller.facts.save, which would take hours for a million Facts.
+    """
+    rand = random.Random(seed)
+    session = controller.store.session
+
+    def _populate_store():
+        insert_lookups()
+        insert_facts(fact_times())
+        session.commit()
+
+    def insert_lookups():
+        session.execute(categories.insert(), [
+            {'id': pk, 'name': 'category-{}'.format(pk), 'deleted': False}
+            for pk in range(1, CATEGORY_COUNT + 1)
+        ])
+        session.execute(activities.insert(), [
+            {
+                'id': pk,
+                'name': 'activity-{}'.format(pk),
+                'category_id': rand.randint(1, CATEGORY_COUNT),
+                'deleted': False,
+            }
+            for pk in range(1, ACTIVITY_COUNT + 1)
+        ])
+        session.execute(tags.insert(), [
+            {'id': pk, 'name': 'tag-{}'.format(pk), 'deleted': False}
+            for pk in range(1, TAG_COUNT + 1)
+        ])
+
+    def fact_times():
+        # Work backwards from now, so the final Fact is the latest.
+        end_time = datetime.now().replace(second=0, microsecond=0)
+        for _idx in range(fact_count):
+            start_time = end_time - timedelta(minutes=rand.randint(5, 120))
+            yield start_time, end_time
+            end_time = start_time - gap_before()
+
+    def gap_before():
+        # Most Facts are back-to-back; sometimes there's a break, and
+        # about once a day (a dozen or so Facts) there's an overnight.
+        chance = rand.random()
+        if chance < 0.85:
+            return timedelta()
+        elif chance < 0.93:
+            return timedelta(minutes=rand.randint(1, 90))
+        return timedelta(hours=rand.randint(6, 14))
+
+    def insert_facts(times):
+        fact_rows = []
+        tag_rows = []
+        for idx, (start_time, end_time) in enumerate(times):
+            # Number the Facts oldest first, as though entered in order.
+            pk = fact_count - idx
+            fact_rows.append(fact_row(pk, start_time, end_time))
+            tag_rows.extend(fact_tag_rows(pk))
+            if len(fact_rows) >= INSERT_CHUNK_SIZE:
+                insert_chunk(fact_rows, tag_rows)
+        insert_chunk(fact_rows, tag_rows)
+
+    def fact_row(pk, start_time, end_time):
+        return {
+            'id': pk,
+            'deleted': False,
+            'split_from_id': None,
+            'start_time': start_time,
+            'end_time': end_time,
+            'activity_id': rand.randint(1, ACTIVITY_COUNT),
+            'description': description(pk),
+        }
+
+    def description(pk):
+        lines = rand.randint(0, 6)
+        return '\n'.join(
+            'Fact {} line {}: {}'.format(pk, line, 'lorem ipsum ' * rand.randint(1, 12))
+            for line in range(lines)
+        )
+
+    def fact_tag_rows(pk):
+        return [
+            {'fact_id': pk, 'tag_id': tag_id}
+            for tag_id in rand.sample(range(1, TAG_COUNT + 1), rand.randint(0, 3))
+        ]
+
+    def insert_chunk(fact_rows, tag_rows):
+        if fact_rows:
+            session.execute(facts.insert(), fact_rows)
+        if tag_rows:
+            session.execute(fact_tags.insert(), tag_rows)
+        del fact_rows[:]
+        del tag_rows[:]
+
+    _populate_store()
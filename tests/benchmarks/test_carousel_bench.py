@@ -0,0 +1,169 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Carousel latency benchmarks, against stores of 1k, 100k and 1M Facts."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import dob_viewer.config  # noqa: F401 (registers the 'editor' settings)
+
+from .carousel_bench import (
+    KeyScriptRunner,
+    peak_rss_bytes,
+    percentiles,
+    write_results,
+)
+from .synthetic_store import populate_store
+
+
+BENCHMARK_SIZES = os.environ.get('DOB_BENCHMARK', '')
+"""Which store sizes to benchmark, e.g., DOB_BENCHMARK=1k,100k,1M.
+
+The benchmarks are skipped unless this is set, as the larger stores take
+minutes to build. Results are written as JSON to DOB_BENCHMARK_JSON, if set,
+otherwise to a timestamped file under .benchmarks/.
+"""
+
+BENCHMARK_SUBPROCESS = os.environ.get('DOB_BENCHMARK_SUBPROCESS', '')
+"""Set (by the benchmark itself) when running one size in its own process.
+
+Each size runs in a fresh process, because the peak RSS that the OS reports
+only ever grows, so a size run after a larger one would report its peak.
+"""
+
+LEFT = '\x1bOD'
+RIGHT = '\x1bOC'
+
+KEY_SCRIPTS = (
+    # Walk backward, then forward again, one Fact at a time.
+    ('arrow_walk', [LEFT] * 200 + [RIGHT] * 200),
+    # Jump backward and forward by day (which uses the day index).
+    ('day_jumps', ['J'] * 30 + ['K'] * 30),
+    # Jump back a day, then walk the month that jump loaded (every step
+    # of which is a jump within one long group of Facts).
+    ('jump_then_walk', (['J'] + [LEFT] * 20) * 5 + (['K'] + [RIGHT] * 20) * 5),
+    # Bounce between the first and final Facts.
+    ('first_final', ['gg', 'G'] * 5),
+    # Nudge the start and end times back and forth.
+    ('time_nudges', [',', '.', '[', ']'] * 25),
+    # Make a pile of edits, then undo and redo all of them.
+    ('undo_storm', ['.'] * 50 + ['u'] * 50 + ['r'] * 50),
+    # Copy a Fact, paste it over its neighbour, and save. (Run this
+    # last, as it changes the store.)
+    ('paste_save', ['\x03', LEFT, '\x16', '\x13']),
+)
+
+
+def parse_size(size):
+    multiplier = {'k': 1000, 'm': 1000000}.get(size[-1:].lower(), 1)
+    return int(size.rstrip('kKmM')) * multiplier
+
+
+def benchmark_sizes():
+    return [size.strip() for size in BENCHMARK_SIZES.split(',') if size.strip()]
+
+
+@pytest.mark.skipif(not BENCHMARK_SIZES, reason='Set DOB_BENCHMARK to run')
+class TestCarouselBenchmarks(object):
+    """Replays KEY_SCRIPTS against a synthetic store and reports latencies."""
+
+    results = []
+
+    @classmethod
+    def teardown_class(cls):
+        if not cls.results:
+            return
+        path = write_results(cls.results, os.environ.get('DOB_BENCHMARK_JSON'))
+        print('\nBenchmark results written to: {}'.format(path))
+
+    # ***
+
+    @pytest.mark.parametrize('size', benchmark_sizes())
+    def test_carousel_benchmarks(self, request, tmp_path, size):
+        if BENCHMARK_SUBPROCESS:
+            self.results.extend(run_benchmarks(
+                request.getfixturevalue('controller_with_logging'),
+                request.getfixturevalue('mocker'),
+                size,
+            ))
+        else:
+            self.results.extend(run_benchmarks_subprocess(request, tmp_path, size))
+
+
+# ***
+
+def run_benchmarks_subprocess(request, tmp_path, size):
+    results_path = str(tmp_path / 'carousel-{}.json'.format(size))
+    completed = subprocess.run(
+        [
+            sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+            '{}::TestCarouselBenchmarks'.format(__file__),
+        ],
+        cwd=str(request.config.rootdir),
+        env=dict(
+            os.environ,
+            DOB_BENCHMARK=size,
+            DOB_BENCHMARK_JSON=results_path,
+            DOB_BENCHMARK_SUBPROCESS='1',
+        ),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    assert completed.returncode == 0, completed.stdout
+    with open(results_path) as json_file:
+        return json.load(json_file)['results']
+
+
+def run_benchmarks(controller, mocker, size):
+    fact_count = parse_size(size)
+    load_began = time.perf_counter()
+    populate_store(controller, fact_count)
+    load_secs = time.perf_counter() - load_began
+
+    results = []
+    runner = KeyScriptRunner(controller, mocker)
+    for script_name, keystrokes in KEY_SCRIPTS:
+        steps = runner.run(keystrokes)
+        latencies_ms = [latency * 1000 for _key, latency, _queries in steps]
+        queries = [query_count for _key, _latency, query_count in steps]
+        results.append({
+            'size': size,
+            'fact_count': fact_count,
+            'store_load_secs': load_secs,
+            'script': script_name,
+            'keystrokes': len(steps),
+            'latency_ms': dict(
+                percentiles(latencies_ms),
+                mean=sum(latencies_ms) / len(latencies_ms),
+            ),
+            'queries_per_action': dict(
+                percentiles(queries),
+                mean=sum(queries) / len(queries),
+                total=sum(queries),
+            ),
+            # The peak for this size so far, through this script.
+            'peak_rss_bytes': peak_rss_bytes(),
+        })
+        assert len(steps) == len(keystrokes)
+    return results
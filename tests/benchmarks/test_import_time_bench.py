@@ -0,0 +1,65 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Cold import time benchmark for the dob_viewer entry points."""
+
+import os
+
+import pytest
+
+from ..test_import_time import ENTRY_POINTS, import_entry_points
+
+
+IMPORT_TIME_BENCHMARK = os.environ.get('DOB_BENCHMARK_IMPORT_TIME', '')
+"""Set to check the cold import time budget, e.g., DOB_BENCHMARK_IMPORT_TIME=1.
+
+Skipped unless set, because wall-clock times vary with the host and its load.
+"""
+
+IMPORT_TIME_BUDGET_US = 150000
+"""Cumulative cold import budget for the dob_viewer entry points, in μs.
+
+(lb): A cold import measures ~50 ms on a dev machine, versus ~330 ms
+before the heavy imports were made lazy. The budget leaves headroom
+for slower hosts, but not enough to hide PTK sneaking back in.
+"""
+
+
+def cumulative_import_time(importtime_report):
+    # Each line reads, e.g.,
+    #   import time: self [us] | cumulative | imported package
+    # where nested imports are indented under their importer.
+    cumulative_us = 0
+    for line in importtime_report.splitlines():
+        try:
+            _self_us, cumulative, package = line.split('|')
+        except ValueError:
+            continue
+        if package.strip() in ENTRY_POINTS and not package.startswith('  '):
+            cumulative_us += int(cumulative)
+    return cumulative_us
+
+
+@pytest.mark.skipif(not IMPORT_TIME_BENCHMARK, reason='Set DOB_BENCHMARK_IMPORT_TIME')
+class TestImportTimeBudget(object):
+    """Times a cold import of the entry points, in a fresh interpreter."""
+
+    def test_import_time_within_budget(self):
+        completed = import_entry_points('-X', 'importtime')
+        cumulative_us = cumulative_import_time(completed.stderr)
+        assert cumulative_us > 0
+        assert cumulative_us < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,113 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""FactsManager memory benchmarks: the viewer's own overhead, per Fact."""
+
+import logging
+import os
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from nark.items.activity import Activity
+from nark.items.category import Category
+from nark.items.tag import Tag
+
+from dob_bright.crud.fact_dressed import FactDressed
+
+from dob_viewer.traverser.facts_manager import FactsManager
+
+from .carousel_bench import write_results
+
+
+MEMORY_BENCHMARK_SIZE = os.environ.get('DOB_BENCHMARK_MEMORY', '')
+"""How many Facts to load, e.g., DOB_BENCHMARK_MEMORY=100000.
+
+Skipped unless set. Results are written as JSON to DOB_BENCHMARK_JSON,
+if set, otherwise to a timestamped file under .benchmarks/.
+"""
+
+GROUP_SIZE = 10
+"""How many contiguous Facts to load per group, like a few store fetches."""
+
+
+def build_facts(fact_count):
+    category = Category('category', pk=1)
+    activities = [
+        Activity('activity-{}'.format(pk), pk=pk, category=category)
+        for pk in range(1, 21)
+    ]
+    tags = [Tag('tag-{}'.format(pk), pk=pk) for pk in range(1, 6)]
+    facts = []
+    start_time = datetime(2020, 1, 1)
+    for pk in range(1, fact_count + 1):
+        end_time = start_time + timedelta(minutes=30)
+        facts.append(FactDressed(
+            activity=activities[pk % len(activities)],
+            start=start_time,
+            end=end_time,
+            pk=pk,
+            description='Fact #{}'.format(pk),
+            tags=tags[:pk % len(tags)],
+        ))
+        start_time = end_time
+        # Leave a gap between groups, so that each one claims its own time.
+        if not (pk % GROUP_SIZE):
+            start_time += timedelta(minutes=1)
+    return facts
+
+
+@pytest.mark.skipif(not MEMORY_BENCHMARK_SIZE, reason='Set DOB_BENCHMARK_MEMORY')
+class TestFactsManagerMemory(object):
+    """Loads Facts into a FactsManager and reports its bytes per Fact."""
+
+    def test_facts_manager_bytes_per_fact(self, controller_with_logging):
+        fact_count = int(MEMORY_BENCHMARK_SIZE)
+        # Measure the viewer, not the debug log it'd otherwise write.
+        controller_with_logging.client_logger.setLevel(logging.WARNING)
+        # Build the Facts first, so we only measure what the viewer adds.
+        facts = build_facts(fact_count)
+
+        tracemalloc.start()
+        try:
+            baseline_bytes = tracemalloc.get_traced_memory()[0]
+            facts_mgr = FactsManager(
+                controller_with_logging,
+                on_insert_fact=None,
+                on_jumped_fact=None,
+            )
+            for offset in range(0, fact_count, GROUP_SIZE):
+                facts_mgr.add_facts(facts[offset:offset + GROUP_SIZE])
+            loaded_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        overhead_bytes = loaded_bytes - baseline_bytes
+        result = {
+            'benchmark': 'facts_manager_memory',
+            'fact_count': fact_count,
+            'group_count': len(facts_mgr.groups),
+            'overhead_bytes': overhead_bytes,
+            'peak_bytes': peak_bytes - baseline_bytes,
+            'bytes_per_fact': overhead_bytes / fact_count,
+        }
+        path = write_results([result], os.environ.get('DOB_BENCHMARK_JSON'))
+        print('\nBytes per Fact: {:.1f} (results written to: {})'.format(
+            result['bytes_per_fact'], path,
+        ))
+        assert len(facts_mgr) == fact_count
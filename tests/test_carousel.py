@@ -15,15 +15,27 @@
 # If you lost the GNU General Public License that ships with this software
 # repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
 
+from datetime import timedelta
+
 import pytest
 
+from prompt_toolkit.document import Document
 from prompt_toolkit.input.defaults import create_pipe_input
+from prompt_toolkit.lexers import PygmentsLexer, SimpleLexer
 from prompt_toolkit.output import DummyOutput
 
 from dob_bright.crud.parse_input import parse_input
 
+from dob_viewer import config  # noqa: F401 (registers editor.* settings)
 from dob_viewer.ptkui import re_confirm
+from dob_viewer.ptkui.virtual_text_area import VirtualTextArea
+from dob_viewer.traverser.action_profiler import ActionProfiler
+from dob_viewer.traverser.content_lexer import LazyPygmentsLexer, load_content_lexer
+from dob_viewer.traverser.edits_manager import EditsManager
 from dob_viewer.traverser.save_confirmer import prompt_and_save_confirmer
+from dob_viewer.traverser.store_counter import StoreCounter
+from dob_viewer.traverser.zone_content import ZoneContent
+from dob_viewer.traverser.zone_manager import ZoneManager
 
 
 @pytest.fixture
@@ -139,3 +151,272 @@ class TestBasicCarousel(object):
             mocker,
         )
 
+    # ***
+
+    def test_basic_import4_right_arrow_store_calls(
+        self,
+        controller_with_logging,
+        new_facts,
+        mocker,
+    ):
+        # Grab the Carousel's StoreCounter when it's installed.
+        install_spy = mocker.spy(StoreCounter, 'install')
+        self._feed_cli_with_input(
+            controller_with_logging,
+            new_facts,
+            ''.join([
+                # Arrow right, within the imported Facts.
+                '\x1bOC',
+                # Arrow left twice, back to the first Fact, then into the store.
+                '\x1bOD',
+                '\x1bOD',
+                '\x11',
+                '\x11',
+                '\x11',
+            ]),
+            mocker,
+        )
+        store_counter = install_spy.call_args.args[0]
+        store_counter.assert_action_calls('jump_fact_inc', 0)
+        assert sum(store_counter.action_calls['jump_fact_dec']) == 1
+
+    # ***
+
+    def test_store_counter_counts_nested_store_calls_once(
+        self,
+        controller_with_logging,
+        new_facts,
+    ):
+        new_facts[0].pk = None
+        controller_with_logging.facts.save(new_facts[0])
+        store_counter = StoreCounter(controller_with_logging)
+        store_counter.install()
+        try:
+            # Each of these calls facts.get_all, which is also counted.
+            with store_counter.assert_calls(1):
+                controller_with_logging.find_oldest_fact()
+            with store_counter.assert_calls(1):
+                controller_with_logging.find_latest_fact()
+        finally:
+            store_counter.uninstall()
+        assert store_counter.calls == {'find_oldest_fact': 1, 'find_latest_fact': 1}
+
+    # ***
+
+    def test_content_lexer_builds_pygments_lexer_on_first_lex(
+        self,
+        controller_with_logging,
+    ):
+        content_lexer = load_content_lexer(controller_with_logging)
+        assert isinstance(content_lexer, LazyPygmentsLexer)
+        assert content_lexer._lexer is None
+        get_line = content_lexer.lex_document(Document('*emphasis*'))
+        assert isinstance(content_lexer._lexer, PygmentsLexer)
+        assert ''.join(text for _style, text in get_line(0)) == '*emphasis*'
+
+    def test_content_lexer_unknown_pygments_lexer_shows_plain_text(
+        self,
+        controller_with_logging,
+    ):
+        controller_with_logging.config['editor.lexer'] = 'NotAnyLexer'
+        content_lexer = load_content_lexer(controller_with_logging)
+        get_line = content_lexer.lex_document(Document('plain'))
+        assert isinstance(content_lexer._lexer, SimpleLexer)
+        assert get_line(0) == [('', 'plain')]
+
+    # ***
+
+    def test_basic_import4_store_bound_jumps_profiled(
+        self,
+        controller_with_logging,
+        new_facts,
+        mocker,
+    ):
+        controller_with_logging.config['dev.profile_actions'] = True
+        # Grab the Carousel's ActionProfiler when it's dumped, on exit.
+        dump_spy = mocker.spy(ActionProfiler, 'dump')
+        self._feed_cli_with_input(
+            controller_with_logging,
+            new_facts,
+            ''.join([
+                # Arrow left, into the store, whose load is deferred.
+                '\x1bOD',
+                '\x1bOD',
+                # And jump back a day, which also loads from the store.
+                'J',
+                '\x11',
+                '\x11',
+                '\x11',
+            ]),
+            mocker,
+        )
+        action_profiler = dump_spy.call_args.args[0]
+
+        def phase_secs(action_name, phase):
+            return sum(
+                sample[phase] for sample in action_profiler.samples[action_name]
+            )
+
+        # The deferred loads are charged to the actions that asked for them.
+        assert phase_secs('jump_fact_dec', 'store') > 0
+        assert phase_secs('jump_day_dec', 'store') > 0
+        # The day jump lands on a new Fact, which the deferred finish draws.
+        assert phase_secs('jump_day_dec', 'view') > 0
+
+    # ***
+
+    def test_basic_import4_virtual_content_scroll(
+        self,
+        controller_with_logging,
+        new_facts,
+        mocker,
+    ):
+        controller_with_logging.config['editor.virtual_content'] = True
+        new_facts[0].description = 'lorem ipsum dolor sit amet\n' * 10000
+        set_view_spy = mocker.spy(VirtualTextArea, 'set_view')
+        bottom_spy = mocker.spy(VirtualTextArea, 'cursor_bottom')
+        self._feed_cli_with_input(
+            controller_with_logging,
+            new_facts,
+            ''.join([
+                # Page down, twice, then End, and Home.
+                '\x1b[6~',
+                '\x1b[6~',
+                '\x1b[F',
+                '\x1b[H',
+                '\x11',
+                '\x11',
+                '\x11',
+            ]),
+            mocker,
+        )
+        assert set_view_spy.call_count > 0
+        assert bottom_spy.call_count == 1
+
+    # ***
+
+    def test_basic_import4_streamed_facts(
+        self,
+        controller_with_logging,
+        new_facts,
+        mocker,
+    ):
+        controller_with_logging.config['editor.stream_batch_size'] = 2
+        # Grab the EditsManager when it reads the stream.
+        stream_spy = mocker.spy(EditsManager, 'setup_fact_stream')
+        self._feed_cli_with_input(
+            controller_with_logging,
+            iter(new_facts),
+            ''.join([
+                # Arrow right past the first batch, which reads the rest.
+                '\x1bOC',
+                '\x1bOC',
+                '\x1bOC',
+                '\x11',
+                '\x11',
+                '\x11',
+            ]),
+            mocker,
+        )
+        edits_manager = stream_spy.call_args.args[0]
+        assert not edits_manager.streaming
+        assert edits_manager.streamed_count == len(new_facts)
+        # The streamed Facts extend one group, same as a list of Facts.
+        assert len(edits_manager.conjoined.groups) == 1
+        assert len(edits_manager.verify_fact_pks) == len(new_facts)
+
+    # ***
+
+    @pytest.mark.parametrize(('view_cache_size'), [64, 0])
+    def test_basic_import4_view_cache_misses_edited_fact(
+        self,
+        controller_with_logging,
+        new_facts,
+        mocker,
+        view_cache_size,
+    ):
+        controller_with_logging.config['editor.view_cache_size'] = view_cache_size
+        new_facts[0].description = 'First description'
+        new_facts[1].description = 'Second description'
+        # Record each description shown, and for which Fact.
+        shown_views = []
+        replace_content_view = ZoneContent.replace_content_view
+
+        def record_content_view(zone_content, content_view):
+            curr_fact = zone_content.carousel.edits_manager.curr_fact
+            shown_views.append((curr_fact.pk, content_view.text))
+            replace_content_view(zone_content, content_view)
+
+        mocker.patch.object(ZoneContent, 'replace_content_view', record_content_view)
+        restore_spy = mocker.spy(ZoneManager, 'restore_containers')
+        self._feed_cli_with_input(
+            controller_with_logging,
+            new_facts,
+            ''.join([
+                # Copy the first Fact's description.
+                'D',
+                '\x03',
+                # Over to the second Fact, back, and over again (from cache).
+                '\x1bOC',
+                '\x1bOD',
+                '\x1bOC',
+                # Paste the first Fact's description over the second's.
+                '\x16',
+                # Back, and over again, which must not restore the old view.
+                '\x1bOD',
+                '\x1bOC',
+                '\x11',
+                '\x11',
+                '\x11',
+            ]),
+            mocker,
+        )
+        second_views = [text for pk, text in shown_views if pk == new_facts[1].pk]
+        assert second_views[0] == 'Second description'
+        # Once edited, the second Fact never shows its old (cached) view again.
+        edited_at = second_views.index('First description')
+        assert set(second_views[edited_at:]) == {'First description'}
+        if view_cache_size:
+            assert restore_spy.call_count > 0
+        else:
+            assert restore_spy.call_count == 0
+
+    # ***
+
+    def test_basic_import4_held_time_key_adjusts_once(
+        self,
+        controller_with_logging,
+        new_facts,
+        mocker,
+    ):
+        held_presses = 5
+        time_adjust_spy = mocker.spy(EditsManager, 'edit_time_adjust')
+        self._feed_cli_with_input(
+            controller_with_logging,
+            new_facts,
+            ''.join([
+                # Over to the second Fact.
+                '\x1bOC',
+                # Hold down the decrement-start-time key.
+                *([','] * held_presses),
+                # And then press increment, and decrement again, once each.
+                '.',
+                ',',
+                '\x11',
+                '\x11',
+                '\x11',
+            ]),
+            mocker,
+        )
+        # The held key repeats are summed and applied once, and the count of
+        # repeats does not leak into the next time adjustment.
+        deltas = [call.args[1] for call in time_adjust_spy.call_args_list]
+        assert deltas == [
+            timedelta(minutes=-held_presses),
+            timedelta(minutes=1),
+            timedelta(minutes=-1),
+        ]
+        edits_manager = time_adjust_spy.call_args.args[0]
+        edit_fact = edits_manager.curr_edit
+        assert edit_fact.pk == new_facts[1].pk
+        assert edit_fact.start == new_facts[1].start - timedelta(minutes=held_presses)
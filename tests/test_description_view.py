@@ -0,0 +1,112 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+from dob_viewer.traverser.description_view import DescriptionView
+
+
+class TestLines(object):
+    """"""
+
+    def test_empty_description(self):
+        for text in (None, ''):
+            view = DescriptionView(text)
+            assert view.line_count == 0
+            assert view.row_count == 0
+            assert view.rows(0, 10) == []
+            assert view.wrapped_text == ''
+
+    def test_line_count_like_splitlines(self):
+        for text in (
+            'one',
+            'one\ntwo',
+            'one\ntwo\n',
+            'one\n\ntwo\n\n',
+            '\n',
+            '\none',
+        ):
+            view = DescriptionView(text)
+            assert view.line_count == len(text.splitlines())
+            lines = [view.line(line_num) for line_num in range(view.line_count)]
+            assert lines == text.splitlines()
+
+    def test_crlf_is_one_line_break(self):
+        view = DescriptionView('one\r\ntwo\r\n\r\nthree')
+        assert view.line_count == 4
+        assert view.rows(0, 4) == ['one', 'two', '', 'three']
+
+    def test_other_line_breaks(self):
+        text = 'a\rb\x0bc\x0cd\x1ce\x85f g h\n'
+        view = DescriptionView(text)
+        assert view.line_count == 8
+        assert view.rows(0, 8) == text.splitlines()
+
+    def test_not_wrapped_is_description_itself(self):
+        text = 'a much longer line than the width'
+        view = DescriptionView(text)
+        assert view.wrapped_text is text
+        assert view.row_count == 1
+
+
+class TestRows(object):
+    """"""
+
+    def test_wrap_on_spaces(self):
+        view = DescriptionView('the quick brown fox', width=10)
+        assert view.rows(0, view.row_count) == ['the quick', 'brown fox']
+
+    def test_space_at_width_is_not_split_on(self):
+        # Like the old wrapper, only split on a space before the width.
+        view = DescriptionView('abc def', width=3)
+        assert view.rows(0, view.row_count) == ['abc', ' de', 'f']
+
+    def test_trailing_spaces(self):
+        view = DescriptionView(' a  ', width=3)
+        assert view.rows(0, view.row_count) == [' a', ' ']
+
+    def test_leading_space_is_not_split_on(self):
+        view = DescriptionView(' abcdef', width=4)
+        assert view.rows(0, view.row_count) == [' abc', 'def']
+
+    def test_hard_split_keeps_every_character(self):
+        view = DescriptionView('abcdefghij', width=4)
+        assert view.rows(0, view.row_count) == ['abcd', 'efgh', 'ij']
+
+    def test_row_and_rows_window(self):
+        view = DescriptionView('aa bb\ncc dd\nee', width=3)
+        assert view.line_count == 3
+        assert view.row_count == 5
+        assert view.row(0) == 'aa'
+        assert view.row(3) == 'dd'
+        assert view.rows(1, 3) == ['bb', 'cc', 'dd']
+        # Windows are clipped to the rows that exist.
+        assert view.rows(3, 10) == ['dd', 'ee']
+        assert view.rows(-1, 2) == ['aa']
+        assert view.rows(5, 1) == []
+
+    def test_wrapped_text_ends_every_row_with_newline(self):
+        view = DescriptionView('aa bb\r\ncc', width=3)
+        assert view.wrapped_text == 'aa\nbb\ncc\n'
+        # The wrapped text is cached.
+        assert view.wrapped_text is view.wrapped_text
+
+    def test_matches(self):
+        text = 'aa bb'
+        view = DescriptionView(text, width=3)
+        assert view.matches(text, 3)
+        assert not view.matches(text, 4)
+        assert not view.matches(''.join(['aa', ' bb']), 3)
+        assert DescriptionView(None).matches('')
@@ -0,0 +1,491 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+from nark.items.activity import Activity
+from nark.items.tag import Tag
+
+from dob_bright.crud.parse_input import parse_input
+
+from dob_viewer import config  # noqa: F401 (registers editor.* settings)
+from dob_viewer.traverser.edits_manager import EditsManager
+
+
+def import_facts(controller, *fact_times):
+    """Parses an import of Facts at the given (start, end) times."""
+    factoids = []
+    for idx, (start, end) in enumerate(fact_times):
+        factoids.append('{} to {}: act-{}@cat: Fact {}\n\n'.format(
+            start, end, idx % 3, idx,
+        ))
+    return parse_input(controller, file_in=io.StringIO(''.join(factoids)), progress=None)
+
+
+def hourly_times(day, hours):
+    """Returns (start, end) times for Facts from each hour until half past."""
+    return [
+        ('{} {:02d}:00'.format(day, hour), '{} {:02d}:30'.format(day, hour))
+        for hour in hours
+    ]
+
+
+def store_facts(controller, *fact_times):
+    """Saves Facts at the given (start, end) times, and returns them."""
+    saved_facts = []
+    for fact in import_facts(controller, *fact_times):
+        fact.pk = None
+        saved_facts.append(controller.facts.save(fact))
+    return saved_facts
+
+
+def stand_up_editor(controller, edit_facts):
+    edits_manager = EditsManager(controller, edit_facts=edit_facts)
+    edits_manager.stand_up()
+    return edits_manager
+
+
+def group_spans(group):
+    return [(fact.start, fact.end, fact.is_gap) for fact in group.facts]
+
+
+def assert_wired_in_order(group):
+    facts = group.facts
+    for prev_fact, next_fact in zip(facts, facts[1:]):
+        assert prev_fact.next_fact is next_fact
+        assert next_fact.prev_fact is prev_fact
+
+
+def jump_fact_dec_until(edits_manager, pk):
+    while edits_manager.curr_fact.pk != pk:
+        assert edits_manager.jump_fact_dec() is not None
+
+
+def jump_fact_inc_until(edits_manager, pk):
+    while edits_manager.curr_fact.pk != pk:
+        assert edits_manager.jump_fact_inc() is not None
+
+
+def edit_description(edits_manager, description):
+    edit_fact = edits_manager.undoable_editable_fact(what='test-edit')
+    edit_fact.description = description
+    edits_manager.apply_edits(edit_fact)
+
+
+def assert_dirty_index_agrees(facts_mgr):
+    """Checks the dirty index against a scan of the groups' Facts."""
+    dirty_facts = [fact for fact in facts_mgr.facts if fact.dirty]
+    if dirty_facts:
+        first_dirty = min(dirty_facts, key=lambda fact: fact.sorty_tuple)
+        assert facts_mgr.find_first_dirty() is first_dirty
+    else:
+        assert facts_mgr.find_first_dirty() is facts_mgr.groups[-1][-1]
+    assert len(facts_mgr.dirty_index) == len(dirty_facts)
+    for group in facts_mgr.groups:
+        group_dirty = [fact for fact in group.facts if fact.dirty]
+        first_dirty = group_dirty[0] if group_dirty else None
+        assert facts_mgr.find_first_dirty_from_group(group) is first_dirty
+
+
+class TestGapPrefill(object):
+    """Tests filling interval gaps on load (see editor.gap_prefill_threshold)."""
+
+    # ***
+
+    def test_gap_prefill_matches_lazy_gaps(self, controller_with_logging):
+        controller = controller_with_logging
+        fact_times = hourly_times('2020-01-01', range(9, 17))
+        controller.config['editor.gap_prefill_threshold'] = len(fact_times)
+        prefilled = stand_up_editor(controller, import_facts(controller, *fact_times))
+
+        controller.config['editor.gap_prefill_threshold'] = 0
+        lazy = stand_up_editor(controller, import_facts(controller, *fact_times))
+        # Walk the import, which fills the gaps one at a time.
+        final_fact = lazy.conjoined.groups[0][-1]
+        while lazy.curr_fact is not final_fact:
+            lazy.jump_fact_inc()
+
+        prefilled_group = prefilled.conjoined.groups[0]
+        lazy_group = lazy.conjoined.groups[0]
+        assert len(prefilled.conjoined.groups) == 1
+        # One gap between each pair of Facts.
+        assert len(prefilled_group) == (len(fact_times) * 2) - 1
+        assert group_spans(prefilled_group) == group_spans(lazy_group)
+        assert_wired_in_order(prefilled_group)
+        assert_wired_in_order(lazy_group)
+        # The gaps are not among the Facts the user must review.
+        assert len(prefilled.verify_fact_pks) == len(fact_times)
+
+    def test_gap_prefill_below_threshold(self, controller_with_logging):
+        controller = controller_with_logging
+        fact_times = hourly_times('2020-01-01', range(9, 17))
+        controller.config['editor.gap_prefill_threshold'] = len(fact_times) + 1
+        edits_manager = stand_up_editor(
+            controller, import_facts(controller, *fact_times),
+        )
+        group = edits_manager.conjoined.groups[0]
+        assert len(group) == len(fact_times)
+        assert not any(fact.has_next_fact for fact in group.facts)
+
+    def test_gap_prefill_disabled(self, controller_with_logging):
+        controller = controller_with_logging
+        fact_times = hourly_times('2020-01-01', range(9, 17))
+        controller.config['editor.gap_prefill_threshold'] = 0
+        edits_manager = stand_up_editor(
+            controller, import_facts(controller, *fact_times),
+        )
+        group = edits_manager.conjoined.groups[0]
+        assert len(group) == len(fact_times)
+        assert not any(fact.has_next_fact for fact in group.facts)
+
+
+class TestRiftsAndDirtyFacts(object):
+    """Tests the sorted time rifts, and the index of dirty Facts."""
+
+    # ***
+
+    def test_rift_jumps(self, controller_with_logging):
+        controller = controller_with_logging
+        saved_facts = store_facts(controller, *hourly_times('2020-01-01', range(9, 13)))
+        new_facts = import_facts(controller, *hourly_times('2020-01-03', range(9, 13)))
+        edits_manager = stand_up_editor(controller, new_facts)
+        # One rift at the first new Fact, and one at the final Fact.
+        assert list(edits_manager.conjoined.time_rifts) == [
+            new_facts[0].start, new_facts[-1].start,
+        ]
+        assert edits_manager.curr_fact is new_facts[0]
+
+        edits_manager.jump_rift_inc()
+        assert edits_manager.curr_fact is new_facts[-1]
+        edits_manager.jump_rift_dec()
+        assert edits_manager.curr_fact is new_facts[0]
+        # No rift before the new Facts, so jump to the oldest Fact.
+        edits_manager.jump_rift_dec()
+        assert edits_manager.curr_fact.pk == saved_facts[0].pk
+        edits_manager.jump_rift_inc()
+        assert edits_manager.curr_fact is new_facts[0]
+        edits_manager.jump_rift_inc()
+        assert edits_manager.curr_fact is new_facts[-1]
+
+    def test_rift_follows_edited_start(self, controller_with_logging):
+        controller = controller_with_logging
+        store_facts(controller, *hourly_times('2020-01-01', range(9, 13)))
+        new_facts = import_facts(controller, *hourly_times('2020-01-03', range(9, 13)))
+        edits_manager = stand_up_editor(controller, new_facts)
+        facts_mgr = edits_manager.conjoined
+        was_start = new_facts[0].start
+
+        edits_manager.edit_time_adjust(timedelta(minutes=-10), 'start')
+        new_start = edits_manager.curr_fact.start
+        assert new_start == was_start - timedelta(minutes=10)
+        assert list(facts_mgr.time_rifts) == [new_start, new_facts[-1].start]
+        edits_manager.jump_rift_inc()
+        edits_manager.jump_rift_dec()
+        assert edits_manager.curr_fact.start == new_start
+
+        edits_manager.undo_last_edit()
+        assert list(facts_mgr.time_rifts) == [was_start, new_facts[-1].start]
+        assert_dirty_index_agrees(facts_mgr)
+
+    def test_first_dirty_after_edit_undo_and_evict(self, controller_with_logging):
+        controller = controller_with_logging
+        saved_facts = store_facts(
+            controller, *hourly_times('2020-01-01', range(0, 24)),
+        )
+        new_facts = import_facts(controller, *hourly_times('2020-01-03', range(9, 13)))
+        edits_manager = stand_up_editor(controller, new_facts)
+        facts_mgr = edits_manager.conjoined
+        assert_dirty_index_agrees(facts_mgr)
+        assert facts_mgr.find_first_dirty() is new_facts[0]
+
+        # Back over the gap Fact, to the final saved Fact, and edit it.
+        edits_manager.jump_fact_dec(count=2)
+        assert edits_manager.curr_fact.pk == saved_facts[-1].pk
+        edit_description(edits_manager, 'Edited')
+        assert_dirty_index_agrees(facts_mgr)
+        assert facts_mgr.find_first_dirty().pk == saved_facts[-1].pk
+
+        edits_manager.undo_last_edit()
+        assert_dirty_index_agrees(facts_mgr)
+        assert facts_mgr.find_first_dirty() is new_facts[0]
+
+        edits_manager.redo_last_undo()
+        assert_dirty_index_agrees(facts_mgr)
+        assert facts_mgr.find_first_dirty().pk == saved_facts[-1].pk
+
+        # Load the rest of the saved Facts, and evict the earliest of them.
+        jump_fact_dec_until(edits_manager, saved_facts[0].pk)
+        edits_manager.jump_fact_final()
+        assert facts_mgr.evict_far_facts(8, keep_pks=edits_manager.edit_facts.keys())
+        assert saved_facts[0].pk not in facts_mgr.by_pk
+        assert_dirty_index_agrees(facts_mgr)
+        assert facts_mgr.find_first_dirty().pk == saved_facts[-1].pk
+
+
+class TestTimeJumps(object):
+    """Tests which Fact day jumps and time jumps land on."""
+
+    # ***
+
+    def store_two_days(self, controller):
+        return store_facts(
+            controller,
+            *hourly_times('2020-01-01', (9, 10, 11)),
+            *hourly_times('2020-01-02', (9, 10, 11)),
+        )
+
+    def test_day_jumps_land_on_fact_at_time(self, controller_with_logging):
+        controller = controller_with_logging
+        saved_facts = self.store_two_days(controller)
+        # Stands up on the latest Fact, 11:00 to 11:30, so jumps are from 11:15.
+        edits_manager = stand_up_editor(controller, [controller.find_latest_fact()])
+        assert edits_manager.curr_fact.pk == saved_facts[-1].pk
+        # The Fact at 11:15 the day before, not the one that ended before it.
+        edits_manager.jump_day_dec()
+        assert edits_manager.curr_fact.pk == saved_facts[2].pk
+        # And back to the same Fact.
+        edits_manager.jump_day_inc()
+        assert edits_manager.curr_fact.pk == saved_facts[-1].pk
+
+    @pytest.mark.parametrize(
+        ('index_month_first', 'window_size'),
+        [(False, 0), (False, 50), (True, 50)],
+    )
+    def test_time_jumps_same_whether_loaded_or_not(
+        self, controller_with_logging, index_month_first, window_size,
+    ):
+        controller = controller_with_logging
+        controller.config['editor.jump_window_size'] = window_size
+        saved_facts = self.store_two_days(controller)
+        jumps = [
+            # Within a Fact, either way, lands on that Fact.
+            ({'until_time': datetime(2020, 1, 1, 10, 15)}, saved_facts[1]),
+            ({'since_time': datetime(2020, 1, 1, 10, 15)}, saved_facts[1]),
+            # At the start of a Fact, either way, lands on that Fact.
+            ({'until_time': datetime(2020, 1, 1, 10, 0)}, saved_facts[1]),
+            ({'since_time': datetime(2020, 1, 1, 10, 0)}, saved_facts[1]),
+            # Between Facts, lands on the nearest in the direction of travel.
+            ({'until_time': datetime(2020, 1, 1, 10, 45)}, saved_facts[1]),
+            ({'since_time': datetime(2020, 1, 1, 10, 45)}, saved_facts[2]),
+        ]
+        for jump_kwargs, expect_fact in jumps:
+            edits_manager = stand_up_editor(controller, [controller.find_latest_fact()])
+            if index_month_first:
+                edits_manager.conjoined.index_days_around(datetime(2020, 1, 1))
+            edits_manager.jump_to_fact_nearest(**jump_kwargs)
+            assert edits_manager.curr_fact.pk == expect_fact.pk, jump_kwargs
+
+
+class TestEviction(object):
+    """Tests evicting far Facts (see editor.max_loaded_facts)."""
+
+    # ***
+
+    def test_evict_far_facts_then_reload(self, controller_with_logging):
+        controller = controller_with_logging
+        controller.config['editor.max_loaded_facts'] = 20
+        saved_facts = store_facts(
+            controller,
+            *hourly_times('2020-01-01', range(0, 24)),
+            *hourly_times('2020-01-02', range(0, 24)),
+        )
+        saved_pks = [fact.pk for fact in saved_facts]
+        edits_manager = stand_up_editor(controller, [controller.find_latest_fact()])
+        facts_mgr = edits_manager.conjoined
+
+        # Navigate far back, to the first Fact, and index its month.
+        jump_fact_dec_until(edits_manager, saved_pks[0])
+        facts_mgr.index_days_around(saved_facts[0].start)
+        assert (2020, 1) in facts_mgr.day_index_months
+
+        # Edit one Fact (so it's dirty), and edit the next one and undo
+        # that (so it's clean, but pinned by the redo stack).
+        dirty_pk, undone_pk = saved_pks[30], saved_pks[31]
+        jump_fact_inc_until(edits_manager, dirty_pk)
+        edit_description(edits_manager, 'Edited')
+        jump_fact_inc_until(edits_manager, undone_pk)
+        edit_description(edits_manager, 'Undone')
+        edits_manager.undo_last_edit()
+        assert not facts_mgr.by_pk[undone_pk].dirty
+        jump_fact_dec_until(edits_manager, saved_pks[0])
+        loaded_count = len(facts_mgr.by_pk)
+
+        evicted_count = edits_manager.evict_far_facts()
+        assert evicted_count > 0
+        assert len(facts_mgr.by_pk) == loaded_count - evicted_count
+        # Only those Facts beyond the ones we must keep are evicted.
+        assert facts_mgr.by_pk[dirty_pk].dirty
+        assert undone_pk in facts_mgr.by_pk
+        assert saved_pks[-1] not in facts_mgr.by_pk
+        # And the group gives up the time the evicted Facts claimed.
+        assert facts_mgr.curr_group[-1].pk == undone_pk
+        assert facts_mgr.curr_group.time_until == facts_mgr.by_pk[undone_pk].end
+        assert edits_manager.curr_fact.pk == saved_pks[0]
+        assert facts_mgr.curr_group[facts_mgr.curr_index] is edits_manager.curr_fact
+        # The month is no longer wholly loaded.
+        assert (2020, 1) not in facts_mgr.day_index_months
+
+        # Navigate forward again, which reloads the evicted Facts, in order.
+        visited_pks = [edits_manager.curr_fact.pk]
+        while edits_manager.curr_fact.pk != saved_pks[-1]:
+            assert edits_manager.jump_fact_inc() is not None
+            if not edits_manager.curr_fact.is_gap:
+                visited_pks.append(edits_manager.curr_fact.pk)
+        assert visited_pks == saved_pks
+        assert facts_mgr.by_pk[dirty_pk].dirty
+        for group in facts_mgr.groups:
+            assert_wired_in_order(group)
+        for prev_group, next_group in zip(facts_mgr.groups, facts_mgr.groups[1:]):
+            assert prev_group.time_until <= next_group.time_since
+
+
+class TestFactStream(object):
+    """Tests how far each jump reads a stream of Facts being imported."""
+
+    # ***
+
+    def test_jumps_back_read_stream_only_as_far_as_needed(
+        self, controller_with_logging,
+    ):
+        controller = controller_with_logging
+        controller.config['editor.stream_batch_size'] = 4
+        saved_facts = store_facts(controller, *hourly_times('2020-01-30', range(9, 13)))
+        new_facts = import_facts(
+            controller,
+            *hourly_times('2020-01-31', range(9, 13)),
+            *hourly_times('2020-02-01', range(9, 13)),
+            *hourly_times('2020-02-02', range(9, 13)),
+        )
+        edits_manager = stand_up_editor(controller, iter(new_facts))
+        assert edits_manager.streamed_count == 4
+        assert edits_manager.curr_fact is new_facts[0]
+
+        # A day back indexes January, so reads the stream into February.
+        edits_manager.jump_day_dec()
+        assert edits_manager.curr_fact.pk == saved_facts[0].pk
+        assert edits_manager.streaming
+        assert edits_manager.streamed_count == 8
+        # Jumps back from there do not read any more of the stream.
+        edits_manager.jump_to_fact_nearest(until_time=datetime(2020, 1, 31, 10, 15))
+        assert edits_manager.curr_fact is new_facts[1]
+        edits_manager.jump_fact_first()
+        edits_manager.jump_rift_dec()
+        assert edits_manager.streamed_count == 8
+
+        # But jumping to the final Fact reads the rest.
+        edits_manager.jump_fact_final()
+        assert not edits_manager.streaming
+        # (It lands on the gap Fact that follows the final new Fact.)
+        assert edits_manager.curr_fact.prev_fact is new_facts[-1]
+        assert len(edits_manager.verify_fact_pks) == len(new_facts)
+
+    def test_day_jump_back_to_month_end_prefetches_after_stream(
+        self, controller_with_logging,
+    ):
+        controller = controller_with_logging
+        controller.config['editor.stream_batch_size'] = 4
+        saved_facts = store_facts(
+            controller,
+            *hourly_times('2020-01-31', range(9, 13)),
+            *hourly_times('2020-02-03', range(9, 13)),
+        )
+        new_facts = import_facts(
+            controller,
+            *hourly_times('2020-02-01', range(9, 13)),
+            *hourly_times('2020-02-02', range(9, 13)),
+            *hourly_times('2020-02-04', range(9, 13)),
+        )
+        edits_manager = stand_up_editor(controller, iter(new_facts))
+        facts_mgr = edits_manager.conjoined
+
+        # Back a day, to the last day of January, which reads none of the
+        # stream past the first day of February.
+        edits_manager.jump_day_dec()
+        assert edits_manager.curr_fact.pk == saved_facts[0].pk
+        assert edits_manager.streamed_count == 4
+        # The day after is in February, which the stream has not reached, so
+        # do not load the store's February Facts until the stream is read.
+        edits_manager.prefetch_day_index(days=1)
+        assert (2020, 2) not in facts_mgr.day_index_months
+        assert saved_facts[-1].pk not in facts_mgr.by_pk
+
+        # Otherwise, the rest of the stream would extend the import's group
+        # over the store Facts on February 3rd.
+        edits_manager.drain_fact_stream()
+        for prev_group, next_group in zip(facts_mgr.groups, facts_mgr.groups[1:]):
+            assert prev_group.time_until <= next_group.time_since
+
+
+class TestInterning(object):
+    """Tests sharing the Activity, Category and Tag objects between Facts."""
+
+    # ***
+
+    def test_store_facts_share_items(self, controller_with_logging):
+        controller = controller_with_logging
+        factoids = (
+            '2020-01-01 09:00 to 2020-01-01 09:30: act@cat: #foo #bar: Fact 1\n\n'
+            '2020-01-01 11:00 to 2020-01-01 11:30: act@cat: #foo #bar: Fact 2\n\n'
+        )
+        saved_facts = []
+        new_facts = parse_input(controller, file_in=io.StringIO(factoids), progress=None)
+        for fact in new_facts:
+            fact.pk = None
+            saved_facts.append(controller.facts.save(fact))
+        # Each store query makes its own copies of the items.
+        # (lb): Use get, because get_all reads the tags without their PKs.
+        first_fact = controller.facts.get(saved_facts[0].pk)
+        final_fact = controller.facts.get(saved_facts[-1].pk)
+        assert first_fact.activity is not final_fact.activity
+        assert all(tag.pk is not None for tag in first_fact.tags + final_fact.tags)
+
+        edits_manager = stand_up_editor(controller, [final_fact])
+        facts_mgr = edits_manager.conjoined
+        final_fact = edits_manager.curr_fact
+        # Jumping back across the gap fetches the first Fact with a new query.
+        jump_fact_dec_until(edits_manager, saved_facts[0].pk)
+        first_fact = edits_manager.curr_fact
+        assert first_fact.activity is final_fact.activity
+        assert first_fact.activity.category is final_fact.activity.category
+        final_tags = {tag.pk: tag for tag in final_fact.tags}
+        assert len(first_fact.tags) == len(final_tags) == 2
+        for first_tag in first_fact.tags:
+            assert first_tag is final_tags[first_tag.pk]
+        # One activity, one category and two tags.
+        assert len(facts_mgr.interner) == 4
+
+    def test_unsaved_items_not_interned(self, controller_with_logging):
+        controller = controller_with_logging
+        store_facts(controller, *hourly_times('2020-01-01', range(9, 11)))
+        edits_manager = stand_up_editor(controller, [controller.find_latest_fact()])
+        interner = edits_manager.conjoined.interner
+        stored_fact = edits_manager.curr_fact
+        items_count = len(interner)
+
+        new_fact = stored_fact.copy()
+        new_fact.activity = Activity(
+            stored_fact.activity.name, category=stored_fact.activity.category,
+        )
+        new_fact.tags = [Tag('new-tag')]
+        new_activity, new_tag = new_fact.activity, new_fact.tags[0]
+        interner.intern_fact(new_fact)
+        assert new_fact.activity is new_activity
+        assert new_fact.tags[0] is new_tag
+        assert len(interner) == items_count
@@ -0,0 +1,67 @@
+# This file exists within 'dob-viewer':
+#
+#   https://github.com/tallybark/dob-viewer
+#
+# Copyright © 2019-2020 Landon Bouma. All rights reserved.
+#
+# This program is free software:  you can redistribute it  and/or  modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3  of the License,  or  (at your option)  any later version  (GPLv3+).
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY;  without even the implied warranty of MERCHANTABILITY or  FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU  General  Public  License  for  more  details.
+#
+# If you lost the GNU General Public License that ships with this software
+# repository (read the 'LICENSE' file), see <http://www.gnu.org/licenses/>.
+
+"""Import-time regression tests."""
+
+import subprocess
+import sys
+
+
+ENTRY_POINTS = (
+    'dob_viewer',
+    'dob_viewer.config',
+    'dob_viewer.traverser.save_confirmer',
+    'dob_viewer.ptkui.re_confirm',
+)
+"""The modules that dob imports whether or not the editor is opened."""
+
+LAZY_MODULES = (
+    'dob_prompt',
+    'prompt_toolkit',
+    'pygments',
+    'sortedcontainers',
+)
+"""Heavy modules that should only load once the Carousel runs."""
+
+
+def import_entry_points(*args):
+    """Imports the ENTRY_POINTS in a fresh interpreter, which lists sys.modules."""
+    script = 'import {}; import sys; print(" ".join(sorted(sys.modules)))'.format(
+        ', '.join(ENTRY_POINTS),
+    )
+    completed = subprocess.run(
+        [sys.executable, *args, '-c', script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return completed
+
+
+class TestImportTime(object):
+    """Cold import tests, each run in a fresh interpreter.
+
+    The import time budget, which depends on the host, is benchmarked
+    separately, in tests/benchmarks/test_import_time_bench.py.
+    """
+
+    def test_heavy_modules_not_imported(self):
+        completed = import_entry_points()
+        loaded = set(completed.stdout.split())
+        for module in LAZY_MODULES:
+            assert module not in loaded